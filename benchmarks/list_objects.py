@@ -0,0 +1,110 @@
+"""
+Compares parsing of a ListObjectsV2 page with `parse_list_objects`
+(the whole body is parsed at once), with `ListObjectsParser` fed
+by chunks of the body as they're received and with
+`ListObjectsColumnsParser`, which keeps objects in `ObjectColumns`.
+"retained" is the memory taken by the parsed objects:
+
+    $ poetry run python benchmarks/list_objects.py
+"""
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Sequence, Tuple
+
+from httpx_s3_client._xml import (
+    AwsObjectMeta, ListObjectsParser, parse_list_objects,
+)
+from httpx_s3_client.columns import ListObjectsColumnsParser, ObjectColumns
+
+
+NUMBER = 20
+KEYS_COUNT = 1000
+CHUNK_SIZE = 2 ** 16
+
+
+def make_payload(count: int) -> bytes:
+    started = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    contents = "".join(
+        "<Contents>"
+        f"<Key>some/long/prefix/of/the/key/{i:08d}.json</Key>"
+        "<LastModified>"
+        f"{(started + timedelta(seconds=i)).isoformat()[:19]}.000Z"
+        "</LastModified>"
+        f"<ETag>&quot;{i:032x}&quot;</ETag>"
+        f"<Size>{i * 1024}</Size>"
+        "<StorageClass>STANDARD</StorageClass>"
+        "</Contents>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        "<Name>bucket</Name><Prefix>some/</Prefix>"
+        f"<KeyCount>{count}</KeyCount><MaxKeys>{count}</MaxKeys>"
+        f"<IsTruncated>true</IsTruncated>{contents}"
+        "<NextContinuationToken>token</NextContinuationToken>"
+        "</ListBucketResult>"
+    ).encode()
+
+
+def parse_whole(payload: bytes) -> Sequence[AwsObjectMeta]:
+    objects, _ = parse_list_objects(payload)
+    return objects
+
+
+def parse_streaming(payload: bytes) -> Sequence[AwsObjectMeta]:
+    parser = ListObjectsParser()
+    objects = []
+    for offset in range(0, len(payload), CHUNK_SIZE):
+        chunk = payload[offset:offset + CHUNK_SIZE]
+        objects.extend(parser.feed(chunk).objects)
+    objects.extend(parser.close().objects)
+    return objects
+
+
+def parse_columns(payload: bytes) -> Sequence[AwsObjectMeta]:
+    parser = ListObjectsColumnsParser()
+    columns = ObjectColumns()
+    for offset in range(0, len(payload), CHUNK_SIZE):
+        chunk = payload[offset:offset + CHUNK_SIZE]
+        columns.extend(parser.feed(chunk).objects)
+    columns.extend(parser.close().objects)
+    return columns
+
+
+def measure_memory(
+    func: Callable[[bytes], Sequence[AwsObjectMeta]], payload: bytes,
+) -> Tuple[int, int]:
+    """ Returns memory retained by the result and the peak memory """
+    tracemalloc.start()
+    result = func(payload)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main() -> None:
+    payload = make_payload(KEYS_COUNT)
+    print(f"Page of {KEYS_COUNT} keys, {len(payload)} bytes")
+
+    for name, func in (
+        ("parse_list_objects", parse_whole),
+        ("ListObjectsParser", parse_streaming),
+        ("ListObjectsColumnsParser", parse_columns),
+    ):
+        assert len(func(payload)) == KEYS_COUNT
+        best = min(
+            timeit.repeat(lambda: func(payload), number=NUMBER, repeat=5),
+        )
+        retained, peak = measure_memory(func, payload)
+        print(
+            f"{name:<25} {best / NUMBER * 1e3:8.2f} ms/page "
+            f"{retained / 1024:10.1f} KiB retained "
+            f"{peak / 1024:10.1f} KiB peak",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares the request signing cost of `aws_request_signer.AwsRequestSigner`
+with `httpx_s3_client.signer.RequestSigner`:
+
+    $ poetry run python benchmarks/signer.py
+"""
+import timeit
+
+from aws_request_signer import UNSIGNED_PAYLOAD, AwsRequestSigner
+from httpx import URL
+
+from httpx_s3_client.signer import RequestSigner
+
+
+NUMBER = 20000
+KWARGS = dict(
+    region="us-east-1",
+    access_key_id="key",
+    secret_access_key="hack-me",
+    service="s3",
+)
+HEADERS = {"Content-Type": "application/octet-stream"}
+URL_STR = "http://localhost:9090/test/some/key?partNumber=1&uploadId=abc"
+
+
+def main() -> None:
+    reference = AwsRequestSigner(**KWARGS)
+    signer = RequestSigner(**KWARGS)
+    url = URL(URL_STR)
+
+    cases = {
+        "AwsRequestSigner.sign_with_headers(str)": lambda: (
+            reference.sign_with_headers(
+                "PUT", str(url), headers=HEADERS,
+                content_hash=UNSIGNED_PAYLOAD,
+            )
+        ),
+        "RequestSigner.sign_with_headers(str)": lambda: (
+            signer.sign_with_headers(
+                "PUT", URL_STR, headers=HEADERS,
+                content_hash=UNSIGNED_PAYLOAD,
+            )
+        ),
+        "RequestSigner.sign_url(URL)": lambda: (
+            signer.sign_url(
+                "PUT", url, headers=HEADERS, content_hash=UNSIGNED_PAYLOAD,
+            )
+        ),
+    }
+
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:<45} {best / NUMBER * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 from .client import S3Client
 from .version import __version__, version_info
-from ._xml import AwsObjectMeta
+from ._xml import AwsDeleteError, AwsObjectMeta
+from .columns import ObjectColumns
+from .inventory import Inventory
 
 
 __all__ = (
     "__version__",
     "version_info",
+    "AwsDeleteError",
     "AwsObjectMeta",
+    "Inventory",
+    "ObjectColumns",
     "S3Client",
 )
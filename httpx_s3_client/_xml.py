@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from sys import intern
-from typing import List, NamedTuple, Optional, Tuple
+from typing import (
+    Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+    cast,
+)
 from xml.etree import ElementTree as ET
 
 NS = "http://s3.amazonaws.com/doc/2006-03-01/"
@@ -14,6 +17,17 @@ class AwsObjectMeta(NamedTuple):
     storage_class: str
 
 
+class ListObjectsPage(NamedTuple):
+    objects: Sequence[AwsObjectMeta]
+    common_prefixes: List[str]
+
+
+class AwsDeleteError(NamedTuple):
+    key: str
+    code: str
+    message: str
+
+
 def parse_create_multipart_upload_id(payload: bytes) -> str:
     root = ET.fromstring(payload)
     uploadid_el = root.find(f"{{{NS}}}UploadId")
@@ -24,6 +38,24 @@ def parse_create_multipart_upload_id(payload: bytes) -> str:
     return uploadid_el.text
 
 
+def parse_copy_etag(payload: bytes) -> str:
+    """
+    Returns ETag of `CopyObjectResult` or `CopyPartResult`. S3 may reply
+    with an error in the body of a successful response, ValueError is
+    raised in this case.
+    """
+    try:
+        root = ET.fromstring(payload)
+    except ET.ParseError as e:
+        raise ValueError(f"Broken copy result {payload!r}") from e
+    etag_el = root.find(f"{{{NS}}}ETag")
+    if etag_el is None:
+        etag_el = root.find("ETag")
+    if etag_el is None or etag_el.text is None:
+        raise ValueError(f"ETag not found in {payload!r}")
+    return etag_el.text.strip('"')
+
+
 def create_complete_upload_request(parts: List[Tuple[int, str]]) -> bytes:
     ET.register_namespace("", NS)
     root = ET.Element(f"{{{NS}}}CompleteMultipartUpload")
@@ -41,40 +73,201 @@ def create_complete_upload_request(parts: List[Tuple[int, str]]) -> bytes:
     )
 
 
+def parse_object_fields(
+    el: ET.Element,
+) -> Optional[Tuple[str, str, str, int, str]]:
+    """
+    Returns ETag, key, LastModified (as is), size and storage class
+    of `Contents` element or None if some of them are missing
+    """
+    etag = key = last_modified = size = storage_class = None
+    for child in el:
+        tag = child.tag[child.tag.rfind("}") + 1:]
+        text = child.text
+        if text is None:
+            continue
+        if tag == "ETag":
+            etag = text
+        elif tag == "Key":
+            key = text
+        elif tag == "LastModified":
+            assert text[-1] == "Z"
+            last_modified = text
+        elif tag == "Size":
+            size = int(text)
+        elif tag == "StorageClass":
+            storage_class = intern(text)
+    if (
+        etag and
+        key and
+        last_modified and
+        size is not None and
+        storage_class
+    ):
+        return etag, key, last_modified, size, storage_class
+    return None
+
+
+def parse_last_modified(text: str) -> datetime:
+    return datetime.fromisoformat(text[:-1]).replace(tzinfo=timezone.utc)
+
+
+def parse_object_meta(el: ET.Element) -> Optional[AwsObjectMeta]:
+    fields = parse_object_fields(el)
+    if fields is None:
+        return None
+    etag, key, last_modified, size, storage_class = fields
+    return AwsObjectMeta(
+        etag, key, parse_last_modified(last_modified), size, storage_class,
+    )
+
+
 def parse_list_objects(payload: bytes) -> Tuple[
     List[AwsObjectMeta], Optional[str],
 ]:
     root = ET.fromstring(payload)
     result = []
     for el in root.findall(f"{{{NS}}}Contents"):
-        etag = key = last_modified = size = storage_class = None
-        for child in el:
-            tag = child.tag[child.tag.rfind("}") + 1:]
-            text = child.text
-            if text is None:
-                continue
-            if tag == "ETag":
-                etag = text
-            elif tag == "Key":
-                key = text
-            elif tag == "LastModified":
-                assert text[-1] == "Z"
-                last_modified = datetime.fromisoformat(text[:-1]).replace(
-                    tzinfo=timezone.utc,
-                )
-            elif tag == "Size":
-                size = int(text)
-            elif tag == "StorageClass":
-                storage_class = intern(text)
-        if (
-            etag and
-            key and
-            last_modified and
-            size is not None and
-            storage_class
-        ):
-            meta = AwsObjectMeta(etag, key, last_modified, size, storage_class)
+        meta = parse_object_meta(el)
+        if meta is not None:
             result.append(meta)
     nct_el = root.find(f"{{{NS}}}NextContinuationToken")
     continuation_token = nct_el.text if nct_el is not None else None
     return result, continuation_token
+
+
+class ListObjectsParser:
+    """
+    Incremental parser of ListObjectsV2 response. Each chunk of the body
+    passed to `feed` returns objects and common prefixes which are parsed
+    so far. Parsed elements are cleared, so only empty elements are kept
+    attached to the root until the end of the page instead of the parsed
+    page. The continuation token is available after the body is parsed.
+    """
+
+    CONTENTS = f"{{{NS}}}Contents"
+    COMMON_PREFIXES = f"{{{NS}}}CommonPrefixes"
+    PREFIX = f"{{{NS}}}Prefix"
+    NEXT_CONTINUATION_TOKEN = f"{{{NS}}}NextContinuationToken"
+
+    def __init__(self) -> None:
+        self._parser: ET.XMLPullParser = ET.XMLPullParser(events=("end",))
+        self.continuation_token: Optional[str] = None
+
+    def feed(self, data: bytes) -> ListObjectsPage:
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> ListObjectsPage:
+        self._parser.close()
+        return self._read_events()
+
+    def _parse_contents(
+        self, contents: List[ET.Element],
+    ) -> Sequence[AwsObjectMeta]:
+        result = []
+        for el in contents:
+            meta = parse_object_meta(el)
+            if meta is not None:
+                result.append(meta)
+        return result
+
+    def _read_events(self) -> ListObjectsPage:
+        contents = []
+        common_prefixes = []
+        events = cast(
+            Iterator[Tuple[str, ET.Element]], self._parser.read_events(),
+        )
+        for _, el in events:
+            tag = el.tag
+            if tag == self.CONTENTS:
+                contents.append(el)
+            elif tag == self.COMMON_PREFIXES:
+                prefix_el = el.find(self.PREFIX)
+                if prefix_el is not None and prefix_el.text:
+                    common_prefixes.append(prefix_el.text)
+                el.clear()
+            elif tag == self.NEXT_CONTINUATION_TOKEN:
+                self.continuation_token = el.text
+
+        objects = self._parse_contents(contents)
+        for el in contents:
+            el.clear()
+        return ListObjectsPage(objects, common_prefixes)
+
+
+def parse_list_parts(payload: bytes) -> Tuple[Dict[int, str], Optional[int]]:
+    """
+    Parses ListParts response. Returns mapping of part numbers to etags
+    and the next part number marker if the response is truncated.
+    """
+    root = ET.fromstring(payload)
+    parts = {}
+    is_truncated = False
+    next_marker = None
+    for el in root:
+        tag = el.tag[el.tag.rfind("}") + 1:]
+        if tag == "IsTruncated":
+            is_truncated = el.text == "true"
+        elif tag == "NextPartNumberMarker" and el.text:
+            next_marker = int(el.text)
+        elif tag == "Part":
+            part_no = etag = None
+            for child in el:
+                child_tag = child.tag[child.tag.rfind("}") + 1:]
+                if child_tag == "PartNumber" and child.text:
+                    part_no = int(child.text)
+                elif child_tag == "ETag" and child.text:
+                    etag = child.text.strip('"')
+            if part_no is not None and etag:
+                parts[part_no] = etag
+    return parts, next_marker if is_truncated else None
+
+
+def create_delete_objects_request(
+    keys: Iterable[str], quiet: bool = True,
+) -> bytes:
+    ET.register_namespace("", NS)
+    root = ET.Element(f"{{{NS}}}Delete")
+
+    quiet_el = ET.SubElement(root, "Quiet")
+    quiet_el.text = "true" if quiet else "false"
+    for key in keys:
+        object_el = ET.SubElement(root, "Object")
+        key_el = ET.SubElement(object_el, "Key")
+        key_el.text = key
+
+    return (
+        b'<?xml version="1.0" encoding="UTF-8"?>' +
+        ET.tostring(root, encoding="UTF-8")
+    )
+
+
+def parse_delete_objects(payload: bytes) -> Tuple[
+    List[str], List[AwsDeleteError],
+]:
+    """
+    Parses DeleteObjects response. Returns deleted keys (which are
+    omitted in the quiet mode) and errors of keys which weren't deleted.
+    """
+    root = ET.fromstring(payload)
+    deleted = []
+    errors = []
+    for el in root:
+        tag = el.tag[el.tag.rfind("}") + 1:]
+        if tag not in ("Deleted", "Error"):
+            continue
+        fields = {}
+        for child in el:
+            fields[child.tag[child.tag.rfind("}") + 1:]] = child.text or ""
+        if tag == "Deleted":
+            deleted.append(fields.get("Key", ""))
+        else:
+            errors.append(
+                AwsDeleteError(
+                    fields.get("Key", ""),
+                    fields.get("Code", ""),
+                    fields.get("Message", ""),
+                ),
+            )
+    return deleted, errors
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Optional, Tuple
+
+
+log = logging.getLogger(__name__)
+
+
+class MemoryBudget:
+    """
+    Semaphore denominated in bytes which bounds the payload buffered by
+    all transfers of a client. Reservations are granted in the order of
+    requests, so a large part isn't starved by small ranges. A request
+    larger than `limit` waits until the whole budget is free.
+
+    `peak` is the maximal count of reserved bytes and `waits` is the count
+    of reservations which waited for the budget.
+    """
+
+    def __init__(self, limit: int):
+        """
+        limit: maximal count of bytes reserved at once
+        """
+        if limit < 1:
+            raise ValueError(f"Limit should be > 0. Got {limit}")
+        self.limit = limit
+        self.used = 0
+        self.peak = 0
+        self.waits = 0
+        self._waiters: Deque[Tuple[int, asyncio.Future]] = deque()
+
+    def _clamp(self, size: int) -> int:
+        return min(size, self.limit)
+
+    def _grant(self, size: int) -> None:
+        self.used += size
+        self.peak = max(self.peak, self.used)
+
+    def _wake(self) -> None:
+        while self._waiters:
+            size, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.used + size > self.limit:
+                return
+            self._waiters.popleft()
+            self._grant(size)
+            waiter.set_result(None)
+
+    async def acquire(self, size: int) -> None:
+        size = self._clamp(size)
+        if not self._waiters and self.used + size <= self.limit:
+            self._grant(size)
+            return
+
+        self.waits += 1
+        log.debug(
+            "Waiting for %d bytes of the memory budget, %d of %d are used",
+            size, self.used, self.limit,
+        )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((size, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The budget was granted right before the cancellation
+                self.release(size)
+            else:
+                self._wake()
+            raise
+
+    def release(self, size: int) -> None:
+        self.used -= self._clamp(size)
+        self._wake()
+
+    @property
+    def available(self) -> int:
+        return self.limit - self.used
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.limit}, used={self.used}, "
+            f"peak={self.peak}, waits={self.waits})"
+        )
+
+
+@asynccontextmanager
+async def reserve(
+    budget: Optional[MemoryBudget], size: int,
+) -> AsyncIterator[None]:
+    """ Reserves `size` bytes of `budget` if it's passed """
+    if budget is None:
+        yield
+        return
+    await budget.acquire(size)
+    try:
+        yield
+    finally:
+        budget.release(size)
+
+
+__all__ = (
+    "MemoryBudget",
+    "reserve",
+)
@@ -0,0 +1,426 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import monotonic
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from aiomisc import threaded
+from httpx import Headers, Request, Response
+
+
+log = logging.getLogger(__name__)
+
+
+class CachedMetadata(NamedTuple):
+    etag: str
+    size: int
+    headers: Headers
+    request: Request
+    expires_at: float
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (monotonic() if now is None else now) < self.expires_at
+
+    def response(self) -> Response:
+        """ Returns a response like the cached response of HEAD request """
+        return Response(200, headers=self.headers, request=self.request)
+
+
+class MetadataCache:
+    """
+    LRU cache of responses of HEAD requests keyed by the object path.
+    Entries are fresh for `ttl` seconds, expired entries are revalidated
+    with `If-None-Match` and a `304 Not Modified` response makes them
+    fresh again. `S3Client` invalidates entries of objects which it puts
+    or deletes, changes made by other clients are noticed after `ttl`.
+    """
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 60.0):
+        """
+        max_size: maximal count of cached entries
+        ttl: time in seconds while entries are used without revalidation
+        """
+        if max_size < 1:
+            raise ValueError(f"Max size should be > 0. Got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CachedMetadata]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedMetadata]:
+        """ Returns the entry, which may be expired, or None """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.is_fresh():
+            self.hits += 1
+        return entry
+
+    def store(self, key: str, response: Response) -> CachedMetadata:
+        """ Stores the successful response of HEAD request """
+        entry = CachedMetadata(
+            etag=response.headers["ETag"],
+            size=int(response.headers.get("Content-Length", 0)),
+            headers=response.headers,
+            request=response.request,
+            expires_at=monotonic() + self.ttl,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def revalidate(self, key: str, entry: CachedMetadata) -> CachedMetadata:
+        """ Makes the entry fresh after `304 Not Modified` response """
+        self.revalidations += 1
+        entry = entry._replace(expires_at=monotonic() + self.ttl)
+        if key in self._entries:
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            log.debug("Metadata of %s is invalidated", key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(size={len(self)}, hits={self.hits}, "
+            f"misses={self.misses}, revalidations={self.revalidations}, "
+            f"evictions={self.evictions})"
+        )
+
+
+# Headers which don't describe the decoded content kept by the cache
+SKIPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class CachedContent(NamedTuple):
+    etag: str
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+
+class _DiskEntry(NamedTuple):
+    etag: str
+    headers: List[Tuple[str, str]]
+    size: int
+    path: Path
+
+
+class ContentCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    memory_count: int
+    memory_size: int
+    disk_count: int
+    disk_size: int
+
+
+def content_headers(
+    headers: Headers, size: int,
+) -> List[Tuple[str, str]]:
+    result = [
+        (name.decode("latin-1"), value.decode("latin-1"))
+        for name, value in headers.raw
+        if name.lower().decode("latin-1") not in SKIPPED_HEADERS
+    ]
+    result.append(("Content-Length", str(size)))
+    return result
+
+
+@threaded
+def write_atomic(directory: Path, path: Path, content: bytes) -> None:
+    with NamedTemporaryFile(dir=directory, delete=False) as fp:
+        fp.write(content)
+    os.replace(fp.name, path)
+
+
+@threaded
+def copy_atomic(directory: Path, source: Path, path: Path) -> None:
+    with NamedTemporaryFile(dir=directory, delete=False) as fp:
+        with source.open("rb") as src:
+            shutil.copyfileobj(src, fp)
+    os.replace(fp.name, path)
+
+
+@threaded
+def read_file(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+@threaded
+def copy_file(source: Path, path: Path) -> None:
+    shutil.copyfile(source, path)
+
+
+class ContentCache:
+    """
+    Read-through cache of object bodies keyed by the object path and
+    the ETag. Bodies up to `max_memory_item_size` are kept in the memory
+    LRU of `memory_size` bytes, larger ones are kept in files in
+    `directory` up to `disk_size` bytes in total. The disk tier survives
+    restarts: it's loaded from `directory` on start.
+
+    `S3Client` revalidates cached bodies with `If-None-Match`, so a hit
+    costs a `304 Not Modified` response instead of the body.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        *,
+        memory_size: int = 64 * 1024 * 1024,
+        max_memory_item_size: int = 1024 * 1024,
+        disk_size: int = 1024 * 1024 * 1024,
+    ):
+        """
+        directory: directory of the disk tier, large bodies aren't cached
+            if it's None
+        memory_size: maximal size of bodies in memory in bytes
+        max_memory_item_size: maximal size of a body which is kept
+            in memory, larger bodies are kept on disk
+        disk_size: maximal size of bodies on disk in bytes
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.memory_size = memory_size
+        self.max_memory_item_size = min(max_memory_item_size, memory_size)
+        self.disk_size = disk_size
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory: "OrderedDict[str, CachedContent]" = OrderedDict()
+        self._memory_used = 0
+        self._disk: "OrderedDict[str, _DiskEntry]" = OrderedDict()
+        self._disk_used = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_disk()
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / hashlib.sha256(key.encode()).hexdigest()
+
+    def _load_disk(self) -> None:
+        assert self.directory is not None
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            path = meta_path.with_suffix("")
+            try:
+                with meta_path.open("r") as fp:
+                    meta = json.load(fp)
+                stat = path.stat()
+                entry = _DiskEntry(
+                    meta["etag"],
+                    [(name, value) for name, value in meta["headers"]],
+                    stat.st_size,
+                    path,
+                )
+                entries.append((stat.st_mtime, meta["key"], entry))
+            except (OSError, KeyError, TypeError, ValueError):
+                log.warning("Removing broken cache entry %s", path)
+                self._unlink(path)
+        for _, key, entry in sorted(entries, key=lambda item: item[0]):
+            self._disk[key] = entry
+            self._disk_used += entry.size
+        self._evict_disk()
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        for item in (path, path.with_suffix(".json")):
+            try:
+                item.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict_memory(self) -> None:
+        while self._memory and self._memory_used > self.memory_size:
+            _, entry = self._memory.popitem(last=False)
+            self._memory_used -= len(entry.content)
+            self.evictions += 1
+
+    def _evict_disk(self) -> None:
+        while self._disk and self._disk_used > self.disk_size:
+            _, entry = self._disk.popitem(last=False)
+            self._disk_used -= entry.size
+            self._unlink(entry.path)
+            self.evictions += 1
+
+    def etag(self, key: str) -> Optional[str]:
+        """ Returns the ETag of the cached body of `key` """
+        entry = self._memory.get(key) or self._disk.get(key)
+        return entry.etag if entry is not None else None
+
+    async def get(self, key: str, etag: str) -> Optional[CachedContent]:
+        """ Returns the cached body of `key` if its ETag is `etag` """
+        entry = self._memory.get(key)
+        if entry is not None and entry.etag == etag:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        disk_entry = self._disk.get(key)
+        if disk_entry is None or disk_entry.etag != etag:
+            return None
+        self._disk.move_to_end(key)
+        try:
+            content = await read_file(disk_entry.path)
+        except FileNotFoundError:
+            # Evicted while reading
+            return None
+        self.hits += 1
+        return CachedContent(etag, disk_entry.headers, content)
+
+    async def copy_to(self, key: str, etag: str, path: Path) -> bool:
+        """
+        Writes the cached body of `key` to `path` if its ETag is `etag`.
+        Returns False if there is no such body.
+        """
+        entry = self._memory.get(key)
+        if entry is not None and entry.etag == etag:
+            self._memory.move_to_end(key)
+            await write_atomic(path.parent, path, entry.content)
+            self.hits += 1
+            return True
+
+        disk_entry = self._disk.get(key)
+        if disk_entry is None or disk_entry.etag != etag:
+            return False
+        self._disk.move_to_end(key)
+        try:
+            await copy_file(disk_entry.path, path)
+        except FileNotFoundError:
+            return False
+        self.hits += 1
+        return True
+
+    def _save_disk_meta(
+        self, key: str, etag: str, headers: List[Tuple[str, str]],
+        path: Path,
+    ) -> None:
+        with path.with_suffix(".json").open("w") as fp:
+            json.dump({"key": key, "etag": etag, "headers": headers}, fp)
+
+    def _store_memory(
+        self, key: str, etag: str, headers: List[Tuple[str, str]],
+        content: bytes,
+    ) -> None:
+        # The entry of a concurrent store of the key is replaced
+        replaced = self._memory.pop(key, None)
+        if replaced is not None:
+            self._memory_used -= len(replaced.content)
+        self._memory[key] = CachedContent(etag, headers, content)
+        self._memory_used += len(content)
+        self._evict_memory()
+
+    def _add_disk(
+        self, key: str, etag: str, headers: List[Tuple[str, str]],
+        size: int, path: Path,
+    ) -> None:
+        self._save_disk_meta(key, etag, headers, path)
+        # The file of a concurrent store of the key is already replaced
+        replaced = self._disk.pop(key, None)
+        if replaced is not None:
+            self._disk_used -= replaced.size
+        self._disk[key] = _DiskEntry(etag, headers, size, path)
+        self._disk_used += size
+        self._evict_disk()
+
+    def _fits_disk(self, size: int) -> bool:
+        return self.directory is not None and size <= self.disk_size
+
+    async def store(self, key: str, response: Response) -> None:
+        """ Stores the body of successful GET response """
+        self.misses += 1
+        etag = response.headers.get("ETag")
+        if etag is None:
+            return
+        content = response.content
+        self.invalidate(key)
+        headers = content_headers(response.headers, len(content))
+        if len(content) <= self.max_memory_item_size:
+            self._store_memory(key, etag, headers, content)
+        elif self._fits_disk(len(content)):
+            assert self.directory is not None
+            path = self._disk_path(key)
+            await write_atomic(self.directory, path, content)
+            self._add_disk(key, etag, headers, len(content), path)
+
+    async def store_file(
+        self, key: str, etag: str, source: Path, headers: Headers,
+    ) -> None:
+        """ Stores the downloaded body of `key` from `source` file """
+        self.misses += 1
+        size = source.stat().st_size
+        self.invalidate(key)
+        cached_headers = content_headers(headers, size)
+        if size <= self.max_memory_item_size:
+            content = await read_file(source)
+            self._store_memory(key, etag, cached_headers, content)
+        elif self._fits_disk(size):
+            assert self.directory is not None
+            path = self._disk_path(key)
+            await copy_atomic(self.directory, source, path)
+            self._add_disk(key, etag, cached_headers, size, path)
+
+    def invalidate(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_used -= len(entry.content)
+        disk_entry = self._disk.pop(key, None)
+        if disk_entry is not None:
+            self._disk_used -= disk_entry.size
+            self._unlink(disk_entry.path)
+
+    def clear(self) -> None:
+        for key in list(self._memory) + list(self._disk):
+            self.invalidate(key)
+
+    def stats(self) -> ContentCacheStats:
+        return ContentCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            memory_count=len(self._memory),
+            memory_size=self._memory_used,
+            disk_count=len(self._disk),
+            disk_size=self._disk_used,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
+
+
+__all__ = (
+    "CachedContent",
+    "CachedMetadata",
+    "ContentCache",
+    "ContentCacheStats",
+    "MetadataCache",
+)
@@ -0,0 +1,188 @@
+import base64
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional, TextIO, Union
+
+
+log = logging.getLogger(__name__)
+
+
+class UploadState(NamedTuple):
+    upload_id: str
+    object_name: str
+    parts: Dict[int, str]
+    source: Optional[Dict[str, Any]] = None
+
+
+class UploadCheckpoint:
+    """
+    Journal of a multipart upload. The first line contains the upload id,
+    the object name and the identity of the source (e.g. the part size,
+    the size and the mtime of the file), so parts are reused only for the
+    same source split the same way. Each next line contains the number
+    and the etag of an uploaded part. Lines are flushed as soon as they
+    are written, so the journal survives the process crash.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._fp: Optional[TextIO] = None
+
+    def load(self) -> Optional[UploadState]:
+        try:
+            with self.path.open("r") as fp:
+                lines = fp.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        try:
+            header = json.loads(lines[0])
+            parts = {}
+            for line in lines[1:]:
+                try:
+                    part = json.loads(line)
+                except ValueError:
+                    # The last line may be partially written
+                    log.warning("Skipping broken line %r of %s", line, self)
+                    continue
+                parts[int(part["part_no"])] = part["etag"]
+            return UploadState(
+                header["upload_id"], header["object_name"], parts,
+                header.get("source"),
+            )
+        except (IndexError, KeyError, ValueError):
+            log.warning("Checkpoint %s is broken, ignoring it", self)
+            return None
+
+    def start(
+        self, upload_id: str, object_name: str,
+        parts: Optional[Mapping[int, str]] = None,
+        source: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        (Re)writes the journal with the given upload id and parts
+        """
+        self.close()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w") as fp:
+            fp.write(
+                json.dumps(
+                    {
+                        "upload_id": upload_id,
+                        "object_name": object_name,
+                        "source": dict(source) if source is not None else None,
+                    },
+                ) + "\n",
+            )
+            for part_no, etag in sorted((parts or {}).items()):
+                fp.write(json.dumps({"part_no": part_no, "etag": etag}) + "\n")
+        os.replace(tmp_path, self.path)
+        self._fp = self.path.open("a")
+
+    def add(self, part_no: int, etag: str) -> None:
+        if self._fp is None:
+            raise RuntimeError(f"{self} is not started")
+        self._fp.write(json.dumps({"part_no": part_no, "etag": etag}) + "\n")
+        self._fp.flush()
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def remove(self) -> None:
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+
+class DownloadCheckpoint:
+    """
+    Sidecar file of a parallel download. Contains the ETag and the size
+    of the object and the bitmap of downloaded blocks of `range_step`
+    bytes. The sidecar is rewritten atomically after each block.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], etag: str, size: int, range_step: int,
+    ):
+        self.path = Path(path)
+        self.etag = etag
+        self.size = size
+        self.range_step = range_step
+        self.blocks_count = -(-size // range_step)
+        self.bitmap = bytearray(-(-self.blocks_count // 8))
+
+    def load(self) -> bool:
+        """
+        Loads the bitmap of downloaded blocks. Returns False if the sidecar
+        doesn't exist or belongs to another version of the object.
+        """
+        try:
+            with self.path.open("r") as fp:
+                state = json.load(fp)
+            if (
+                state["etag"] != self.etag or
+                state["size"] != self.size or
+                state["range_step"] != self.range_step
+            ):
+                log.debug("Sidecar %s is outdated, ignoring it", self)
+                return False
+            bitmap = bytearray(base64.b64decode(state["completed"]))
+        except FileNotFoundError:
+            return False
+        except (KeyError, TypeError, ValueError):
+            log.warning("Sidecar %s is broken, ignoring it", self)
+            return False
+
+        if len(bitmap) != len(self.bitmap):
+            return False
+        self.bitmap = bitmap
+        return True
+
+    def is_completed(self, block: int) -> bool:
+        return bool(self.bitmap[block >> 3] & (1 << (block & 7)))
+
+    def mark_completed(self, block: int) -> None:
+        self.bitmap[block >> 3] |= 1 << (block & 7)
+
+    @property
+    def completed_count(self) -> int:
+        return sum(bin(byte).count("1") for byte in self.bitmap)
+
+    def save(self) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w") as fp:
+            json.dump(
+                {
+                    "etag": self.etag,
+                    "size": self.size,
+                    "range_step": self.range_step,
+                    "completed": base64.b64encode(self.bitmap).decode(),
+                },
+                fp,
+            )
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+
+__all__ = (
+    "DownloadCheckpoint",
+    "UploadCheckpoint",
+    "UploadState",
+)
@@ -1,31 +1,53 @@
 import asyncio
+import base64
 import hashlib
-import io
 import logging
 import os
+import threading
 import typing as t
 from collections import deque
-from contextlib import suppress
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from functools import partial
 from http import HTTPStatus
-from itertools import chain
+from itertools import chain, islice
 from mimetypes import guess_type
 from mmap import PAGESIZE
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from urllib.parse import quote
 
 from aiomisc import asyncbackoff, threaded, threaded_iterable
 from aws_request_signer import UNSIGNED_PAYLOAD
-from httpx import URL, HTTPError, AsyncClient, Response, QueryParams
+from httpx import (
+    URL, HTTPError, AsyncClient, Headers, Response, QueryParams,
+)
 
 from httpx_s3_client._xml import (
-    AwsObjectMeta, create_complete_upload_request,
-    parse_create_multipart_upload_id, parse_list_objects,
+    AwsDeleteError, AwsObjectMeta, ListObjectsPage, ListObjectsParser,
+    create_complete_upload_request, create_delete_objects_request,
+    parse_copy_etag, parse_create_multipart_upload_id, parse_delete_objects,
+    parse_list_parts,
 )
+from httpx_s3_client.budget import MemoryBudget, reserve
+from httpx_s3_client.cache import ContentCache, MetadataCache
+from httpx_s3_client.checkpoint import DownloadCheckpoint, UploadCheckpoint
+from httpx_s3_client.columns import ListObjectsColumnsParser, ObjectColumns
 from httpx_s3_client.credentials import (
     AbstractCredentials, collect_credentials,
 )
+from httpx_s3_client.etag import etag_matches
+from httpx_s3_client.hedging import Hedging
+from httpx_s3_client.parts import (
+    MAX_PART_SIZE, MAX_PARTS_COUNT, MIN_PART_SIZE, BufferPool, PooledPart,
+    RechunkedParts, plan_part_size,
+)
+from httpx_s3_client.scheduler import Priority, Scheduler, scheduled
+from httpx_s3_client.signer import (
+    STREAMING_PAYLOAD, ChunkSigner, RequestSigner, aws_chunked_length,
+)
+from httpx_s3_client.tuning import AutoTuner, iter_ranges, sample, slot
 
 log = logging.getLogger(__name__)
 
@@ -36,11 +58,24 @@ EMPTY_STR_HASH = hashlib.sha256(b"").hexdigest()
 # 5MB
 
 PART_SIZE = 5 * 1024 * 1024
+MIN_RANGE_SIZE = 256 * 1024
+# Maximum count of keys in DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+# Maximum size of an object copied with a single request (5GB)
+MAX_COPY_SIZE = 5 * 1024 * 1024 * 1024
 HeadersType = t.Union[t.Dict]
+T = t.TypeVar("T")
 threaded_iterable_constrained = threaded_iterable(max_size=2)
 
 DataType = t.Optional[t.Mapping[str, t.Any]]
 RequestContent = t.Optional[t.Union[str, bytes, t.Iterable[bytes], t.AsyncIterable[bytes]]]
+PartContent = t.Union[bytes, memoryview]
+Hasher = t.Callable[[PartContent], asyncio.Future]
+ObjectKeys = t.Union[
+    t.Iterable[str],
+    t.AsyncIterable[str],
+    t.AsyncIterable[t.List[AwsObjectMeta]],
+]
 PrimitiveData = t.Optional[t.Union[str, int, float, bool]]
 QueryParamTypes = t.Union[
     QueryParams,
@@ -54,8 +89,15 @@ QueryParamTypes = t.Union[
 
 @dataclass
 class HEADERS:
+    CONTENT_ENCODING = 'Content-Encoding'
     CONTENT_LENGTH = 'Content-Length'
+    CONTENT_MD5 = 'Content-MD5'
     CONTENT_TYPE = 'Content-Type'
+    COPY_SOURCE = 'x-amz-copy-source'
+    COPY_SOURCE_IF_MATCH = 'x-amz-copy-source-if-match'
+    COPY_SOURCE_RANGE = 'x-amz-copy-source-range'
+    DECODED_CONTENT_LENGTH = 'x-amz-decoded-content-length'
+    METADATA_DIRECTIVE = 'x-amz-metadata-directive'
 
 
 class AwsError(HTTPError):
@@ -71,26 +113,13 @@ class AwsDownloadError(AwsError):
 
 
 @threaded
-def concat_files(
-    target_file: Path, files: t.List[t.IO[bytes]], buffer_size: int,
-) -> None:
-    with target_file.open("ab") as fp:
-        for file in files:
-            file.seek(0)
-            while True:
-                chunk = file.read(buffer_size)
-                if not chunk:
-                    break
-                fp.write(chunk)
-            file.close()
-
-
-@threaded
-def write_from_start(
-    file: io.BytesIO, chunk: bytes, range_start: int, pos: int,
+def write_locked(
+    file: t.IO[bytes], lock: threading.Lock,
+    chunk: bytes, range_start: int, pos: int,
 ) -> None:
-    file.seek(pos - range_start)
-    file.write(chunk)
+    with lock:
+        file.seek(pos - range_start)
+        file.write(chunk)
 
 
 @threaded
@@ -100,6 +129,19 @@ def pwrite_absolute_pos(
     os.pwrite(fd, chunk, pos)
 
 
+async def write_into_buffer(
+    buffer: memoryview, chunk: bytes, range_start: int, pos: int,
+) -> None:
+    buffer[pos:pos + len(chunk)] = chunk
+
+
+async def write_into_range(
+    buffer: memoryview, chunk: bytes, range_start: int, pos: int,
+) -> None:
+    offset = pos - range_start
+    buffer[offset:offset + len(chunk)] = chunk
+
+
 @threaded_iterable_constrained
 def gen_without_hash(
     stream: t.Iterable[bytes],
@@ -108,12 +150,120 @@ def gen_without_hash(
         yield (None, data)
 
 
+class SyncResult(t.NamedTuple):
+    """ Keys of uploaded and unchanged files of `sync_directory` """
+    uploaded: t.List[str]
+    unchanged: t.List[str]
+
+
+class DownloadResult(t.NamedTuple):
+    """ Keys of downloaded and unchanged objects of `download_prefix` """
+    downloaded: t.List[str]
+    unchanged: t.List[str]
+
+
+class LocalFile(t.NamedTuple):
+    path: Path
+    key: str
+    size: int
+
+
+@threaded
+def walk_directory(local_dir: Path, prefix: str) -> t.List[LocalFile]:
+    result = []
+    for root, _, files in os.walk(local_dir):
+        for name in files:
+            path = Path(root) / name
+            key = prefix + path.relative_to(local_dir).as_posix()
+            result.append(LocalFile(path, key, path.stat().st_size))
+    return result
+
+
+class ListShard(t.NamedTuple):
+    """
+    Keys of `prefix` after `start_after` up to `end` (inclusive),
+    `depth` is the count of delimiters after the listing prefix
+    """
+    prefix: str
+    depth: int = 0
+    start_after: t.Optional[str] = None
+    end: t.Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FilePart:
+    """
+    Part of a file which is read by the uploader only when it's sent
+    """
+    fd: int
+    offset: int
+    size: int
+
+    def __len__(self) -> int:
+        return self.size
+
+
+@dataclass(frozen=True)
+class CopyPart:
+    """
+    Range of the source object which is copied by `UploadPartCopy`
+    """
+    source: str
+    etag: str
+    offset: int
+    size: int
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def is_buffered(part: t.Any) -> bool:
+    """ Returns whether the content of the part is kept in memory """
+    return not isinstance(part, (FilePart, CopyPart))
+
+
+@threaded
+def read_file_part(part: FilePart) -> bytes:
+    chunks = []
+    offset, size = part.offset, part.size
+    while size > 0:
+        chunk = os.pread(part.fd, size, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+        size -= len(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
 @threaded_iterable_constrained
-def gen_with_hash(
-    stream: t.Iterable[bytes],
-) -> t.Generator[t.Tuple[str, bytes], None, None]:
-    for data in stream:
-        yield hashlib.sha256(data).hexdigest(), data
+def gen_file_parts(
+    fd: int, file_size: int, part_size: int,
+    part_hash: t.Optional[str] = None,
+    auto_tuner: t.Optional[AutoTuner] = None,
+) -> t.Generator[t.Tuple[t.Optional[str], FilePart], None, None]:
+    offset = 0
+    while offset < file_size:
+        if auto_tuner is not None and auto_tuner.chunk_size is not None:
+            part_size = auto_tuner.chunk_size
+        size = min(part_size, file_size - offset)
+        yield part_hash, FilePart(fd, offset, size)
+        offset += size
+
+
+@threaded_iterable_constrained
+def gen_copy_parts(
+    source: str, etag: str, size: int, part_size: int,
+) -> t.Generator[t.Tuple[None, CopyPart], None, None]:
+    for offset in range(0, size, part_size):
+        yield None, CopyPart(
+            source, etag, offset, min(part_size, size - offset),
+        )
+
+
+async def view_sender(data: memoryview) -> t.AsyncIterator[bytes]:
+    # Chunks are written to the socket as is, any bytes-like is fine
+    yield data  # type: ignore[misc]
 
 
 def file_sender(
@@ -130,6 +280,152 @@ def file_sender(
 async_file_sender = threaded_iterable_constrained(file_sender)
 
 
+def sha256_hexdigest(data: PartContent) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_in_executor(
+    executor: t.Optional[Executor], data: PartContent,
+) -> asyncio.Future:
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        # Views of pooled buffers can't be pickled
+        data = bytes(data)
+    return loop.run_in_executor(executor, sha256_hexdigest, data)
+
+
+@threaded_iterable_constrained
+def gen_streaming(
+    stream: t.Iterable[bytes],
+) -> t.Generator[t.Tuple[str, bytes], None, None]:
+    for data in stream:
+        yield STREAMING_PAYLOAD, data
+
+
+class AsyncParts:
+    """
+    Parts of async content with the interface of threaded iterables.
+    The content is consumed on the loop, so there is no thread switch
+    per part, hashing of parts is sent to executors by uploads.
+    """
+
+    def __init__(
+        self, stream: t.AsyncIterable[bytes],
+        part_hash: t.Optional[str] = None,
+    ):
+        self._iterator = stream.__aiter__()
+        self._part_hash = part_hash
+
+    async def __aenter__(self) -> "AsyncParts":
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __aiter__(self) -> "AsyncParts":
+        return self
+
+    async def __anext__(self) -> t.Tuple[t.Optional[str], bytes]:
+        return self._part_hash, await self._iterator.__anext__()
+
+
+async def iter_content(content: RequestContent) -> t.AsyncIterator[bytes]:
+    if isinstance(content, str):
+        content = content.encode()
+    if isinstance(content, bytes):
+        yield content
+    elif isinstance(content, t.AsyncIterable):
+        async for data in content:
+            yield data
+    elif content is not None:
+        for data in content:
+            yield data
+
+
+async def aws_chunked(
+    content: RequestContent, chunk_signer: ChunkSigner, chunk_size: int,
+) -> t.AsyncIterator[bytes]:
+    """
+    Encodes content with `aws-chunked` encoding. Content is coalesced
+    to chunks of exactly `chunk_size` bytes (except the last one), so
+    the encoded length is known before the body is sent.
+    """
+    buffer = bytearray()
+    async for data in iter_content(content):
+        buffer += data
+        if len(buffer) < chunk_size:
+            continue
+        view = memoryview(buffer)
+        offset = 0
+        while len(buffer) - offset >= chunk_size:
+            yield chunk_signer.encode(view[offset:offset + chunk_size])
+            offset += chunk_size
+        view.release()
+        del buffer[:offset]
+
+    if buffer:
+        yield chunk_signer.encode(bytes(buffer))
+    yield chunk_signer.encode(b"")
+
+
+def flatten_keys(item: t.Any) -> t.Iterator[str]:
+    if isinstance(item, str):
+        yield item
+    elif isinstance(item, AwsObjectMeta):
+        yield item.key
+    else:
+        for nested in item:
+            yield from flatten_keys(nested)
+
+
+async def iter_object_keys(keys: ObjectKeys) -> t.AsyncIterator[str]:
+    """
+    Yields keys from an (async) iterable of keys, metadata objects
+    or pages of them, like pages returned by `S3Client.list_objects_v2`.
+    """
+    if isinstance(keys, t.AsyncIterable):
+        async for item in keys:
+            for key in flatten_keys(item):
+                yield key
+    else:
+        for key in flatten_keys(keys):
+            yield key
+
+
+def split_ranges(size: int, step: int) -> t.List[t.Tuple[int, int]]:
+    return [
+        (start, min(start + step, size)) for start in range(0, size, step)
+    ]
+
+
+def plan_range_step(
+    size: int, range_step: int, workers_count: int, min_range_size: int,
+) -> int:
+    """
+    Returns the range size for an object of `size` bytes. Objects smaller
+    than `workers_count * range_step` are split to smaller ranges, so all
+    workers are busy, but ranges aren't smaller than `min_range_size`
+    (or `range_step` if it is smaller), so small objects use fewer workers.
+    """
+    step = min(range_step, max(-(-size // workers_count), 1))
+    return max(step, min(range_step, min_range_size))
+
+
+async def gather_or_cancel(tasks: t.Sequence[asyncio.Task]) -> t.List[t.Any]:
+    """
+    Awaits all tasks. When one of them fails the rest are cancelled.
+    """
+    try:
+        return await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 class S3Client:
     def __init__(
         self, client: AsyncClient, url: t.Union[URL, str],
@@ -138,7 +434,25 @@ class S3Client:
         session_token: t.Optional[str] = None,
         region: str = "",
         credentials: t.Optional[AbstractCredentials] = None,
+        hedging: t.Optional[Hedging] = None,
+        metadata_cache: t.Optional[MetadataCache] = None,
+        content_cache: t.Optional[ContentCache] = None,
+        memory_budget: t.Optional[MemoryBudget] = None,
+        scheduler: t.Optional[Scheduler] = None,
     ):
+        """
+        hedging: hedges range downloads and part uploads which are slower
+            than usual
+        metadata_cache: caches responses of HEAD requests without
+            headers and parameters
+        content_cache: caches bodies of objects got by `get` without
+            headers and parameters and by `get_file_parallel`
+        memory_budget: bounds the payload buffered by part uploads and
+            range downloads of all transfers of the client
+        scheduler: limits concurrent requests and sends waiting requests
+            by priority, parts and ranges of transfers are `BULK` requests
+            by default
+        """
         url = URL(url)
         if credentials is None:
             credentials = collect_credentials(
@@ -157,19 +471,127 @@ class S3Client:
         self._url = url
         self._client = client
         self._credentials = credentials
+        self._hedging = hedging
+        self._metadata_cache = metadata_cache
+        self._content_cache = content_cache
+        self._memory_budget = memory_budget
+        self._scheduler = scheduler
 
     @property
     def url(self) -> URL:
         return self._url
 
+    @property
+    def hedging(self) -> t.Optional[Hedging]:
+        return self._hedging
+
+    @property
+    def metadata_cache(self) -> t.Optional[MetadataCache]:
+        return self._metadata_cache
+
+    @property
+    def content_cache(self) -> t.Optional[ContentCache]:
+        return self._content_cache
+
+    @property
+    def memory_budget(self) -> t.Optional[MemoryBudget]:
+        return self._memory_budget
+
+    @property
+    def scheduler(self) -> t.Optional[Scheduler]:
+        return self._scheduler
+
+    def _cache_key(self, object_name: t.Union[str, Path]) -> str:
+        return self._url.join(str(object_name)).path
+
+    def _invalidate(self, object_name: t.Union[str, Path]) -> None:
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(self._cache_key(object_name))
+        if self._content_cache is not None:
+            self._content_cache.invalidate(self._cache_key(object_name))
+
+    def _hedged(
+        self, func: t.Callable[..., t.Coroutine[t.Any, t.Any, T]], size: int,
+        buffered: bool = False,
+    ) -> t.Callable[..., t.Coroutine[t.Any, t.Any, T]]:
+        """
+        Hedges slow calls of `func`. A `buffered` hedge keeps its own copy
+        of `size` bytes, so it's reserved in the memory budget.
+        """
+        if self._hedging is None:
+            return func
+        budget = self._memory_budget
+        if not buffered or budget is None:
+            return self._hedging.wrap(func, size)
+
+        async def reserved(*args: t.Any, **kwargs: t.Any) -> T:
+            async with reserve(budget, size):
+                return await func(*args, **kwargs)
+
+        return self._hedging.wrap(func, size, reserved)
+
     async def request(
         self, method: str, path: str,
         headers: t.Optional[HeadersType] = None,
         params: t.Optional[QueryParams] = None,
         content: t.Optional[RequestContent] = None,
         content_sha256: t.Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+        priority: Priority = Priority.INTERACTIVE,
         **kwargs,
     ) -> Response:
+        """
+        Sends signed request. Pass `content_sha256=STREAMING_PAYLOAD`
+        to sign the content chunk by chunk with `aws-chunked` encoding,
+        `chunk_size` is the size of each signed chunk in this case.
+        When the client has `scheduler`, the request waits for a slot
+        of its `priority` class.
+        """
+        async with scheduled(self._scheduler, priority):
+            # The request is signed when it's sent, so the signature
+            # doesn't expire while the request waits
+            url, headers, content = self._sign_request(
+                method, path, headers, params, content, content_sha256,
+                chunk_size,
+            )
+            return await self._client.request(
+                method, url, headers=headers, content=content, **kwargs,
+            )
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, path: str,
+        headers: t.Optional[HeadersType] = None,
+        params: t.Optional[QueryParamTypes] = None,
+        content: t.Optional[RequestContent] = None,
+        content_sha256: t.Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs,
+    ) -> t.AsyncIterator[Response]:
+        """
+        Sends signed request like `request`, but the response body isn't
+        read, so it may be iterated with `Response.aiter_bytes()`.
+        The slot of `scheduler` is held until the context is exited.
+        """
+        async with scheduled(self._scheduler, priority):
+            url, headers, content = self._sign_request(
+                method, path, headers, params, content, content_sha256,
+                chunk_size,
+            )
+            async with self._client.stream(
+                method, url, headers=headers, content=content, **kwargs,
+            ) as resp:
+                yield resp
+
+    def _sign_request(
+        self, method: str, path: str,
+        headers: t.Optional[HeadersType],
+        params: t.Optional[QueryParamTypes],
+        content: t.Optional[RequestContent],
+        content_sha256: t.Optional[str],
+        chunk_size: int,
+    ) -> t.Tuple[URL, dict, t.Optional[RequestContent]]:
         headers = self._prepare_headers(headers)
 
         if content is not None and content_sha256 is None:
@@ -180,35 +602,288 @@ class S3Client:
             url = url.copy_merge_params(params)
 
         headers = self._make_headers(headers)
-        headers.update(
-            self._credentials.signer.sign_with_headers(
-                method, str(url), headers=headers, content_hash=content_sha256,
+        signer = self._credentials.signer
+        if content_sha256 == STREAMING_PAYLOAD:
+            if not isinstance(signer, RequestSigner):
+                raise TypeError(
+                    f"Streaming payload signing is not supported by {signer!r}",
+                )
+            self._set_streaming_headers(headers, content, chunk_size)
+            headers.update(
+                signer.sign_url(
+                    method, url, headers=headers, content_hash=content_sha256,
+                ),
+            )
+            content = aws_chunked(
+                content, signer.chunk_signer(headers), chunk_size,
+            )
+        elif isinstance(signer, RequestSigner):
+            headers.update(
+                signer.sign_url(
+                    method, url, headers=headers, content_hash=content_sha256,
+                ),
+            )
+        else:
+            headers.update(
+                signer.sign_with_headers(
+                    method, str(url), headers=headers,
+                    content_hash=content_sha256,
+                ),
+            )
+        return url, headers, content
+
+    @staticmethod
+    def _set_streaming_headers(
+        headers: dict, content: RequestContent, chunk_size: int,
+    ) -> None:
+        if HEADERS.DECODED_CONTENT_LENGTH not in headers:
+            if isinstance(content, str):
+                content = content.encode()
+            if not isinstance(content, bytes):
+                raise ValueError(
+                    f"{HEADERS.DECODED_CONTENT_LENGTH} header is required "
+                    "for streaming payload signing of iterable content",
+                )
+            headers[HEADERS.DECODED_CONTENT_LENGTH] = str(len(content))
+
+        headers[HEADERS.CONTENT_LENGTH] = str(
+            aws_chunked_length(
+                int(headers[HEADERS.DECODED_CONTENT_LENGTH]), chunk_size,
             ),
         )
-        return await self._client.request(
-            method, url, headers=headers, content=content, **kwargs,
+        content_encoding = headers.get(HEADERS.CONTENT_ENCODING)
+        headers[HEADERS.CONTENT_ENCODING] = (
+            f"aws-chunked,{content_encoding}" if content_encoding
+            else "aws-chunked"
         )
 
     async def get(self, object_name: str, **kwargs) -> Response:
-        return await self.request("GET", object_name, **kwargs)
+        """
+        Sends GET request. Bodies of requests without headers and
+        parameters are cached when the client has `content_cache`.
+        """
+        priority = kwargs.pop("priority", Priority.INTERACTIVE)
+        if self._content_cache is None or kwargs:
+            return await self.request(
+                "GET", object_name, priority=priority, **kwargs,
+            )
+        return await self._cached_get(
+            object_name, self._content_cache, priority,
+        )
+
+    async def _cached_get(
+        self, object_name: str, cache: ContentCache,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Response:
+        key = self._cache_key(object_name)
+        etag = cache.etag(key)
+        headers = {"If-None-Match": etag} if etag is not None else None
+        resp = await self.request(
+            "GET", object_name, headers=headers, priority=priority,
+        )
+        if resp.status_code == HTTPStatus.NOT_MODIFIED and etag is not None:
+            cached = await cache.get(key, etag)
+            if cached is not None:
+                return Response(
+                    HTTPStatus.OK,
+                    headers=cached.headers,
+                    content=cached.content,
+                    request=resp.request,
+                )
+            # The body is evicted after the request was sent
+            resp = await self.request("GET", object_name, priority=priority)
+        if resp.status_code == HTTPStatus.OK:
+            await cache.store(key, resp)
+        else:
+            cache.invalidate(key)
+        return resp
 
     async def head(
         self, object_name: str,
         content_sha256=EMPTY_STR_HASH,
         **kwargs,
     ) -> Response:
-        return await self.request(
-            "HEAD", object_name, content_sha256=content_sha256, **kwargs,
+        """
+        Sends HEAD request. Responses of requests without headers and
+        parameters are cached when the client has `metadata_cache`.
+        """
+        priority = kwargs.pop("priority", Priority.INTERACTIVE)
+        if kwargs.get("headers") or set(kwargs) - {"headers"}:
+            return await self.request(
+                "HEAD", object_name, content_sha256=content_sha256,
+                priority=priority, **kwargs,
+            )
+        if self._metadata_cache is None:
+            return await self.request(
+                "HEAD", object_name, content_sha256=content_sha256,
+                priority=priority,
+            )
+        return await self._cached_head(object_name, content_sha256, priority)
+
+    async def _cached_head(
+        self, object_name: str, content_sha256: str,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Response:
+        cache = t.cast(MetadataCache, self._metadata_cache)
+        key = self._cache_key(object_name)
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.response()
+
+        headers = {"If-None-Match": entry.etag} if entry is not None else None
+        resp = await self.request(
+            "HEAD", object_name, headers=headers,
+            content_sha256=content_sha256, priority=priority,
         )
+        if resp.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+            return cache.revalidate(key, entry).response()
+        if resp.status_code == HTTPStatus.OK:
+            cache.store(key, resp)
+        else:
+            cache.invalidate(key)
+        return resp
 
     async def delete(
         self, object_name: str,
         content_sha256=EMPTY_STR_HASH,
         **kwargs,
     ) -> Response:
-        return await self.request(
+        resp = await self.request(
             "DELETE", object_name, content_sha256=content_sha256, **kwargs,
         )
+        self._invalidate(object_name)
+        return resp
+
+    async def _delete_objects(
+        self, object_name: str, keys: t.Sequence[str],
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.List[AwsDeleteError]:
+        payload = create_delete_objects_request(keys)
+        resp = await self.post(
+            object_name,
+            headers={
+                HEADERS.CONTENT_TYPE: "text/xml",
+                HEADERS.CONTENT_MD5: base64.b64encode(
+                    hashlib.md5(payload).digest(),
+                ).decode(),
+            },
+            params={"delete": ""},
+            content=payload,
+            content_sha256=hashlib.sha256(payload).hexdigest(),
+            priority=priority,
+        )
+        for key in keys:
+            self._invalidate(f"{object_name.rstrip('/')}/{key}")
+        if resp.status_code != HTTPStatus.OK:
+            raise AwsError(
+                f"Wrong status code {resp.status_code} from s3 with message "
+                f"{resp.content!r}.",
+            )
+        _, errors = parse_delete_objects(resp.content)
+        log.debug(
+            "Deleted %d of %d objects from %s",
+            len(keys) - len(errors), len(keys), object_name,
+        )
+        return errors
+
+    async def _delete_batches_generator(
+        self, keys: ObjectKeys, batch_size: int, workers_count: int,
+        batches_queue: asyncio.Queue,
+    ) -> None:
+        batch: t.List[str] = []
+        async for key in iter_object_keys(keys):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                await batches_queue.put(batch)
+                batch = []
+        if batch:
+            await batches_queue.put(batch)
+
+        for _ in range(workers_count):
+            await batches_queue.put(DONE)
+
+    async def _delete_worker(
+        self, object_name: str, batches_queue: asyncio.Queue,
+        errors: t.List[AwsDeleteError], delete_tries: int,
+        priority: Priority,
+    ) -> None:
+        backoff = asyncbackoff(
+            None, None,
+            max_tries=delete_tries,
+            exceptions=(HTTPError,),
+        )
+        while True:
+            batch = await batches_queue.get()
+            if batch is DONE:
+                break
+            errors.extend(
+                await backoff(self._delete_objects)(
+                    object_name, batch, priority,
+                ),
+            )
+
+    async def delete_objects(
+        self,
+        keys: ObjectKeys,
+        *,
+        bucket: t.Optional[str] = None,
+        object_name: t.Union[str, Path] = "/",
+        batch_size: int = DELETE_BATCH_SIZE,
+        workers_count: int = 4,
+        delete_tries: int = 3,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.List[AwsDeleteError]:
+        """
+        Deletes objects with DeleteObjects requests of up to `batch_size`
+        keys each. Keys are read while previous batches are deleted, so
+        the prefix may be deleted with the iterator of `list_objects_v2`:
+
+            await client.delete_objects(
+                client.list_objects_v2(bucket="bucket", prefix="prefix/"),
+                bucket="bucket",
+            )
+
+        Returns errors of keys which weren't deleted.
+
+        keys: keys relative to the bucket, metadata objects or pages of them
+        bucket: bucket of the objects, prepended to `object_name`
+        object_name: path to the bucket endpoint, defaults to '/'
+        batch_size: count of keys in a single request (at most 1000)
+        workers_count: count of concurrent requests
+        delete_tries: count of tries of each request
+        priority: class of requests for the scheduler
+        """
+        if not 0 < batch_size <= DELETE_BATCH_SIZE:
+            raise ValueError(
+                f"Batch size should be in (0, {DELETE_BATCH_SIZE}]. "
+                f"Got {batch_size}",
+            )
+        if workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {workers_count}",
+            )
+        if bucket is not None:
+            object_name = f"/{bucket}"
+
+        errors: t.List[AwsDeleteError] = []
+        batches_queue: asyncio.Queue = asyncio.Queue(maxsize=workers_count)
+        await gather_or_cancel([
+            asyncio.create_task(
+                self._delete_batches_generator(
+                    keys, batch_size, workers_count, batches_queue,
+                ),
+            ),
+            *(
+                asyncio.create_task(
+                    self._delete_worker(
+                        str(object_name), batches_queue, errors,
+                        delete_tries, priority,
+                    ),
+                )
+                for _ in range(workers_count)
+            ),
+        ])
+        return errors
 
     @staticmethod
     def _make_headers(headers: t.Optional[HeadersType]) -> dict:
@@ -235,7 +910,11 @@ class S3Client:
         content: RequestContent,
         **kwargs,
     ) -> Response:
-        return await self.request("PUT", object_name, content=content, **kwargs)
+        resp = await self.request(
+            "PUT", object_name, content=content, **kwargs,
+        )
+        self._invalidate(object_name)
+        return resp
 
     async def post(
         self, object_name: str,
@@ -249,9 +928,14 @@ class S3Client:
         file_path: t.Union[str, Path],
         *, headers: t.Optional[HeadersType] = None,
         chunk_size: int = CHUNK_SIZE, content_sha256: t.Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> Response:
 
         headers = self._prepare_headers(headers, str(file_path))
+        if content_sha256 == STREAMING_PAYLOAD:
+            headers[HEADERS.DECODED_CONTENT_LENGTH] = str(
+                os.stat(file_path).st_size,
+            )
         return await self.put(
             str(object_name),
             headers=headers,
@@ -260,6 +944,8 @@ class S3Client:
                 chunk_size=chunk_size,
             ),
             content_sha256=content_sha256,
+            chunk_size=chunk_size,
+            priority=priority,
         )
 
     @asyncbackoff(
@@ -270,12 +956,14 @@ class S3Client:
         self,
         object_name: str,
         headers: t.Optional[HeadersType] = None,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> str:
         resp = await self.post(
             object_name,
             headers=headers,
             params={"uploads": 1},
             content_sha256=EMPTY_STR_HASH,
+            priority=priority,
         )
         payload = resp.read()
         if resp.status_code != HTTPStatus.OK:
@@ -285,6 +973,38 @@ class S3Client:
             )
         return parse_create_multipart_upload_id(payload)
 
+    @asyncbackoff(
+        None, None, 0,
+        max_tries=3, exceptions=(HTTPError,),
+    )
+    async def _list_parts(
+        self, object_name: str, upload_id: str,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.Optional[t.Dict[int, str]]:
+        """
+        Returns etags of already uploaded parts of the upload or None
+        if the upload doesn't exist anymore.
+        """
+        parts: t.Dict[int, str] = {}
+        params = {"uploadId": upload_id}
+        while True:
+            resp = await self.get(
+                object_name, params=params, priority=priority,
+            )
+            payload = resp.read()
+            if resp.status_code == HTTPStatus.NOT_FOUND:
+                return None
+            if resp.status_code != HTTPStatus.OK:
+                raise AwsUploadError(
+                    f"Wrong status code {resp.status_code} from s3 with "
+                    f"message {payload.decode()}.",
+                )
+            page, next_marker = parse_list_parts(payload)
+            parts.update(page)
+            if next_marker is None:
+                return parts
+            params["part-number-marker"] = str(next_marker)
+
     @asyncbackoff(
         None, None, 0,
         max_tries=3, exceptions=(AwsUploadError, HTTPError),
@@ -294,6 +1014,7 @@ class S3Client:
         upload_id: str,
         object_name: str,
         parts: t.List[t.Tuple[int, str]],
+        priority: Priority = Priority.INTERACTIVE,
     ) -> None:
         complete_upload_request = create_complete_upload_request(parts)
         resp = await self.post(
@@ -302,7 +1023,9 @@ class S3Client:
             params={"uploadId": upload_id},
             content=complete_upload_request,
             content_sha256=hashlib.sha256(complete_upload_request).hexdigest(),
+            priority=priority,
         )
+        self._invalidate(object_name)
         if resp.status_code != HTTPStatus.OK:
             payload = resp.content
             raise AwsUploadError(
@@ -316,7 +1039,8 @@ class S3Client:
         object_name: str,
         part_no: int,
         content: RequestContent,
-        content_sha256: str,
+        content_sha256: t.Optional[str],
+        priority: Priority = Priority.BULK,
         **kwargs,
     ) -> str:
         resp = await self.put(
@@ -324,6 +1048,7 @@ class S3Client:
             params={"partNumber": part_no, "uploadId": upload_id},
             content=content,
             content_sha256=content_sha256,
+            priority=priority,
             **kwargs,
         )
         payload = resp.content
@@ -334,6 +1059,126 @@ class S3Client:
             )
         return resp.headers["Etag"].strip('"')
 
+    async def _put_file_part(
+        self,
+        upload_id: str,
+        object_name: str,
+        part_no: int,
+        content: FilePart,
+        content_sha256: t.Optional[str],
+        hasher: t.Optional[Hasher] = None,
+        **kwargs,
+    ) -> str:
+        data = await read_file_part(content)
+        if hasher is not None:
+            content_sha256 = await hasher(data)
+        return await self._put_part(
+            upload_id=upload_id,
+            object_name=object_name,
+            part_no=part_no,
+            content=data,
+            content_sha256=content_sha256,
+            **kwargs,
+        )
+
+    async def _put_pooled_part(
+        self,
+        upload_id: str,
+        object_name: str,
+        part_no: int,
+        content: PooledPart,
+        content_sha256: t.Optional[str],
+        **kwargs,
+    ) -> str:
+        # The buffer is sent as is, so its length is passed explicitly
+        length = (
+            HEADERS.DECODED_CONTENT_LENGTH
+            if content_sha256 == STREAMING_PAYLOAD
+            else HEADERS.CONTENT_LENGTH
+        )
+        return await self._put_part(
+            upload_id=upload_id,
+            object_name=object_name,
+            part_no=part_no,
+            content=view_sender(content.data),
+            content_sha256=content_sha256,
+            headers={length: str(len(content))},
+            **kwargs,
+        )
+
+    @staticmethod
+    def _copy_result_etag(resp: Response, object_name: str) -> str:
+        if resp.status_code != HTTPStatus.OK:
+            raise AwsUploadError(
+                f"Wrong status code {resp.status_code} from s3 with message "
+                f"{resp.content!r}.",
+            )
+        try:
+            return parse_copy_etag(resp.content)
+        except ValueError as e:
+            raise AwsUploadError(f"Copy to {object_name} failed: {e}") from e
+
+    async def _copy_part(
+        self,
+        upload_id: str,
+        object_name: str,
+        part_no: int,
+        content: CopyPart,
+        content_sha256: t.Optional[str],
+        priority: Priority = Priority.BULK,
+        **kwargs,
+    ) -> str:
+        last_byte = content.offset + content.size - 1
+        resp = await self.put(
+            object_name,
+            headers={
+                HEADERS.COPY_SOURCE: content.source,
+                HEADERS.COPY_SOURCE_IF_MATCH: content.etag,
+                HEADERS.COPY_SOURCE_RANGE: (
+                    f"bytes={content.offset}-{last_byte}"
+                ),
+            },
+            params={"partNumber": part_no, "uploadId": upload_id},
+            content=None,
+            content_sha256=EMPTY_STR_HASH,
+            priority=priority,
+            **kwargs,
+        )
+        return self._copy_result_etag(resp, object_name)
+
+    def _part_sender(
+        self, part: t.Any, hasher: t.Optional[Hasher],
+    ) -> t.Callable[..., t.Coroutine[t.Any, t.Any, str]]:
+        if isinstance(part, FilePart):
+            # File part is read (and hashed) on each try, so its
+            # content isn't kept in memory between retries
+            return partial(self._put_file_part, hasher=hasher)
+        if isinstance(part, CopyPart):
+            return self._copy_part
+        if isinstance(part, PooledPart):
+            return self._put_pooled_part
+        return self._put_part
+
+    async def _reserve_part(self, part: t.Any) -> None:
+        """
+        Reserves the memory budget for a part read into memory, it's
+        released by `_release_part` when the part is uploaded
+        """
+        if self._memory_budget is not None and is_buffered(part):
+            await self._memory_budget.acquire(len(part))
+
+    def _release_part(self, part: t.Any) -> None:
+        if isinstance(part, PooledPart):
+            part.release()
+        if self._memory_budget is not None and is_buffered(part):
+            self._memory_budget.release(len(part))
+
+    def _release_queued_parts(self, parts_queue: asyncio.Queue) -> None:
+        while not parts_queue.empty():
+            msg = parts_queue.get_nowait()
+            if msg is not DONE:
+                self._release_part(msg[2])
+
     async def _part_uploader(
         self,
         upload_id: str,
@@ -341,6 +1186,10 @@ class S3Client:
         parts_queue: asyncio.Queue,
         results_queue: deque,
         part_upload_tries: int,
+        hasher: t.Optional[Hasher] = None,
+        checkpoint: t.Optional[UploadCheckpoint] = None,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        limiter: t.Optional[asyncio.Semaphore] = None,
         **kwargs,
     ) -> None:
         backoff = asyncbackoff(
@@ -349,22 +1198,43 @@ class S3Client:
             exceptions=(HTTPError,),
         )
         while True:
-            msg = await parts_queue.get()
-            if msg is DONE:
-                break
-            part_no, part_hash, part = msg
-            etag = await backoff(self._put_part)(
-                upload_id=upload_id,
-                object_name=object_name,
-                part_no=part_no,
-                content=part,
-                content_sha256=part_hash,
-                **kwargs,
-            )
+            async with slot(auto_tuner):
+                msg = await parts_queue.get()
+                if msg is DONE:
+                    break
+                part_no, part_hash, part = msg
+                try:
+                    if isinstance(part_hash, asyncio.Future):
+                        part_hash = await part_hash
+                    # File part is read again by the hedge
+                    put_part = self._hedged(
+                        self._part_sender(part, hasher), len(part),
+                        buffered=isinstance(part, FilePart),
+                    )
+                    # File part is reserved only while it's read and sent
+                    file_budget = (
+                        self._memory_budget if isinstance(part, FilePart)
+                        else None
+                    )
+                    async with reserve(file_budget, len(part)):
+                        async with slot(limiter):
+                            with sample(auto_tuner, len(part)):
+                                etag = await backoff(put_part)(
+                                    upload_id=upload_id,
+                                    object_name=object_name,
+                                    part_no=part_no,
+                                    content=part,
+                                    content_sha256=part_hash,
+                                    **kwargs,
+                                )
+                finally:
+                    self._release_part(part)
             log.debug(
                 "Etag for part %d of %s is %s", part_no, upload_id, etag,
             )
             results_queue.append((part_no, etag))
+            if checkpoint is not None:
+                checkpoint.add(part_no, etag)
 
     async def put_file_multipart(
         self,
@@ -377,6 +1247,11 @@ class S3Client:
         max_size: t.Optional[int] = None,
         part_upload_tries: int = 3,
         calculate_content_sha256: bool = True,
+        streaming_signature: bool = False,
+        hash_executor: t.Optional[Executor] = None,
+        checkpoint_path: t.Optional[t.Union[str, Path]] = None,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        limiter: t.Optional[asyncio.Semaphore] = None,
         **kwargs,
     ) -> None:
         """
@@ -392,35 +1267,116 @@ class S3Client:
         part_upload_tries: how many times trying to put part to s3 before fail
         calculate_content_sha256: whether to calculate sha256 hash of a part
             for integrity purposes
+        streaming_signature: sign each part chunk by chunk while it is
+            sent instead of hashing it beforehand
+        hash_executor: executor for calculating hashes of parts in parallel,
+            the loop's default executor is used if not passed
+        checkpoint_path: path to a journal of uploaded parts. If the journal
+            exists, the upload is resumed and only missing parts are sent.
+            The journal is removed after the upload is completed.
+        auto_tuner: tunes `workers_count` and `part_size` (if `pread` is
+            supported and the upload isn't resumable) during the upload
+        limiter: semaphore which limits concurrent requests of several
+            uploads
         """
         log.debug(
             "Going to multipart upload %s to %s with part size %d",
             file_path, object_name, part_size,
         )
-        await self.put_multipart(
-            object_name,
-            file_sender(
-                file_path,
-                chunk_size=part_size,
-            ),
-            headers=headers,
-            workers_count=workers_count,
-            max_size=max_size,
-            part_upload_tries=part_upload_tries,
-            calculate_content_sha256=calculate_content_sha256,
-            **kwargs,
-        )
+        stat = os.stat(file_path)
+        kwargs["checkpoint_source"] = {
+            "part_size": part_size,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if not hasattr(os, "pread"):
+            await self.put_multipart(
+                object_name,
+                file_sender(
+                    file_path,
+                    chunk_size=part_size,
+                ),
+                headers=headers,
+                workers_count=workers_count,
+                max_size=max_size,
+                part_upload_tries=part_upload_tries,
+                calculate_content_sha256=calculate_content_sha256,
+                streaming_signature=streaming_signature,
+                hash_executor=hash_executor,
+                checkpoint_path=checkpoint_path,
+                auto_tuner=auto_tuner,
+                limiter=limiter,
+                **kwargs,
+            )
+            return
+
+        hasher = None
+        part_hash = None
+        if streaming_signature:
+            part_hash = STREAMING_PAYLOAD
+        elif calculate_content_sha256:
+            hasher = partial(hash_in_executor, hash_executor)
+
+        if auto_tuner is not None:
+            # Parts of a resumed upload should be the same
+            auto_tuner.start(
+                workers_count, part_size,
+                max_chunk_size=part_size if checkpoint_path else None,
+            )
 
-    async def _parts_generator(
-        self, gen, workers_count: int, parts_queue: asyncio.Queue,
-    ) -> int:
-        part_no = 1
+        with open(file_path, "rb") as fp:
+            file_size = os.fstat(fp.fileno()).st_size
+            await self._multipart_upload(
+                str(object_name),
+                gen_file_parts(
+                    fp.fileno(), file_size, part_size, part_hash, auto_tuner,
+                ),
+                headers=headers,
+                workers_count=workers_count,
+                max_size=max_size,
+                part_upload_tries=part_upload_tries,
+                hasher=hasher,
+                checkpoint_path=checkpoint_path,
+                auto_tuner=auto_tuner,
+                limiter=limiter,
+                **kwargs,
+            )
+
+    async def _parts_generator(
+        self, gen, workers_count: int, parts_queue: asyncio.Queue,
+        hasher: t.Optional[Hasher] = None,
+        completed: t.Container[int] = (),
+    ) -> int:
+        part_no = 1
         async with gen:
             async for part_hash, part in gen:
+                if part_no > MAX_PARTS_COUNT:
+                    raise AwsUploadError(
+                        f"Multipart upload can't have more than "
+                        f"{MAX_PARTS_COUNT} parts, increase the part size",
+                    )
+                if part_no in completed:
+                    log.debug("Skipping uploaded part %d", part_no)
+                    if isinstance(part, PooledPart):
+                        part.release()
+                    part_no += 1
+                    continue
                 log.debug(
                     "Reading part %d (%d bytes)", part_no, len(part),
                 )
-                await parts_queue.put((part_no, part_hash, part))
+                await self._reserve_part(part)
+                try:
+                    if hasher is not None and is_buffered(part):
+                        # Hash is calculated in background, the uploader
+                        # awaits it right before sending the part
+                        part_hash = hasher(
+                            part.data if isinstance(part, PooledPart)
+                            else part,
+                        )
+                    await parts_queue.put((part_no, part_hash, part))
+                except BaseException:
+                    self._release_part(part)
+                    raise
                 part_no += 1
 
         for _ in range(workers_count):
@@ -431,20 +1387,30 @@ class S3Client:
     async def put_multipart(
         self,
         object_name: t.Union[str, Path],
-        content: t.Iterable[bytes],
+        content: t.Union[t.Iterable[bytes], t.AsyncIterable[bytes]],
         *,
         headers: t.Optional[HeadersType] = None,
         workers_count: int = 1,
         max_size: t.Optional[int] = None,
         part_upload_tries: int = 3,
         calculate_content_sha256: bool = True,
+        streaming_signature: bool = False,
+        hash_executor: t.Optional[Executor] = None,
+        checkpoint_path: t.Optional[t.Union[str, Path]] = None,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        limiter: t.Optional[asyncio.Semaphore] = None,
+        part_size: t.Optional[int] = None,
+        total_size: t.Optional[int] = None,
+        buffer_budget: t.Optional[int] = None,
         **kwargs,
     ) -> None:
         """
         Send data from iterable with multipart upload
 
         object_name: key in s3
-        data: any iterable that returns chunks of bytes
+        content: any iterable or async iterable that returns chunks
+            of bytes, async iterables are consumed on the loop and
+            iterables on a thread
         headers: additional headers, such as Content-Type
         workers_count: count of coroutines for asyncronous parts uploading
         max_size: maximum size of a queue with data to send (should be
@@ -452,21 +1418,168 @@ class S3Client:
         part_upload_tries: how many times trying to put part to s3 before fail
         calculate_content_sha256: whether to calculate sha256 hash of a part
             for integrity purposes
+        streaming_signature: sign each part chunk by chunk while it is
+            sent instead of hashing it beforehand
+        hash_executor: executor for calculating hashes of parts in parallel,
+            the loop's default executor is used if not passed
+        checkpoint_path: path to a journal of uploaded parts. If the journal
+            exists, the upload is resumed and only missing parts are sent.
+            The journal is removed after the upload is completed.
+        auto_tuner: tunes `workers_count` during the upload, parts are
+            chunks of `content`
+        limiter: semaphore which limits concurrent requests of several
+            uploads
+        part_size: coalesce chunks of `content` into parts of this size
+            using a pool of reusable buffers, otherwise each chunk is a part
+        total_size: known or estimated size of `content`, the part size is
+            planned to fit it in 10000 parts if `part_size` isn't passed
+        buffer_budget: maximal size in bytes of buffers of coalesced parts
+            of this upload, the part size is planned within it if
+            `part_size` isn't passed. Unlike `MemoryBudget` of the client,
+            which is shared by all transfers and waited for, it limits
+            the count of buffers allocated by the upload
         """
-        if workers_count < 1:
+        if part_size is not None and not (
+            MIN_PART_SIZE <= part_size <= MAX_PART_SIZE
+        ):
             raise ValueError(
-                f"Workers count should be > 0. Got {workers_count}",
+                f"Part size should be in [{MIN_PART_SIZE}, {MAX_PART_SIZE}]. "
+                f"Got {part_size}",
             )
-        max_size = max_size or workers_count
+        hasher = None
+        gen: t.Any
+        if isinstance(content, t.AsyncIterable):
+            gen = AsyncParts(
+                content, STREAMING_PAYLOAD if streaming_signature else None,
+            )
+        elif streaming_signature:
+            gen = gen_streaming(content)
+        else:
+            gen = gen_without_hash(content)
+        if calculate_content_sha256 and not streaming_signature:
+            hasher = partial(hash_in_executor, hash_executor)
+
+        if part_size is not None or total_size or buffer_budget:
+            gen = self._rechunked(
+                gen, part_size, total_size, buffer_budget,
+                auto_tuner.max_workers_count if auto_tuner else workers_count,
+                max_size or workers_count,
+            )
+
+        if auto_tuner is not None:
+            auto_tuner.start(workers_count)
 
-        upload_id = await self._create_multipart_upload(
+        # Chunks of the content are parts unless they are coalesced
+        kwargs.setdefault("checkpoint_source", {
+            "part_size": part_size,
+            "total_size": total_size,
+            "buffer_budget": buffer_budget,
+        })
+        await self._multipart_upload(
             str(object_name),
+            gen,
             headers=headers,
+            workers_count=workers_count,
+            max_size=max_size,
+            part_upload_tries=part_upload_tries,
+            hasher=hasher,
+            checkpoint_path=checkpoint_path,
+            auto_tuner=auto_tuner,
+            limiter=limiter,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _rechunked(
+        gen: t.Any,
+        part_size: t.Optional[int],
+        total_size: t.Optional[int],
+        buffer_budget: t.Optional[int],
+        workers_count: int,
+        max_size: int,
+    ) -> RechunkedParts:
+        # Buffers of parts which are uploaded, queued and being filled
+        buffers_count = workers_count + max_size + 1
+        if part_size is None:
+            part_size = plan_part_size(
+                total_size,
+                buffer_budget=buffer_budget,
+                buffers_count=buffers_count,
+            )
+        if buffer_budget is not None:
+            buffers_count = min(
+                buffers_count, max(buffer_budget // part_size, 1),
+            )
+        log.debug(
+            "Coalescing content into parts of %d bytes with %d buffers",
+            part_size, buffers_count,
         )
-        log.debug("Got upload id %s for %s", upload_id, object_name)
+        return RechunkedParts(gen, BufferPool(part_size, buffers_count))
+
+    async def _multipart_upload(
+        self,
+        object_name: str,
+        gen: t.Any,
+        *,
+        headers: t.Optional[HeadersType] = None,
+        workers_count: int = 1,
+        max_size: t.Optional[int] = None,
+        part_upload_tries: int = 3,
+        hasher: t.Optional[Hasher] = None,
+        checkpoint_path: t.Optional[t.Union[str, Path]] = None,
+        checkpoint_source: t.Optional[t.Mapping[str, t.Any]] = None,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        limiter: t.Optional[asyncio.Semaphore] = None,
+        priority: t.Optional[Priority] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Uploads parts produced by `gen` (an async iterator of
+        `(part_hash, part)` tuples) with `workers_count` uploaders.
+        `hasher` calculates hashes of parts when they're read.
+        `checkpoint_source` identifies the content and its split to parts
+        in the checkpoint, parts are reused only for the same source.
+        `auto_tuner` limits the count of uploading parts instead.
+        `limiter` limits the count of uploading parts of several uploads.
+        `priority` is the class of all requests of the upload, otherwise
+        parts are `BULK` and other requests are `INTERACTIVE`.
+        """
+        if workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {workers_count}",
+            )
+        max_size = max_size or workers_count
+        uploaders_count = workers_count
+        control_priority = Priority.INTERACTIVE
+        if priority is not None:
+            control_priority = kwargs["priority"] = priority
+        if auto_tuner is not None:
+            uploaders_count = auto_tuner.max_workers_count
+
+        checkpoint = None
+        upload_id = None
+        completed: t.Dict[int, str] = {}
+        if checkpoint_path is not None:
+            checkpoint = UploadCheckpoint(checkpoint_path)
+            upload_id, completed = await self._resume_multipart_upload(
+                object_name, checkpoint, checkpoint_source, control_priority,
+            )
+
+        if upload_id is None:
+            upload_id = await self._create_multipart_upload(
+                str(object_name),
+                headers=headers,
+                priority=control_priority,
+            )
+            log.debug("Got upload id %s for %s", upload_id, object_name)
+
+        if checkpoint is not None:
+            checkpoint.start(
+                upload_id, object_name, completed, checkpoint_source,
+            )
 
         parts_queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
-        results_queue: deque = deque()
+        results_queue: deque = deque(completed.items())
         workers = [
             asyncio.create_task(
                 self._part_uploader(
@@ -475,19 +1588,20 @@ class S3Client:
                     parts_queue,
                     results_queue,
                     part_upload_tries,
+                    hasher=hasher,
+                    checkpoint=checkpoint,
+                    auto_tuner=auto_tuner,
+                    limiter=limiter,
                     **kwargs,
                 ),
             )
-            for _ in range(workers_count)
+            for _ in range(uploaders_count)
         ]
 
-        if calculate_content_sha256:
-            gen = gen_with_hash(content)
-        else:
-            gen = gen_without_hash(content)
-
         parts_generator = asyncio.create_task(
-            self._parts_generator(gen, workers_count, parts_queue),
+            self._parts_generator(
+                gen, uploaders_count, parts_queue, hasher, completed,
+            ),
         )
         try:
             part_no, *_ = await asyncio.gather(
@@ -498,18 +1612,328 @@ class S3Client:
             for task in chain([parts_generator], workers):
                 if not task.done():
                     task.cancel()
+            # Parts of cancelled tasks are released before the error
+            await asyncio.gather(
+                parts_generator, *workers, return_exceptions=True,
+            )
+            if checkpoint is not None:
+                checkpoint.close()
+            self._release_queued_parts(parts_queue)
             raise
 
         log.debug(
             "All parts (#%d) of %s are uploaded to %s",
             part_no - 1, upload_id, object_name,
         )
+        if auto_tuner is not None:
+            log.info("Uploaded %s: %r", object_name, auto_tuner.report())
 
         # Parts should be in ascending order
         parts = sorted(results_queue, key=lambda x: x[0])
-        await self._complete_multipart_upload(
-            upload_id, object_name, parts,
+        try:
+            await self._complete_multipart_upload(
+                upload_id, object_name, parts, control_priority,
+            )
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        if checkpoint is not None:
+            checkpoint.remove()
+
+    async def _put_file_checked(
+        self, object_name: str, file_path: Path,
+        limiter: asyncio.Semaphore,
+        priority: Priority = Priority.BULK,
+    ) -> None:
+        async with limiter:
+            resp = await self.put_file(
+                object_name, file_path, priority=priority,
+            )
+        if resp.status_code != HTTPStatus.OK:
+            raise AwsUploadError(
+                f"Wrong status code {resp.status_code} from s3 with message "
+                f"{resp.content!r}.",
+            )
+
+    async def _sync_worker(
+        self,
+        files_queue: asyncio.Queue,
+        remote: t.Mapping[str, t.Tuple[int, str]],
+        result: SyncResult,
+        *,
+        bucket: t.Optional[str],
+        part_size: int,
+        workers_count: int,
+        upload_tries: int,
+        limiter: asyncio.Semaphore,
+        priority: Priority,
+    ) -> None:
+        put_file = asyncbackoff(
+            None, None, max_tries=upload_tries, exceptions=(HTTPError,),
+        )(self._put_file_checked)
+        while True:
+            local_file = await files_queue.get()
+            if local_file is DONE:
+                break
+            path, key, size = local_file
+            remote_size, etag = remote.get(key, (None, ""))
+            if remote_size == size and await threaded(etag_matches)(
+                path, etag, part_size,
+            ):
+                result.unchanged.append(key)
+                continue
+
+            object_name = f"{bucket}/{key}" if bucket is not None else key
+            log.debug("Uploading %s to %s", path, object_name)
+            if size <= part_size:
+                await put_file(object_name, path, limiter, priority)
+            else:
+                await self.put_file_multipart(
+                    object_name, path,
+                    part_size=part_size,
+                    workers_count=workers_count,
+                    part_upload_tries=upload_tries,
+                    limiter=limiter,
+                    priority=priority,
+                )
+            result.uploaded.append(key)
+
+    async def sync_directory(
+        self,
+        local_dir: t.Union[str, Path],
+        prefix: str = "",
+        *,
+        bucket: t.Optional[str] = None,
+        part_size: int = PART_SIZE,
+        workers_count: int = 8,
+        upload_tries: int = 3,
+        priority: Priority = Priority.BULK,
+    ) -> SyncResult:
+        """
+        Uploads files of `local_dir` which are missing or changed under
+        `prefix`. Files are compared with listed objects by the size and
+        ETag, which is calculated locally (for parts of `part_size` if the
+        object was uploaded with multipart upload). Files larger than
+        `part_size` are uploaded with multipart upload. Single uploads and
+        parts of all files share `workers_count` concurrent requests.
+
+        local_dir: directory which is uploaded
+        prefix: prefix of keys, the path of a file relative to `local_dir`
+            is appended to it
+        bucket: bucket name, it's a part of `prefix` if it isn't passed
+        part_size: size of parts of multipart uploads
+        workers_count: count of concurrent requests
+        upload_tries: how many times to try each upload or part
+        priority: class of requests for the scheduler
+        """
+        if workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {workers_count}",
+            )
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+
+        local_files = await walk_directory(Path(local_dir), prefix)
+        remote: t.Dict[str, t.Tuple[int, str]] = {}
+        async for columns in self.list_objects_columns(
+            bucket=bucket, prefix=prefix or None, priority=priority,
+        ):
+            remote.update(
+                zip(columns.keys(), zip(columns.sizes, columns.etags())),
+            )
+
+        result = SyncResult([], [])
+        files_queue: asyncio.Queue = asyncio.Queue()
+        for local_file in local_files:
+            files_queue.put_nowait(local_file)
+        limiter = asyncio.Semaphore(workers_count)
+        workers = [
+            asyncio.create_task(
+                self._sync_worker(
+                    files_queue, remote, result,
+                    bucket=bucket,
+                    part_size=part_size,
+                    workers_count=workers_count,
+                    upload_tries=upload_tries,
+                    limiter=limiter,
+                    priority=priority,
+                ),
+            )
+            for _ in range(min(workers_count, len(local_files)))
+        ]
+        for _ in workers:
+            files_queue.put_nowait(DONE)
+        await gather_or_cancel(workers)
+
+        log.info(
+            "Synced %s to %s: %d uploaded, %d unchanged",
+            local_dir, prefix, len(result.uploaded), len(result.unchanged),
+        )
+        result.uploaded.sort()
+        result.unchanged.sort()
+        return result
+
+    @staticmethod
+    def _copy_metadata_headers(resp: Response) -> t.Dict[str, str]:
+        """
+        Returns headers of the source object which are copied by
+        CopyObject, but should be passed to CreateMultipartUpload
+        """
+        copied = (
+            "Cache-Control", "Content-Disposition", HEADERS.CONTENT_ENCODING,
+            "Content-Language", HEADERS.CONTENT_TYPE, "Expires",
+        )
+        headers = {
+            name: resp.headers[name] for name in copied
+            if name in resp.headers
+        }
+        headers.update(
+            (name, value) for name, value in resp.headers.items()
+            if name.startswith("x-amz-meta-")
+        )
+        return headers
+
+    async def copy_object(
+        self,
+        src: t.Union[str, Path],
+        dst: t.Union[str, Path],
+        *,
+        headers: t.Optional[HeadersType] = None,
+        multipart_threshold: int = MAX_COPY_SIZE,
+        part_size: int = 64 * 1024 * 1024,
+        workers_count: int = 4,
+        part_copy_tries: int = 3,
+        priority: Priority = Priority.BULK,
+    ) -> None:
+        """
+        Copies the object on the server side. Objects up to
+        `multipart_threshold` are copied with a single request, larger
+        ones with multipart upload, which parts are copied from ranges
+        of the source with `workers_count` concurrent requests.
+        The source is copied only if it isn't changed during the copy.
+
+        src: source object as "bucket/key"
+        dst: key of the copy in s3
+        headers: headers of the copy, such as Content-Type and
+            x-amz-meta-*, they replace the metadata of the source,
+            which is kept if headers aren't passed
+        multipart_threshold: maximal size of an object copied with a single
+            request (5GB at most)
+        part_size: size of parts of multipart copy, it's increased to fit
+            the object in 10000 parts
+        workers_count: count of concurrent part copies
+        part_copy_tries: how many times to try to copy each part
+        priority: class of requests for the scheduler
+        """
+        source = quote(str(src).lstrip("/"), safe="/")
+        head = await self.head(str(src), priority=priority)
+        if head.status_code != HTTPStatus.OK:
+            raise AwsUploadError(
+                f"Got response for HEAD request for {src} "
+                f"of a wrong status {head.status_code}",
+            )
+        etag = head.headers["ETag"]
+        size = int(head.headers["Content-Length"])
+
+        if size <= min(multipart_threshold, MAX_COPY_SIZE):
+            copy_headers = dict(headers or {})
+            if headers:
+                # Metadata of the source is kept by default
+                copy_headers[HEADERS.METADATA_DIRECTIVE] = "REPLACE"
+            copy_headers[HEADERS.COPY_SOURCE] = source
+            copy_headers[HEADERS.COPY_SOURCE_IF_MATCH] = etag
+            resp = await self.put(
+                str(dst), content=None, headers=copy_headers,
+                content_sha256=EMPTY_STR_HASH, priority=priority,
+            )
+            self._copy_result_etag(resp, str(dst))
+            return
+
+        part_size = max(part_size, -(-size // MAX_PARTS_COUNT))
+        log.debug(
+            "Going to multipart copy %s (%d bytes) to %s with part size %d",
+            src, size, dst, part_size,
+        )
+        await self._multipart_upload(
+            str(dst),
+            gen_copy_parts(source, etag, size, part_size),
+            headers=headers or self._copy_metadata_headers(head),
+            workers_count=workers_count,
+            part_upload_tries=part_copy_tries,
+            priority=priority,
+        )
+
+    async def _abort_multipart_upload(
+        self, object_name: str, upload_id: str,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> None:
+        try:
+            resp = await self.delete(
+                object_name, params={"uploadId": upload_id},
+                priority=priority,
+            )
+        except HTTPError:
+            log.warning(
+                "Failed to abort upload %s of %s", upload_id, object_name,
+                exc_info=True,
+            )
+            return
+        if resp.status_code not in (
+            HTTPStatus.NO_CONTENT, HTTPStatus.NOT_FOUND,
+        ):
+            log.warning(
+                "Failed to abort upload %s of %s: status code %d",
+                upload_id, object_name, resp.status_code,
+            )
+
+    async def _resume_multipart_upload(
+        self, object_name: str, checkpoint: UploadCheckpoint,
+        source: t.Optional[t.Mapping[str, t.Any]] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.Tuple[t.Optional[str], t.Dict[int, str]]:
+        """
+        Returns upload id and parts which are uploaded according to both
+        the checkpoint and the server. The upload of the checkpoint is
+        aborted if it belongs to another object or `source`.
+        """
+        source = dict(source) if source is not None else None
+        state = checkpoint.load()
+        if state is None:
+            return None, {}
+        if state.object_name != object_name or state.source != source:
+            # Parts of another source or split another way can't be reused
+            log.warning(
+                "Checkpoint %s belongs to %s of %r, starting a new upload "
+                "of %s of %r",
+                checkpoint, state.object_name, state.source,
+                object_name, source,
+            )
+            await self._abort_multipart_upload(
+                state.object_name, state.upload_id, priority,
+            )
+            return None, {}
+
+        uploaded = await self._list_parts(
+            object_name, state.upload_id, priority,
+        )
+        if uploaded is None:
+            log.warning(
+                "Upload %s from %s doesn't exist, starting a new one",
+                state.upload_id, checkpoint,
+            )
+            return None, {}
+
+        # A part may be uploaded but not journaled, the server knows better
+        completed = {
+            part_no: etag for part_no, etag in uploaded.items()
+            if state.parts.get(part_no, etag) == etag
+        }
+        log.debug(
+            "Resuming upload %s of %s with %d uploaded parts",
+            state.upload_id, object_name, len(completed),
         )
+        return state.upload_id, completed
 
     async def _download_range(
         self,
@@ -523,6 +1947,7 @@ class S3Client:
         req_range_end: int,
         buffer_size: int,
         headers: t.Optional[HeadersType] = None,
+        priority: Priority = Priority.BULK,
         **kwargs,
     ) -> None:
         """
@@ -541,7 +1966,12 @@ class S3Client:
         headers["If-Match"] = etag
 
         pos = req_range_start
-        resp = await self.get(object_name, headers=headers, **kwargs)
+        resp = await self.get(
+            object_name, headers=headers, priority=priority, **kwargs,
+        )
+        if resp.status_code == HTTPStatus.PRECONDITION_FAILED:
+            # The object is changed, its cached ETag is outdated
+            self._invalidate(object_name)
         if resp.status_code not in (HTTPStatus.PARTIAL_CONTENT, HTTPStatus.OK):
             raise AwsDownloadError(
                 f"Got wrong status code {resp.status_code} on range download "
@@ -559,46 +1989,93 @@ class S3Client:
         writer: t.Callable[[bytes, int, int], t.Coroutine],
         *,
         etag: str,
-        range_step: int,
-        range_start: int,
-        range_end: int,
+        ranges: t.Iterator[t.Tuple[int, int]],
         buffer_size: int,
         range_get_tries: int = 3,
         headers: t.Optional[HeadersType] = None,
+        on_range_done: t.Optional[t.Callable[[int, int], None]] = None,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        limiter: t.Optional[asyncio.Semaphore] = None,
         **kwargs,
     ) -> None:
         """
-        Downloads data in range `[range_start, range_end)`
-        with step `range_step` to file `file_path`.
+        Downloads ranges of `[start, end)` taken from `ranges`, which is
+        shared by all workers, so an idle worker takes the next range.
         Uses `etag` to make sure that file wasn't changed in the process.
+        `limiter` limits the count of downloading ranges of several objects.
         """
-        log.debug(
-            "Starting download worker for range [%d:%d]",
-            range_start,
-            range_end,
-        )
         backoff = asyncbackoff(
             None, None,
             max_tries=range_get_tries,
             exceptions=(HTTPError,),
         )
-        req_range_end = range_start
-        for req_range_start in range(range_start, range_end, range_step):
-            req_range_end += range_step
-            if req_range_end > range_end:
-                req_range_end = range_end
-            await backoff(self._download_range)(
-                object_name,
-                writer,
-                etag=etag,
-                pos=(req_range_start - range_start),
-                range_start=range_start,
-                req_range_start=req_range_start,
-                req_range_end=req_range_end - 1,
-                buffer_size=buffer_size,
-                headers=headers,
-                **kwargs,
+        while True:
+            async with slot(auto_tuner):
+                req_range = next(ranges, None)
+                if req_range is None:
+                    return
+                req_range_start, req_range_end = req_range
+                download_range = backoff(
+                    self._hedged(
+                        self._download_range,
+                        req_range_end - req_range_start,
+                        buffered=True,
+                    ),
+                )
+                async with reserve(
+                    self._memory_budget, req_range_end - req_range_start,
+                ), slot(limiter):
+                    with sample(auto_tuner, req_range_end - req_range_start):
+                        await download_range(
+                            object_name,
+                            writer,
+                            etag=etag,
+                            pos=req_range_start,
+                            range_start=0,
+                            req_range_start=req_range_start,
+                            req_range_end=req_range_end - 1,
+                            buffer_size=buffer_size,
+                            headers=headers,
+                            **kwargs,
+                        )
+            if on_range_done is not None:
+                on_range_done(req_range_start, req_range_end)
+
+    async def _download_ranges(
+        self,
+        object_name: str,
+        writer: t.Callable[[bytes, int, int], t.Coroutine],
+        *,
+        ranges: t.Iterable[t.Tuple[int, int]],
+        workers_count: int,
+        auto_tuner: t.Optional[AutoTuner] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Downloads `ranges` with up to `workers_count` workers, which take
+        ranges from the shared iterator. `auto_tuner` limits the count
+        of downloading ranges instead.
+        """
+        if auto_tuner is not None:
+            workers_count = auto_tuner.max_workers_count
+        if isinstance(ranges, t.Sized):
+            workers_count = min(workers_count, len(ranges))
+        ranges_iter = iter(ranges)
+        workers = [
+            asyncio.create_task(
+                self._download_worker(
+                    object_name, writer, ranges=ranges_iter,
+                    auto_tuner=auto_tuner, **kwargs,
+                ),
             )
+            for _ in range(workers_count)
+        ]
+        log.debug(
+            "Downloading %s with %d workers", object_name, len(workers),
+        )
+        await gather_or_cancel(workers)
+        if auto_tuner is not None:
+            log.info("Downloaded %s: %r", object_name, auto_tuner.report())
 
     async def get_file_parallel(
         self,
@@ -610,6 +2087,9 @@ class S3Client:
         workers_count: int = 1,
         range_get_tries: int = 3,
         buffer_size: int = PAGESIZE * 32,
+        min_range_size: int = MIN_RANGE_SIZE,
+        resume: bool = False,
+        auto_tuner: t.Optional[AutoTuner] = None,
         **kwargs,
     ) -> None:
         """
@@ -624,74 +2104,627 @@ class S3Client:
         workers_count: count of parallel workers
         range_get_tries: count of tries to download each range
         buffer_size: size of a buffer for on the fly data
+        min_range_size: objects smaller than `workers_count * range_step`
+            are split to smaller ranges, but not smaller than this
+        resume: keep the incomplete file and a sidecar with downloaded ranges
+            on error, so the next call with `resume=True` downloads only
+            missing ranges
+        auto_tuner: tunes `workers_count` and `range_step` (if the download
+            isn't resumable) during the download
         """
         file_path = Path(file_path)
-        resp = await self.head(str(object_name), headers=headers)
+        etag, file_size, object_headers = await self._head_object(
+            str(object_name), headers=headers,
+            priority=kwargs.get("priority", Priority.BULK),
+        )
+        cache = self._content_cache if not headers else None
+        if cache is not None and await cache.copy_to(
+            self._cache_key(object_name), etag, file_path,
+        ):
+            log.debug("Object %s is copied from the cache", object_name)
+            return
+
+        checkpoint = None
+        file_mode = "w+b"
+        ranges: t.Iterable[t.Tuple[int, int]]
+        on_range_done = None
+        if resume:
+            # Ranges should be the same for the next try
+            checkpoint = self._load_download_checkpoint(
+                file_path, etag=etag, size=file_size, range_step=range_step,
+            )
+            if checkpoint.completed_count:
+                file_mode = "r+b"
+            ranges = [
+                (start, end)
+                for start, end in split_ranges(file_size, range_step)
+                if not checkpoint.is_completed(start // range_step)
+            ]
+            on_range_done = partial(self._on_range_done, checkpoint)
+            if auto_tuner is not None:
+                auto_tuner.start(workers_count)
+        elif auto_tuner is not None:
+            auto_tuner.start(
+                workers_count, range_step,
+                min_chunk_size=min(range_step, min_range_size),
+            )
+            ranges = iter_ranges(file_size, auto_tuner)
+        else:
+            ranges = split_ranges(
+                file_size,
+                plan_range_step(
+                    file_size, range_step, workers_count, min_range_size,
+                ),
+            )
+
+        try:
+            with file_path.open(file_mode) as fp:
+                if hasattr(os, "pwrite"):
+                    writer = partial(pwrite_absolute_pos, fp.fileno())
+                else:
+                    writer = partial(write_locked, fp, threading.Lock())
+                await self._download_ranges(
+                    str(object_name),
+                    writer,  # type: ignore
+                    ranges=ranges,
+                    workers_count=workers_count,
+                    buffer_size=buffer_size,
+                    etag=etag,
+                    headers=headers,
+                    range_get_tries=range_get_tries,
+                    on_range_done=on_range_done,
+                    auto_tuner=auto_tuner,
+                    **kwargs,
+                )
+        except Exception:
+            if checkpoint is not None:
+                log.exception(
+                    "Error on file download. Incomplete file %s "
+                    "may be resumed with %s",
+                    file_path, checkpoint,
+                )
+                raise
+            log.exception(
+                "Error on file download. Removing possibly incomplete file %s",
+                file_path,
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(file_path)
+            raise
+
+        if checkpoint is not None:
+            checkpoint.remove()
+        if cache is not None:
+            await cache.store_file(
+                self._cache_key(object_name), etag, file_path,
+                object_headers,
+            )
+
+    async def _download_object(
+        self,
+        object_name: str,
+        file_path: Path,
+        *,
+        etag: str,
+        size: int,
+        range_step: int,
+        workers_count: int,
+        **kwargs,
+    ) -> None:
+        """
+        Downloads the object of known `etag` and `size` into a temporary
+        file, which replaces `file_path` when the download is completed
+        """
+        # The name is unique, so it doesn't collide with downloaded keys
+        fp = NamedTemporaryFile(
+            dir=file_path.parent, prefix=f".{file_path.name}.",
+            suffix=".part", delete=False,
+        )
+        tmp_path = fp.name
+        try:
+            with fp:
+                if hasattr(os, "pwrite"):
+                    writer = partial(pwrite_absolute_pos, fp.fileno())
+                else:
+                    writer = partial(write_locked, fp, threading.Lock())
+                await self._download_ranges(
+                    object_name,
+                    writer,  # type: ignore
+                    ranges=split_ranges(size, range_step),
+                    workers_count=workers_count,
+                    etag=etag,
+                    **kwargs,
+                )
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+    async def _list_to_queue(
+        self,
+        objects_queue: asyncio.Queue,
+        workers_count: int,
+        **kwargs,
+    ) -> None:
+        async for objects in self.list_objects_v2(**kwargs):
+            for meta in objects:
+                await objects_queue.put(meta)
+        for _ in range(workers_count):
+            await objects_queue.put(DONE)
+
+    async def _download_prefix_worker(
+        self,
+        objects_queue: asyncio.Queue,
+        result: DownloadResult,
+        *,
+        local_dir: Path,
+        prefix: str,
+        bucket: t.Optional[str],
+        part_size: int,
+        **kwargs,
+    ) -> None:
+        while True:
+            meta = await objects_queue.get()
+            if meta is DONE:
+                break
+            name = meta.key[len(prefix):].lstrip("/")
+            if not name or name.endswith("/"):
+                # Directory placeholder
+                continue
+            file_path = (local_dir / name).resolve()
+            if local_dir not in file_path.parents:
+                log.warning("Skipping %s outside of %s", meta.key, local_dir)
+                continue
+
+            if (
+                file_path.is_file() and
+                file_path.stat().st_size == meta.size and
+                await threaded(etag_matches)(file_path, meta.etag, part_size)
+            ):
+                result.unchanged.append(meta.key)
+                continue
+
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            object_name = (
+                f"{bucket}/{meta.key}" if bucket is not None else meta.key
+            )
+            log.debug("Downloading %s to %s", object_name, file_path)
+            await self._download_object(
+                object_name, file_path, etag=meta.etag, size=meta.size,
+                **kwargs,
+            )
+            result.downloaded.append(meta.key)
+
+    async def download_prefix(
+        self,
+        prefix: str,
+        local_dir: t.Union[str, Path],
+        *,
+        bucket: t.Optional[str] = None,
+        range_step: int = PART_SIZE,
+        part_size: int = PART_SIZE,
+        workers_count: int = 8,
+        range_get_tries: int = 3,
+        buffer_size: int = PAGESIZE * 32,
+        priority: Priority = Priority.BULK,
+    ) -> DownloadResult:
+        """
+        Downloads objects of `prefix` into `local_dir` while they're
+        listed. Size and ETag are taken from the listing, so there are no
+        HEAD requests. Objects up to `range_step` are downloaded with
+        a single request, larger ones with parallel requests with Range.
+        Requests of all objects share `workers_count` concurrent requests.
+        Files of the same size and ETag (for parts of `part_size` if
+        the object was uploaded with multipart upload) aren't downloaded.
+
+        prefix: prefix of keys, the rest of a key is the path of a file
+            relative to `local_dir`. It's a directory, so "data" matches
+            "data/file", but not "database/file"
+        local_dir: target directory
+        bucket: bucket name, it's a part of `prefix` if it isn't passed
+        range_step: how much data will be downloaded in single HTTP request
+        part_size: part size of multipart uploads for ETag comparison
+        workers_count: count of concurrent requests
+        range_get_tries: count of tries to download each range
+        buffer_size: size of a buffer for on the fly data
+        priority: class of requests for the scheduler
+        """
+        if workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {workers_count}",
+            )
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        local_dir = Path(local_dir).resolve()
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        result = DownloadResult([], [])
+        objects_queue: asyncio.Queue = asyncio.Queue(maxsize=workers_count * 2)
+        limiter = asyncio.Semaphore(workers_count)
+        tasks = [
+            asyncio.create_task(
+                self._list_to_queue(
+                    objects_queue, workers_count,
+                    bucket=bucket, prefix=prefix or None, priority=priority,
+                ),
+            ),
+        ]
+        tasks.extend(
+            asyncio.create_task(
+                self._download_prefix_worker(
+                    objects_queue, result,
+                    local_dir=local_dir,
+                    prefix=prefix,
+                    bucket=bucket,
+                    part_size=part_size,
+                    range_step=range_step,
+                    workers_count=workers_count,
+                    range_get_tries=range_get_tries,
+                    buffer_size=buffer_size,
+                    limiter=limiter,
+                    priority=priority,
+                ),
+            )
+            for _ in range(workers_count)
+        )
+        await gather_or_cancel(tasks)
+
+        log.info(
+            "Downloaded %s to %s: %d downloaded, %d unchanged",
+            prefix, local_dir, len(result.downloaded), len(result.unchanged),
+        )
+        result.downloaded.sort()
+        result.unchanged.sort()
+        return result
+
+    async def get_into(
+        self,
+        object_name: t.Union[str, Path],
+        buffer: t.Union[bytearray, memoryview],
+        *,
+        headers: t.Optional[HeadersType] = None,
+        range_step: int = PART_SIZE,
+        workers_count: int = 1,
+        range_get_tries: int = 3,
+        buffer_size: int = PAGESIZE * 32,
+        min_range_size: int = MIN_RANGE_SIZE,
+        **kwargs,
+    ) -> int:
+        """
+        Download object in parallel with requests with Range into
+        the writable `buffer`. Returns size of the object.
+
+        object_name: s3 key to download
+        buffer: writable buffer, at least of the object's size
+        headers: additional headers
+        range_step: how much data will be downloaded in single HTTP request
+        workers_count: count of parallel workers
+        range_get_tries: count of tries to download each range
+        buffer_size: size of a buffer for on the fly data
+        min_range_size: objects smaller than `workers_count * range_step`
+            are split to smaller ranges, but not smaller than this
+        """
+        etag, size, _ = await self._head_object(
+            str(object_name), headers=headers,
+            priority=kwargs.get("priority", Priority.BULK),
+        )
+        view = memoryview(buffer).cast("B")
+        if len(view) < size:
+            raise ValueError(
+                f"Buffer of {len(view)} bytes is too small "
+                f"for {object_name} of {size} bytes",
+            )
+        await self._download_into(
+            str(object_name), view[:size],
+            etag=etag,
+            headers=headers,
+            range_step=range_step,
+            workers_count=workers_count,
+            range_get_tries=range_get_tries,
+            buffer_size=buffer_size,
+            min_range_size=min_range_size,
+            **kwargs,
+        )
+        return size
+
+    async def get_bytes_parallel(
+        self,
+        object_name: t.Union[str, Path],
+        *,
+        headers: t.Optional[HeadersType] = None,
+        range_step: int = PART_SIZE,
+        workers_count: int = 1,
+        range_get_tries: int = 3,
+        buffer_size: int = PAGESIZE * 32,
+        min_range_size: int = MIN_RANGE_SIZE,
+        **kwargs,
+    ) -> bytearray:
+        """
+        Download object in parallel with requests with Range into memory.
+        Ranges are written right into the returned `bytearray`.
+
+        object_name: s3 key to download
+        headers: additional headers
+        range_step: how much data will be downloaded in single HTTP request
+        workers_count: count of parallel workers
+        range_get_tries: count of tries to download each range
+        buffer_size: size of a buffer for on the fly data
+        min_range_size: objects smaller than `workers_count * range_step`
+            are split to smaller ranges, but not smaller than this
+        """
+        etag, size, _ = await self._head_object(
+            str(object_name), headers=headers,
+            priority=kwargs.get("priority", Priority.BULK),
+        )
+        result = bytearray(size)
+        await self._download_into(
+            str(object_name), memoryview(result),
+            etag=etag,
+            headers=headers,
+            range_step=range_step,
+            workers_count=workers_count,
+            range_get_tries=range_get_tries,
+            buffer_size=buffer_size,
+            min_range_size=min_range_size,
+            **kwargs,
+        )
+        return result
+
+    async def _download_into(
+        self,
+        object_name: str,
+        view: memoryview,
+        *,
+        range_step: int,
+        workers_count: int,
+        min_range_size: int,
+        **kwargs,
+    ) -> None:
+        range_step = plan_range_step(
+            len(view), range_step, workers_count, min_range_size,
+        )
+        await self._download_ranges(
+            object_name,
+            partial(write_into_buffer, view),
+            ranges=split_ranges(len(view), range_step),
+            workers_count=workers_count,
+            **kwargs,
+        )
+
+    async def iter_object_parallel(
+        self,
+        object_name: t.Union[str, Path],
+        *,
+        headers: t.Optional[HeadersType] = None,
+        range_step: int = PART_SIZE,
+        window: int = 4,
+        range_get_tries: int = 3,
+        buffer_size: int = PAGESIZE * 32,
+        **kwargs,
+    ) -> t.AsyncGenerator[bytearray, None]:
+        """
+        Download object in parallel with requests with Range and yield
+        its ranges strictly in order. Up to `window` ranges are downloaded
+        ahead, so at most about `window * range_step` bytes are buffered.
+        If object will change while download is in progress -
+            error will be raised.
+
+        object_name: s3 key to download
+        headers: additional headers
+        range_step: how much data will be downloaded in single HTTP request
+        window: count of ranges downloaded concurrently ahead of the consumer
+        range_get_tries: count of tries to download each range
+        buffer_size: size of a buffer for on the fly data
+        """
+        if window < 1:
+            raise ValueError(f"Window should be > 0. Got {window}")
+
+        etag, size, _ = await self._head_object(
+            str(object_name), headers=headers,
+            priority=kwargs.get("priority", Priority.BULK),
+        )
+        ranges = iter(split_ranges(size, range_step))
+        backoff = asyncbackoff(
+            None, None,
+            max_tries=range_get_tries,
+            exceptions=(HTTPError,),
+        )
+
+        budget = self._memory_budget
+
+        async def fetch(range_start: int, range_end: int) -> bytearray:
+            """
+            Downloads the range, its reservation is kept until the range
+            is consumed
+            """
+            size = range_end - range_start
+            if budget is not None:
+                await budget.acquire(size)
+            try:
+                result = bytearray(size)
+                with memoryview(result) as view:
+                    download_range = self._hedged(
+                        self._download_range, size, buffered=True,
+                    )
+                    await backoff(download_range)(
+                        str(object_name),
+                        partial(write_into_range, view),
+                        etag=etag,
+                        pos=0,
+                        range_start=range_start,
+                        req_range_start=range_start,
+                        req_range_end=range_end - 1,
+                        buffer_size=buffer_size,
+                        headers=headers,
+                        **kwargs,
+                    )
+            except BaseException:
+                if budget is not None:
+                    budget.release(size)
+                raise
+            return result
+
+        pending: t.Deque[asyncio.Task] = deque(
+            asyncio.create_task(fetch(*item))
+            for item in islice(ranges, window)
+        )
+        try:
+            while pending:
+                # The task is kept in `pending` until its range is taken,
+                # so the reservation is released if the await is cancelled
+                data = await pending[0]
+                pending.popleft()
+                for item in islice(ranges, 1):
+                    pending.append(asyncio.create_task(fetch(*item)))
+                try:
+                    yield data
+                finally:
+                    if budget is not None:
+                        budget.release(len(data))
+        finally:
+            for task in pending:
+                task.cancel()
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if budget is not None and isinstance(result, bytearray):
+                    budget.release(len(result))
+
+    async def _head_object(
+        self, object_name: str, headers: t.Optional[HeadersType] = None,
+        priority: Priority = Priority.BULK,
+    ) -> t.Tuple[str, int, Headers]:
+        """
+        Returns ETag, size and headers of the object, HEAD request is
+        of the same class as ranges of the download
+        """
+        resp = await self.head(
+            object_name, headers=headers, priority=priority,
+        )
         if resp.status_code != HTTPStatus.OK:
             raise AwsDownloadError(
                 f"Got response for HEAD request for {object_name}"
                 f"of a wrong status {resp.status_code}",
             )
         etag = resp.headers["Etag"]
-        file_size = int(resp.headers["Content-Length"])
+        size = int(resp.headers["Content-Length"])
         log.debug(
             "Object's %s etag is %s and size is %d",
             object_name,
             etag,
-            file_size,
+            size,
         )
+        return etag, size, resp.headers
 
-        workers = []
-        files: t.List[t.IO[bytes]] = []
-        worker_range_size = file_size // workers_count
-        range_end = 0
-        file: t.IO[bytes]
-        try:
-            with file_path.open("w+b") as fp:
-                for range_start in range(0, file_size, worker_range_size):
-                    range_end += worker_range_size
-                    if range_end > file_size:
-                        range_end = file_size
-                    if hasattr(os, "pwrite"):
-                        writer = partial(pwrite_absolute_pos, fp.fileno())
-                    else:
-                        if range_start:
-                            file = NamedTemporaryFile(dir=file_path.parent)
-                            files.append(file)
-                        else:
-                            file = fp
-                        writer = partial(write_from_start, file)
-                    workers.append(
-                        self._download_worker(
-                            str(object_name),
-                            writer,  # type: ignore
-                            buffer_size=buffer_size,
-                            etag=etag,
-                            headers=headers,
-                            range_end=range_end,
-                            range_get_tries=range_get_tries,
-                            range_start=range_start,
-                            range_step=range_step,
-                            **kwargs,
-                        ),
-                    )
+    @staticmethod
+    def _load_download_checkpoint(
+        file_path: Path, *, etag: str, size: int, range_step: int,
+    ) -> DownloadCheckpoint:
+        checkpoint = DownloadCheckpoint(
+            file_path.with_name(file_path.name + ".download"),
+            etag=etag, size=size, range_step=range_step,
+        )
+        if not checkpoint.load() or not file_path.exists():
+            checkpoint.bitmap = bytearray(len(checkpoint.bitmap))
+            return checkpoint
+        log.debug(
+            "Resuming download to %s, %d of %d ranges are done",
+            file_path, checkpoint.completed_count, checkpoint.blocks_count,
+        )
+        return checkpoint
+
+    @staticmethod
+    def _on_range_done(
+        checkpoint: DownloadCheckpoint, range_start: int, range_end: int,
+    ) -> None:
+        checkpoint.mark_completed(range_start // checkpoint.range_step)
+        checkpoint.save()
+
+    @staticmethod
+    def _list_objects_params(
+        prefix: t.Optional[t.Union[str, Path]] = None,
+        delimiter: t.Optional[str] = None,
+        max_keys: t.Optional[int] = None,
+        start_after: t.Optional[str] = None,
+    ) -> t.Dict[str, str]:
+        params = {
+            "list-type": "2",
+        }
 
-                await asyncio.gather(*workers)
+        if prefix:
+            params["prefix"] = str(prefix)
 
-            if files:
-                # First part already in `file_path`
-                log.debug("Joining %d parts to %s", len(files) + 1, file_path)
-                await concat_files(
-                    file_path, files, buffer_size=buffer_size,
+        if delimiter:
+            params["delimiter"] = delimiter
+
+        if max_keys:
+            params["max-keys"] = str(max_keys)
+
+        if start_after:
+            params["start-after"] = start_after
+
+        return params
+
+    async def _list_objects_response(
+        self,
+        object_name: str,
+        params: t.Dict[str, str],
+        parser: ListObjectsParser,
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.AsyncIterator[ListObjectsPage]:
+        """
+        Yields objects and common prefixes of a single ListObjectsV2
+        response, which is parsed while the response body is received.
+        Fragments are yielded after the response is closed, so the
+        connection and the slot of the scheduler aren't held while
+        the consumer handles them.
+        """
+        feed = threaded(parser.feed) if parse_in_thread else None
+        fragments: t.List[ListObjectsPage] = []
+        async with self.stream(
+            "GET", object_name, params=params, priority=priority,
+        ) as resp:
+            if resp.status_code != HTTPStatus.OK:
+                await resp.aread()
+                raise AwsDownloadError(
+                    f"Got response with wrong status for GET request for "
+                    f"{object_name} with prefix '{params.get('prefix')}'",
                 )
-        except Exception:
-            log.exception(
-                "Error on file download. Removing possibly incomplete file %s",
-                file_path,
-            )
-            with suppress(FileNotFoundError):
-                os.unlink(file_path)
-            raise
+            async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                if feed is not None:
+                    fragment = await feed(chunk)
+                else:
+                    fragment = parser.feed(chunk)
+                if fragment.objects or fragment.common_prefixes:
+                    fragments.append(fragment)
+        fragments.append(parser.close())
+        for fragment in fragments:
+            if fragment.objects or fragment.common_prefixes:
+                yield fragment
+
+    async def _list_objects_pages(
+        self,
+        object_name: str,
+        params: t.Dict[str, str],
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.AsyncIterator[ListObjectsPage]:
+        params = dict(params)
+        while True:
+            parser = ListObjectsParser()
+            objects: t.List[AwsObjectMeta] = []
+            common_prefixes: t.List[str] = []
+            async for fragment in self._list_objects_response(
+                object_name, params, parser, parse_in_thread, priority,
+            ):
+                objects.extend(fragment.objects)
+                common_prefixes.extend(fragment.common_prefixes)
+            if objects or common_prefixes:
+                yield ListObjectsPage(objects, common_prefixes)
+            if not parser.continuation_token:
+                break
+            params["continuation-token"] = parser.continuation_token
 
     async def list_objects_v2(
         self,
@@ -702,6 +2735,8 @@ class S3Client:
         delimiter: t.Optional[str] = None,
         max_keys: t.Optional[int] = None,
         start_after: t.Optional[str] = None,
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> t.AsyncIterator[t.List[AwsObjectMeta]]:
         """
         List objects in bucket.
@@ -718,39 +2753,279 @@ class S3Client:
         delimiter: a delimiter is a character you use to group keys
         max_keys: maximum number of keys returned in the response
         start_after: keys to start listing after
+        parse_in_thread: parse responses in a thread instead of the loop
+        priority: class of requests for the scheduler
         """
+        async for page in self.list_objects_v2_pages(
+            object_name,
+            bucket=bucket,
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            start_after=start_after,
+            parse_in_thread=parse_in_thread,
+            priority=priority,
+        ):
+            if page.objects:
+                # Pages are built of lists by `_list_objects_pages`
+                yield t.cast(t.List[AwsObjectMeta], page.objects)
+
+    async def list_objects_v2_pages(
+        self,
+        object_name: t.Union[str, Path] = "/",
+        *,
+        bucket: t.Optional[str] = None,
+        prefix: t.Optional[t.Union[str, Path]] = None,
+        delimiter: t.Optional[str] = None,
+        max_keys: t.Optional[int] = None,
+        start_after: t.Optional[str] = None,
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.AsyncIterator[ListObjectsPage]:
+        """
+        List objects in bucket like `list_objects_v2`, but returns
+        an iterator over pages with metadata objects and common prefixes
+        (keys grouped by `delimiter`).
+        """
+        if bucket is not None:
+            object_name = f"/{bucket}"
 
-        params = {
-            "list-type": "2",
-        }
-
-        if prefix:
-            params["prefix"] = str(prefix)
+        params = self._list_objects_params(
+            prefix, delimiter, max_keys, start_after,
+        )
+        async for page in self._list_objects_pages(
+            str(object_name), params, parse_in_thread, priority,
+        ):
+            yield page
 
-        if delimiter:
-            params["delimiter"] = delimiter
+    async def iter_objects_v2(
+        self,
+        object_name: t.Union[str, Path] = "/",
+        *,
+        bucket: t.Optional[str] = None,
+        prefix: t.Optional[t.Union[str, Path]] = None,
+        max_keys: t.Optional[int] = None,
+        start_after: t.Optional[str] = None,
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.AsyncIterator[AwsObjectMeta]:
+        """
+        List objects in bucket like `list_objects_v2`, but returns
+        an iterator over metadata objects, which are yielded one by one
+        after each response is received.
 
-        if max_keys:
-            params["max-keys"] = str(max_keys)
+        parse_in_thread: parse responses in a thread instead of the loop,
+            it's worth it for large pages (`max_keys` is large)
+        priority: class of requests for the scheduler
+        """
+        if bucket is not None:
+            object_name = f"/{bucket}"
 
-        if start_after:
-            params["start-after"] = start_after
+        params = self._list_objects_params(
+            prefix, None, max_keys, start_after,
+        )
+        while True:
+            parser = ListObjectsParser()
+            async for fragment in self._list_objects_response(
+                str(object_name), params, parser, parse_in_thread, priority,
+            ):
+                for meta in fragment.objects:
+                    yield meta
+            if not parser.continuation_token:
+                break
+            params["continuation-token"] = parser.continuation_token
 
+    async def list_objects_columns(
+        self,
+        object_name: t.Union[str, Path] = "/",
+        *,
+        bucket: t.Optional[str] = None,
+        prefix: t.Optional[t.Union[str, Path]] = None,
+        max_keys: t.Optional[int] = None,
+        start_after: t.Optional[str] = None,
+        parse_in_thread: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> t.AsyncIterator[ObjectColumns]:
+        """
+        List objects in bucket like `list_objects_v2`, but returns
+        an iterator over `ObjectColumns`, each corresponding to an
+        individual response. Columns take several times less memory than
+        lists of metadata objects, which are created only on access.
+        """
         if bucket is not None:
             object_name = f"/{bucket}"
 
+        params = self._list_objects_params(
+            prefix, None, max_keys, start_after,
+        )
         while True:
-            resp = await self.get(str(object_name), params=params)
-            if resp.status_code != HTTPStatus.OK:
-                raise AwsDownloadError(
-                    f"Got response with wrong status for GET request for "
-                    f"{object_name} with prefix '{prefix}'",
-                )
-            payload = resp.content
-            metadata, continuation_token = parse_list_objects(payload)
-            if not metadata:
-                break
-            yield metadata
-            if not continuation_token:
+            parser = ListObjectsColumnsParser()
+            columns = ObjectColumns()
+            async for fragment in self._list_objects_response(
+                str(object_name), params, parser, parse_in_thread, priority,
+            ):
+                columns.extend(fragment.objects)
+            if columns:
+                yield columns
+            if not parser.continuation_token:
                 break
-            params["continuation-token"] = continuation_token
+            params["continuation-token"] = parser.continuation_token
+
+    async def _list_shard(
+        self,
+        object_name: str,
+        shard: ListShard,
+        *,
+        shards: asyncio.Queue,
+        results: asyncio.Queue,
+        delimiter: str,
+        depth: int,
+        max_keys: t.Optional[int],
+        priority: Priority,
+    ) -> None:
+        """
+        Lists keys of the shard. Common prefixes of shards which are less
+        than `depth` deep are listed as separate shards.
+        """
+        params = self._list_objects_params(
+            shard.prefix,
+            delimiter if shard.depth < depth else None,
+            max_keys,
+            shard.start_after,
+        )
+        async for page in self._list_objects_pages(
+            object_name, params, priority=priority,
+        ):
+            for common_prefix in page.common_prefixes:
+                shards.put_nowait(ListShard(common_prefix, shard.depth + 1))
+            objects = page.objects
+            if shard.end is not None and objects and objects[-1].key > shard.end:
+                objects = [meta for meta in objects if meta.key <= shard.end]
+                if objects:
+                    await results.put(objects)
+                return
+            if objects:
+                await results.put(objects)
+
+    async def _list_shards_worker(
+        self, object_name: str, shards: asyncio.Queue, **kwargs,
+    ) -> None:
+        while True:
+            shard = await shards.get()
+            try:
+                await self._list_shard(
+                    object_name, shard, shards=shards, **kwargs,
+                )
+            finally:
+                shards.task_done()
+
+    async def _list_shards(
+        self,
+        object_name: str,
+        shards: asyncio.Queue,
+        results: asyncio.Queue,
+        workers_count: int,
+        **kwargs,
+    ) -> None:
+        workers = [
+            asyncio.create_task(
+                self._list_shards_worker(
+                    object_name, shards, results=results, **kwargs,
+                ),
+            )
+            for _ in range(workers_count)
+        ]
+        joined = asyncio.create_task(shards.join())
+        try:
+            # Workers are stopped only by errors
+            await asyncio.wait(
+                [joined, *workers], return_when=asyncio.FIRST_COMPLETED,
+            )
+            for worker in workers:
+                if worker.done():
+                    worker.result()
+        except Exception as e:
+            await results.put(e)
+        else:
+            await results.put(DONE)
+        finally:
+            for task in (joined, *workers):
+                task.cancel()
+            await asyncio.gather(joined, *workers, return_exceptions=True)
+
+    async def list_objects_parallel(
+        self,
+        object_name: t.Union[str, Path] = "/",
+        *,
+        bucket: t.Optional[str] = None,
+        prefix: t.Optional[t.Union[str, Path]] = None,
+        delimiter: str = "/",
+        depth: int = 1,
+        split_points: t.Optional[t.Sequence[str]] = None,
+        workers_count: int = 8,
+        max_keys: t.Optional[int] = None,
+        priority: Priority = Priority.BULK,
+    ) -> t.AsyncIterator[t.List[AwsObjectMeta]]:
+        """
+        List all objects in bucket with concurrent requests.
+
+        Keys are split into shards, which are listed by `workers_count`
+        workers. Shards are common prefixes of keys discovered by listing
+        with `delimiter` up to `depth` levels deep, or ranges of keys between
+        `split_points` if they're passed. Returns an iterator over lists
+        of metadata objects of shards in the order they're listed, keys
+        of different shards are not sorted.
+
+        object_name:
+            path to listing endpoint, defaults to '/'; a `bucket` value is
+            prepended to this value if provided.
+        prefix:
+            limits the response to keys that begin with the specified
+            prefix
+        delimiter: a character which splits keys to sub-trees
+        depth: count of levels of sub-trees which are listed in parallel
+        split_points: sorted keys which split keys to ranges
+        workers_count: count of concurrent requests
+        max_keys: maximum number of keys returned in the response
+        priority: class of requests for the scheduler
+        """
+        if workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {workers_count}",
+            )
+        if bucket is not None:
+            object_name = f"/{bucket}"
+
+        prefix = str(prefix or "")
+        shards: asyncio.Queue = asyncio.Queue()
+        if split_points is None:
+            shards.put_nowait(ListShard(prefix))
+        else:
+            points = sorted(split_points)
+            for start_after, end in zip([None, *points], [*points, None]):
+                shards.put_nowait(ListShard(prefix, depth, start_after, end))
+
+        results: asyncio.Queue = asyncio.Queue(maxsize=workers_count)
+        lister = asyncio.create_task(
+            self._list_shards(
+                str(object_name),
+                shards,
+                results,
+                workers_count,
+                delimiter=delimiter,
+                depth=depth,
+                max_keys=max_keys,
+                priority=priority,
+            ),
+        )
+        try:
+            while True:
+                item = await results.get()
+                if item is DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            lister.cancel()
+            await asyncio.gather(lister, return_exceptions=True)
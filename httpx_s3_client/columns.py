@@ -0,0 +1,267 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from sys import intern
+from typing import (
+    Dict, Iterable, Iterator, List, Sequence, Union, overload,
+)
+from xml.etree import ElementTree as ET
+
+from httpx_s3_client._xml import (
+    AwsObjectMeta, ListObjectsParser, parse_object_fields,
+)
+
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = EPOCH.replace(tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def last_modified_to_epoch_us(text: str) -> int:
+    """ Converts LastModified like `2023-07-01T00:00:00.000Z` """
+    return (datetime.fromisoformat(text[:-1]) - EPOCH) // MICROSECOND
+
+
+def datetime_to_epoch_us(value: datetime) -> int:
+    return (value - EPOCH_UTC) // MICROSECOND
+
+
+def epoch_us_to_datetime(value: int) -> datetime:
+    return EPOCH_UTC + value * MICROSECOND
+
+
+class ObjectColumns(Sequence[AwsObjectMeta]):
+    """
+    Compact storage of listed objects. Keys and ETags are kept encoded
+    in contiguous buffers with offsets, sizes and LastModified timestamps
+    (microseconds since the epoch) are kept in `array('q')` and storage
+    classes are kept as indexes of interned strings.
+
+    Items are materialized as `AwsObjectMeta` only when they're accessed.
+    """
+
+    __slots__ = (
+        "_keys", "_key_offsets", "_etags", "_etag_offsets",
+        "sizes", "last_modified", "_storage_classes",
+        "_storage_class_index", "_storage_class_ids",
+    )
+
+    def __init__(self, objects: Iterable[AwsObjectMeta] = ()):
+        self._keys = bytearray()
+        self._key_offsets = array("q", [0])
+        self._etags = bytearray()
+        self._etag_offsets = array("q", [0])
+        self.sizes = array("q")
+        self.last_modified = array("q")
+        self._storage_classes: List[str] = []
+        self._storage_class_index: Dict[str, int] = {}
+        self._storage_class_ids = array("H")
+        self.extend(objects)
+
+    def _storage_class_id(self, storage_class: str) -> int:
+        storage_class_id = self._storage_class_index.get(storage_class)
+        if storage_class_id is None:
+            storage_class_id = len(self._storage_classes)
+            self._storage_classes.append(intern(storage_class))
+            self._storage_class_index[storage_class] = storage_class_id
+        return storage_class_id
+
+    def _append(
+        self, etag: str, key: str, last_modified: int, size: int,
+        storage_class: str,
+    ) -> None:
+        self._keys += key.encode()
+        self._key_offsets.append(len(self._keys))
+        self._etags += etag.encode()
+        self._etag_offsets.append(len(self._etags))
+        self.sizes.append(size)
+        self.last_modified.append(last_modified)
+        self._storage_class_ids.append(self._storage_class_id(storage_class))
+
+    def append(self, meta: AwsObjectMeta) -> None:
+        self._append(
+            meta.etag,
+            meta.key,
+            datetime_to_epoch_us(meta.last_modified),
+            meta.size,
+            meta.storage_class,
+        )
+
+    def append_element(self, el: ET.Element) -> None:
+        """ Appends `Contents` element of ListObjectsV2 response """
+        fields = parse_object_fields(el)
+        if fields is None:
+            return
+        etag, key, last_modified, size, storage_class = fields
+        self._append(
+            etag, key, last_modified_to_epoch_us(last_modified), size,
+            storage_class,
+        )
+
+    def extend(self, objects: Iterable[AwsObjectMeta]) -> None:
+        if not isinstance(objects, ObjectColumns):
+            for meta in objects:
+                self.append(meta)
+            return
+
+        keys_offset = len(self._keys)
+        self._keys += objects._keys
+        self._key_offsets.extend(
+            offset + keys_offset for offset in objects._key_offsets[1:]
+        )
+        etags_offset = len(self._etags)
+        self._etags += objects._etags
+        self._etag_offsets.extend(
+            offset + etags_offset for offset in objects._etag_offsets[1:]
+        )
+        self.sizes.extend(objects.sizes)
+        self.last_modified.extend(objects.last_modified)
+        ids = [
+            self._storage_class_id(storage_class)
+            for storage_class in objects._storage_classes
+        ]
+        self._storage_class_ids.extend(
+            ids[storage_class_id]
+            for storage_class_id in objects._storage_class_ids
+        )
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ObjectColumns index out of range")
+        return index
+
+    def key(self, index: int) -> str:
+        index = self._check_index(index)
+        return self._keys[
+            self._key_offsets[index]:self._key_offsets[index + 1]
+        ].decode()
+
+    def etag(self, index: int) -> str:
+        index = self._check_index(index)
+        return self._etags[
+            self._etag_offsets[index]:self._etag_offsets[index + 1]
+        ].decode()
+
+    def storage_class(self, index: int) -> str:
+        index = self._check_index(index)
+        return self._storage_classes[self._storage_class_ids[index]]
+
+    @overload
+    def __getitem__(self, index: int) -> AwsObjectMeta:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ObjectColumns":
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice],
+    ) -> Union[AwsObjectMeta, "ObjectColumns"]:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        index = self._check_index(index)
+        return AwsObjectMeta(
+            etag=self.etag(index),
+            key=self.key(index),
+            last_modified=epoch_us_to_datetime(self.last_modified[index]),
+            size=self.sizes[index],
+            storage_class=self.storage_class(index),
+        )
+
+    def keys(self) -> Iterator[str]:
+        """ Iterates over keys without materializing other fields """
+        keys, offsets = self._keys, self._key_offsets
+        for index in range(len(self)):
+            yield keys[offsets[index]:offsets[index + 1]].decode()
+
+    def etags(self) -> Iterator[str]:
+        etags, offsets = self._etags, self._etag_offsets
+        for index in range(len(self)):
+            yield etags[offsets[index]:offsets[index + 1]].decode()
+
+    def storage_classes(self) -> Iterator[str]:
+        storage_classes = self._storage_classes
+        for storage_class_id in self._storage_class_ids:
+            yield storage_classes[storage_class_id]
+
+    def take(self, indexes: Iterable[int]) -> "ObjectColumns":
+        """ Returns columns with items of `indexes` """
+        result = ObjectColumns()
+        for index in indexes:
+            result._append(
+                self.etag(index),
+                self.key(index),
+                self.last_modified[index],
+                self.sizes[index],
+                self.storage_class(index),
+            )
+        return result
+
+    def total_size(self) -> int:
+        return sum(self.sizes)
+
+    def filter_prefix(self, prefix: str) -> "ObjectColumns":
+        """ Returns columns with keys starting with `prefix` """
+        encoded = prefix.encode()
+        keys, offsets = self._keys, self._key_offsets
+        return self.take(
+            index for index in range(len(self))
+            if keys.startswith(encoded, offsets[index], offsets[index + 1])
+        )
+
+    def size_by_storage_class(self) -> Dict[str, int]:
+        totals = [0] * len(self._storage_classes)
+        for storage_class_id, size in zip(
+            self._storage_class_ids, self.sizes,
+        ):
+            totals[storage_class_id] += size
+        return dict(zip(self._storage_classes, totals))
+
+    def count_by_storage_class(self) -> Dict[str, int]:
+        counts = [0] * len(self._storage_classes)
+        for storage_class_id in self._storage_class_ids:
+            counts[storage_class_id] += 1
+        return dict(zip(self._storage_classes, counts))
+
+    @property
+    def nbytes(self) -> int:
+        """ Size of the buffers in bytes """
+        return sum(
+            len(buffer) * buffer.itemsize
+            if isinstance(buffer, array) else len(buffer)
+            for buffer in (
+                self._keys, self._key_offsets, self._etags,
+                self._etag_offsets, self.sizes, self.last_modified,
+                self._storage_class_ids,
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} objects>"
+
+
+class ListObjectsColumnsParser(ListObjectsParser):
+    """
+    `ListObjectsParser` which returns objects as `ObjectColumns`
+    without creating `AwsObjectMeta` for each object
+    """
+
+    def _parse_contents(
+        self, contents: List[ET.Element],
+    ) -> Sequence[AwsObjectMeta]:
+        result = ObjectColumns()
+        for el in contents:
+            result.append_element(el)
+        return result
+
+
+__all__ = (
+    "ListObjectsColumnsParser",
+    "ObjectColumns",
+    "datetime_to_epoch_us",
+    "epoch_us_to_datetime",
+)
@@ -7,11 +7,13 @@ import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Mapping, Optional, Tuple, Union
+from typing import Any, ClassVar, List, Mapping, Optional, Tuple, Type, Union
 
 from aws_request_signer import AwsRequestSigner
 from httpx import URL, AsyncClient
 
+from httpx_s3_client.signer import RequestSigner
+
 
 try:
     from functools import cached_property
@@ -46,6 +48,8 @@ class StaticCredentials(AbstractCredentials):
     region: str = ""
     service: str = "s3"
 
+    signer_class: ClassVar[Type[AwsRequestSigner]] = RequestSigner
+
     def __bool__(self) -> bool:
         return all((self.access_key_id, self.secret_access_key))
 
@@ -68,7 +72,7 @@ class StaticCredentials(AbstractCredentials):
 
     @cached_property
     def signer(self) -> AwsRequestSigner:
-        return AwsRequestSigner(**self.as_dict())
+        return self.signer_class(**self.as_dict())
 
 
 class URLCredentials(StaticCredentials):
@@ -235,6 +239,8 @@ class MetadataCredentials(AbstractCredentials):
     METADATA_ADDRESS: str = "169.254.169.254"
     METADATA_PORT: int = 80
 
+    signer_class: Type[AwsRequestSigner] = RequestSigner
+
     def __bool__(self) -> bool:
         return self.is_started.is_set()
 
@@ -257,7 +263,9 @@ class MetadataCredentials(AbstractCredentials):
             async with self.refresh_lock:
                 try:
                     credentials, expires_at = await self._fetch_credentials()
-                    self._signer = AwsRequestSigner(**credentials.as_dict())
+                    self._signer = self.signer_class(
+                        **credentials.as_dict(),
+                    )
                     delta = expires_at - datetime.datetime.utcnow()
                     sleep_time = math.floor(delta.total_seconds() / 2)
                     self.is_started.set()
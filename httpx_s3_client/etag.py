@@ -0,0 +1,62 @@
+import hashlib
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+READ_SIZE = 1024 * 1024
+
+
+def file_etag(
+    file_path: Union[str, Path], part_size: Optional[int] = None,
+) -> str:
+    """
+    Returns ETag (in quotes) of the file uploaded with a single PUT
+    request or with multipart upload by parts of `part_size` bytes.
+    ETag of a multipart upload is MD5 of concatenated MD5 digests of
+    parts followed by the count of parts.
+    """
+    with open(file_path, "rb") as fp:
+        if part_size is None:
+            md5 = hashlib.md5()
+            for data in iter(lambda: fp.read(READ_SIZE), b""):
+                md5.update(data)
+            return f'"{md5.hexdigest()}"'
+
+        digests: List[bytes] = []
+        while True:
+            part_md5 = hashlib.md5()
+            left = part_size
+            while left > 0:
+                data = fp.read(min(left, READ_SIZE))
+                if not data:
+                    break
+                part_md5.update(data)
+                left -= len(data)
+            if left == part_size and digests:
+                break
+            digests.append(part_md5.digest())
+            if left > 0:
+                break
+    digest = hashlib.md5(b"".join(digests)).hexdigest()
+    return f'"{digest}-{len(digests)}"'
+
+
+def etag_matches(
+    file_path: Union[str, Path], etag: str, part_size: int,
+) -> bool:
+    """
+    Checks whether the file has `etag` of an object. ETag of a multipart
+    upload matches only if the object was uploaded by parts of
+    `part_size` bytes. ETags of objects encrypted with SSE-KMS or SSE-C
+    never match.
+    """
+    etag = etag if etag.startswith('"') else f'"{etag}"'
+    if "-" in etag:
+        return file_etag(file_path, part_size) == etag
+    return file_etag(file_path) == etag
+
+
+__all__ = (
+    "etag_matches",
+    "file_etag",
+)
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from collections import deque
+from functools import partial, wraps
+from time import monotonic
+from typing import (
+    Any, Awaitable, Callable, Coroutine, Deque, Dict, Optional, TypeVar,
+)
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Hedging:
+    """
+    Hedges requests which are slower than usual: when a request runs
+    longer than `percentile` of latencies of recent requests of the same
+    size, the duplicate is sent. The pool of the HTTP client sends it with
+    another connection, because the first one is busy. The first response
+    is used and the other request is cancelled.
+
+    Requests are grouped by the size rounded to the power of two.
+    `fired` is the count of sent duplicates and `won` is the count of
+    duplicates which were faster than the original requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        max_samples: int = 200,
+        min_delay: float = 0.01,
+        max_ratio: float = 0.1,
+    ):
+        """
+        percentile: percentile of latencies after which the duplicate is sent
+        min_samples: count of requests of the same size which should be
+            completed before the first duplicate
+        max_samples: count of recent latencies which are kept for each size
+        min_delay: minimal delay before the duplicate in seconds
+        max_ratio: maximal ratio of duplicates to requests
+        """
+        if not 0 < percentile <= 1:
+            raise ValueError(
+                f"Percentile should be in (0, 1]. Got {percentile}",
+            )
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+        self._latencies: Dict[int, Deque[float]] = {}
+
+    def delay(self, size: int) -> Optional[float]:
+        """
+        Returns the delay before the duplicate of a request of `size` bytes
+        or None if there are not enough samples or duplicates
+        """
+        latencies = self._latencies.get(size.bit_length())
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        if self.fired >= self.requests * self.max_ratio:
+            return None
+        ordered = sorted(latencies)
+        index = min(int(len(ordered) * self.percentile), len(ordered) - 1)
+        return max(ordered[index], self.min_delay)
+
+    def record(self, size: int, elapsed: float) -> None:
+        latencies = self._latencies.get(size.bit_length())
+        if latencies is None:
+            latencies = deque(maxlen=self.max_samples)
+            self._latencies[size.bit_length()] = latencies
+        latencies.append(elapsed)
+
+    async def run(
+        self, func: Callable[[], Awaitable[T]], size: int,
+        hedge_func: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Awaits `func()` and hedges it with `hedge_func()` (another `func()`
+        by default) if it's slow
+        """
+        self.requests += 1
+        delay = self.delay(size)
+        started = monotonic()
+        original = asyncio.ensure_future(func())
+        if delay is not None:
+            await asyncio.wait((original,), timeout=delay)
+        if original.done() or delay is None:
+            result = await original
+            self.record(size, monotonic() - started)
+            return result
+
+        self.fired += 1
+        log.debug(
+            "Request of %d bytes is running longer than %.3f s, hedging it",
+            size, delay,
+        )
+        hedge_started = monotonic()
+        hedge = asyncio.ensure_future((hedge_func or func)())
+        pending = {original, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    if task is hedge:
+                        self.won += 1
+                        self.record(size, monotonic() - hedge_started)
+                    else:
+                        self.record(size, monotonic() - started)
+                    return task.result()
+            # Both requests are failed
+            return original.result()
+        finally:
+            for task in (original, hedge):
+                task.cancel()
+            await asyncio.gather(original, hedge, return_exceptions=True)
+
+    def wrap(
+        self, func: Callable[..., Awaitable[T]], size: int,
+        hedge_func: Optional[Callable[..., Awaitable[T]]] = None,
+    ) -> Callable[..., Coroutine[Any, Any, T]]:
+        """
+        Returns a coroutine function which hedges calls of `func`
+        with calls of `hedge_func` (`func` by default)
+        """
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await self.run(
+                partial(func, *args, **kwargs), size,
+                partial(hedge_func or func, *args, **kwargs),
+            )
+        return wrapper
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(requests={self.requests}, "
+            f"fired={self.fired}, won={self.won})"
+        )
+
+
+__all__ = ("Hedging",)
@@ -0,0 +1,354 @@
+import logging
+import sqlite3
+import time
+from itertools import repeat
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Tuple, Union,
+)
+
+from httpx_s3_client._xml import AwsObjectMeta
+from httpx_s3_client.columns import (
+    ObjectColumns, datetime_to_epoch_us, epoch_us_to_datetime,
+)
+from httpx_s3_client.scheduler import Priority
+
+
+if TYPE_CHECKING:
+    from httpx_s3_client.client import S3Client
+
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_modified INTEGER NOT NULL,
+    storage_class TEXT NOT NULL,
+    seen_at INTEGER NOT NULL,
+    PRIMARY KEY (bucket, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS prefixes (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0,
+    refreshed_at REAL,
+    PRIMARY KEY (bucket, prefix)
+) WITHOUT ROWID;
+"""
+
+UPSERT_OBJECTS = """
+INSERT OR REPLACE INTO objects (
+    bucket, key, etag, size, last_modified, storage_class, seen_at
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+COLUMNS = "key, etag, last_modified, size, storage_class"
+
+Row = Tuple[str, str, str, int, int, str, int]
+
+
+def prefix_end(prefix: str) -> Optional[str]:
+    """
+    Returns the least string which is greater than all strings starting
+    with `prefix` or None if there is no such string. SQLite compares
+    text as UTF-8 bytes like S3 does, the order of UTF-8 is the order
+    of code points.
+    """
+    while prefix:
+        code = ord(prefix[-1]) + 1
+        if 0xD800 <= code <= 0xDFFF:
+            # Surrogates can't be encoded with UTF-8
+            code = 0xE000
+        if code <= 0x10FFFF:
+            return prefix[:-1] + chr(code)
+        prefix = prefix[:-1]
+    return None
+
+
+def iter_rows(
+    bucket: str, objects: Iterable[AwsObjectMeta], seen_at: int,
+) -> Iterator[Row]:
+    if isinstance(objects, ObjectColumns):
+        return zip(
+            repeat(bucket),
+            objects.keys(),
+            objects.etags(),
+            objects.sizes,
+            objects.last_modified,
+            objects.storage_classes(),
+            repeat(seen_at),
+        )
+    return (
+        (
+            bucket, meta.key, meta.etag, meta.size,
+            datetime_to_epoch_us(meta.last_modified), meta.storage_class,
+            seen_at,
+        )
+        for meta in objects
+    )
+
+
+class Inventory:
+    """
+    Local index of objects of a bucket kept in SQLite. The index is
+    populated by listing the bucket and answers point lookups, prefix
+    queries and aggregates without requests to S3.
+
+    `refresh` lists only keys after the greatest indexed key of the
+    prefix, which is enough for prefixes where objects are only added
+    (logs, time series). Prefixes where objects are replaced or deleted
+    should be marked with `mark_stale` and rescanned with `refresh_stale`,
+    or refreshed with `full=True`.
+
+    Queries are fast and run synchronously, one file may keep indexes
+    of several buckets.
+    """
+
+    def __init__(self, path: Union[str, Path], bucket: str):
+        """
+        path: path of the SQLite database, ':memory:' keeps the index
+            in memory
+        bucket: name of the indexed bucket
+        """
+        self.path = path
+        self.bucket = bucket
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "Inventory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _prefix_condition(
+        self, prefix: str, column: str = "key",
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        end = prefix_end(prefix)
+        if end is None:
+            return f"bucket = ? AND {column} >= ?", (self.bucket, prefix)
+        return (
+            f"bucket = ? AND {column} >= ? AND {column} < ?",
+            (self.bucket, prefix, end),
+        )
+
+    def _ensure_prefix(self, prefix: str) -> None:
+        self._db.execute(
+            "INSERT OR IGNORE INTO prefixes (bucket, prefix) VALUES (?, ?)",
+            (self.bucket, prefix),
+        )
+
+    @staticmethod
+    def _meta(row: Tuple[str, str, int, int, str]) -> AwsObjectMeta:
+        key, etag, last_modified, size, storage_class = row
+        return AwsObjectMeta(
+            etag=etag,
+            key=key,
+            last_modified=epoch_us_to_datetime(last_modified),
+            size=size,
+            storage_class=storage_class,
+        )
+
+    def add(
+        self, objects: Iterable[AwsObjectMeta],
+        seen_at: Optional[int] = None,
+    ) -> None:
+        """
+        Adds or replaces objects, e.g. pages of `list_objects_v2`
+        or `list_objects_parallel` of the bucket
+        """
+        if seen_at is None:
+            seen_at = time.time_ns()
+        with self._db:
+            self._db.executemany(
+                UPSERT_OBJECTS, iter_rows(self.bucket, objects, seen_at),
+            )
+
+    def remove(self, keys: Iterable[str]) -> None:
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM objects WHERE bucket = ? AND key = ?",
+                zip(repeat(self.bucket), keys),
+            )
+
+    def get(self, key: str) -> Optional[AwsObjectMeta]:
+        row = self._db.execute(
+            f"SELECT {COLUMNS} FROM objects WHERE bucket = ? AND key = ?",
+            (self.bucket, key),
+        ).fetchone()
+        return self._meta(row) if row is not None else None
+
+    def iter_objects(
+        self,
+        prefix: str = "",
+        *,
+        start_after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[AwsObjectMeta]:
+        """ Yields indexed objects of `prefix` in the order of keys """
+        condition, params = self._prefix_condition(prefix)
+        if start_after is not None:
+            condition += " AND key > ?"
+            params += (start_after,)
+        query = f"SELECT {COLUMNS} FROM objects WHERE {condition} ORDER BY key"
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+        for row in self._db.execute(query, params):
+            yield self._meta(row)
+
+    def count(self, prefix: str = "") -> int:
+        condition, params = self._prefix_condition(prefix)
+        return self._db.execute(
+            f"SELECT count(*) FROM objects WHERE {condition}", params,
+        ).fetchone()[0]
+
+    def total_size(self, prefix: str = "") -> int:
+        condition, params = self._prefix_condition(prefix)
+        return self._db.execute(
+            f"SELECT coalesce(sum(size), 0) FROM objects WHERE {condition}",
+            params,
+        ).fetchone()[0]
+
+    def last_key(self, prefix: str = "") -> Optional[str]:
+        """ Returns the greatest indexed key of `prefix` """
+        condition, params = self._prefix_condition(prefix)
+        return self._db.execute(
+            f"SELECT max(key) FROM objects WHERE {condition}", params,
+        ).fetchone()[0]
+
+    def mark_stale(self, prefix: str = "") -> None:
+        """ Marks `prefix` to be rescanned by `refresh_stale` """
+        with self._db:
+            self._ensure_prefix(prefix)
+            self._db.execute(
+                "UPDATE prefixes SET stale = 1 "
+                "WHERE bucket = ? AND prefix = ?",
+                (self.bucket, prefix),
+            )
+
+    def stale_prefixes(self) -> List[str]:
+        """
+        Returns prefixes marked as stale, prefixes nested into another
+        stale prefix are omitted
+        """
+        result: List[str] = []
+        for prefix, in self._db.execute(
+            "SELECT prefix FROM prefixes WHERE bucket = ? AND stale "
+            "ORDER BY prefix",
+            (self.bucket,),
+        ):
+            if not result or not prefix.startswith(result[-1]):
+                result.append(prefix)
+        return result
+
+    def refreshed_at(self, prefix: str = "") -> Optional[float]:
+        """ Returns the time of the last refresh of `prefix` """
+        row = self._db.execute(
+            "SELECT refreshed_at FROM prefixes "
+            "WHERE bucket = ? AND prefix = ?",
+            (self.bucket, prefix),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _refreshed(self, prefix: str, full: bool) -> None:
+        with self._db:
+            self._ensure_prefix(prefix)
+            self._db.execute(
+                "UPDATE prefixes SET refreshed_at = ? "
+                "WHERE bucket = ? AND prefix = ?",
+                (time.time(), self.bucket, prefix),
+            )
+            if full:
+                # Nested prefixes are rescanned as well
+                condition, params = self._prefix_condition(prefix, "prefix")
+                self._db.execute(
+                    f"UPDATE prefixes SET stale = 0 WHERE {condition}", params,
+                )
+
+    async def refresh(
+        self,
+        client: "S3Client",
+        prefix: str = "",
+        *,
+        full: bool = False,
+        max_keys: Optional[int] = None,
+        priority: Priority = Priority.BULK,
+    ) -> int:
+        """
+        Lists objects of `prefix` and adds them into the index. Returns
+        the count of listed objects.
+
+        client: client which lists the bucket
+        prefix: prefix of keys to refresh
+        full: rescan the whole prefix and remove objects which aren't
+            listed anymore, otherwise only keys after the greatest
+            indexed key of the prefix are listed
+        max_keys: maximum count of keys in a single response
+        priority: class of listing requests for the scheduler of `client`
+        """
+        start_after = None if full else self.last_key(prefix)
+        seen_at = time.time_ns()
+        listed = 0
+        async for columns in client.list_objects_columns(
+            bucket=self.bucket,
+            prefix=prefix or None,
+            max_keys=max_keys,
+            start_after=start_after,
+            priority=priority,
+        ):
+            self.add(columns, seen_at)
+            listed += len(columns)
+
+        if full:
+            condition, params = self._prefix_condition(prefix)
+            with self._db:
+                removed = self._db.execute(
+                    f"DELETE FROM objects WHERE {condition} AND seen_at < ?",
+                    params + (seen_at,),
+                ).rowcount
+            log.debug(
+                "Removed %d objects of %r which aren't listed anymore",
+                removed, prefix,
+            )
+        self._refreshed(prefix, full)
+        log.debug(
+            "Refreshed %r of bucket %r after %r: %d objects listed",
+            prefix, self.bucket, start_after, listed,
+        )
+        return listed
+
+    async def refresh_stale(
+        self,
+        client: "S3Client",
+        *,
+        max_keys: Optional[int] = None,
+        priority: Priority = Priority.BULK,
+    ) -> int:
+        """
+        Rescans prefixes marked with `mark_stale`. Returns the count
+        of listed objects.
+        """
+        listed = 0
+        for prefix in self.stale_prefixes():
+            listed += await self.refresh(
+                client, prefix, full=True, max_keys=max_keys,
+                priority=priority,
+            )
+        return listed
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r}, {self.bucket!r})"
+
+
+__all__ = (
+    "Inventory",
+)
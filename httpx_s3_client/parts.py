@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+
+log = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+# Limits of multipart upload
+MIN_PART_SIZE = 5 * MiB
+MAX_PART_SIZE = 5 * 1024 * MiB
+MAX_PARTS_COUNT = 10000
+
+
+def plan_part_size(
+    total_size: Optional[int] = None,
+    *,
+    buffer_budget: Optional[int] = None,
+    buffers_count: int = 1,
+) -> int:
+    """
+    Returns the part size (a multiple of 1MiB) which fits an upload of
+    `total_size` bytes in 10000 parts. Pass an overestimate when the size
+    is only estimated. When the size is unknown, the largest part size
+    which fits `buffers_count` buffers in `buffer_budget` bytes is returned,
+    so the stream may be as large as possible.
+
+    ValueError is raised if the budget doesn't fit parts of the required
+    size.
+    """
+    required = MIN_PART_SIZE
+    if total_size is not None:
+        required = max(required, -(-total_size // MAX_PARTS_COUNT))
+        required = -(-required // MiB) * MiB
+    if required > MAX_PART_SIZE:
+        raise ValueError(f"{total_size} bytes don't fit in a multipart upload")
+    if buffer_budget is None:
+        return required
+
+    allowed = min(buffer_budget // buffers_count // MiB * MiB, MAX_PART_SIZE)
+    if allowed < required:
+        raise ValueError(
+            f"Buffer budget of {buffer_budget} bytes doesn't fit "
+            f"{buffers_count} parts of {required} bytes",
+        )
+    return required if total_size is not None else allowed
+
+
+class BufferPool:
+    """
+    Pool of at most `count` reusable buffers of `buffer_size` bytes.
+    `acquire` waits while all buffers are in use, so the pool bounds
+    the memory of parts which are read ahead of uploads.
+    """
+
+    def __init__(self, buffer_size: int, count: int):
+        if count < 1:
+            raise ValueError(f"Count of buffers should be > 0. Got {count}")
+        self.buffer_size = buffer_size
+        self.count = count
+        self.allocated = 0
+        self._free: List[bytearray] = []
+        self._semaphore = asyncio.Semaphore(count)
+
+    async def acquire(self) -> bytearray:
+        await self._semaphore.acquire()
+        if self._free:
+            return self._free.pop()
+        self.allocated += 1
+        return bytearray(self.buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        self._free.append(buffer)
+        self._semaphore.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.buffer_size}, {self.count}, "
+            f"allocated={self.allocated})"
+        )
+
+
+class PooledPart:
+    """
+    Part which content is kept in a buffer of `BufferPool`. The buffer
+    is returned to the pool by `release` when the part is uploaded.
+    """
+
+    __slots__ = ("pool", "buffer", "size")
+
+    def __init__(self, pool: BufferPool, buffer: bytearray):
+        self.pool = pool
+        self.buffer = buffer
+        self.size = 0
+
+    @property
+    def data(self) -> memoryview:
+        return memoryview(self.buffer)[:self.size]
+
+    def write(self, view: memoryview) -> memoryview:
+        """ Copies the head of `view` into the part, returns the rest """
+        count = min(len(view), len(self.buffer) - self.size)
+        self.buffer[self.size:self.size + count] = view[:count]
+        self.size += count
+        return view[count:]
+
+    def is_full(self) -> bool:
+        return self.size == len(self.buffer)
+
+    def release(self) -> None:
+        self.pool.release(self.buffer)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RechunkedParts:
+    """
+    Coalesces chunks of a part generator (an async iterator of
+    `(part_hash, chunk)` tuples with `async with` support) into parts of
+    `pool.buffer_size` bytes (except the last one). Chunks are copied
+    into buffers of the pool, so there is no concatenation of bytes.
+    """
+
+    def __init__(self, gen: Any, pool: BufferPool):
+        self._gen = gen
+        self._pool = pool
+
+    async def __aenter__(self) -> "RechunkedParts":
+        await self._gen.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._gen.__aexit__(*exc_info)
+
+    def __aiter__(self) -> AsyncIterator[Tuple[Any, PooledPart]]:
+        return self._rechunk()
+
+    async def _rechunk(self) -> AsyncIterator[Tuple[Any, PooledPart]]:
+        part_hash = None
+        part: Optional[PooledPart] = None
+        yielded = False
+        async for part_hash, chunk in self._gen:
+            view = memoryview(chunk)
+            while view:
+                if part is None:
+                    part = PooledPart(self._pool, await self._pool.acquire())
+                view = part.write(view)
+                if part.is_full():
+                    yield part_hash, part
+                    yielded = True
+                    part = None
+
+        if part is None and not yielded:
+            # Multipart upload should have at least one part
+            part = PooledPart(self._pool, await self._pool.acquire())
+        if part is not None:
+            yield part_hash, part
+
+
+__all__ = (
+    "BufferPool",
+    "MAX_PARTS_COUNT",
+    "MAX_PART_SIZE",
+    "MIN_PART_SIZE",
+    "PooledPart",
+    "RechunkedParts",
+    "plan_part_size",
+)
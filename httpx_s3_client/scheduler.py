@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, Mapping, Optional
+
+
+log = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """ Classes of requests, lower values are sent first """
+    INTERACTIVE = 0
+    BULK = 1
+    BACKGROUND = 2
+
+
+class Scheduler:
+    """
+    Limits concurrent requests of a client to `max_requests` and sends
+    waiting requests by priority: a request starts only when there are
+    no waiting requests of more urgent classes which may start, requests
+    of the same class start in order. `limits` caps concurrent requests
+    of each class, e.g. the limit of `BULK` below `max_requests` keeps
+    slots free for interactive requests.
+
+    `max_requests` should not exceed the connection limit of the HTTP
+    client, otherwise requests wait for connections in FIFO order.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 100,
+        *,
+        limits: Optional[Mapping[Priority, int]] = None,
+    ):
+        """
+        max_requests: maximal count of concurrent requests
+        limits: maximal count of concurrent requests of a class
+        """
+        if max_requests < 1:
+            raise ValueError(
+                f"Max requests should be > 0. Got {max_requests}",
+            )
+        self.max_requests = max_requests
+        self.limits = {
+            priority: max_requests for priority in Priority
+        }
+        self.limits.update(limits or {})
+        self.running = 0
+        self.sent: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self.waited: Dict[Priority, int] = {
+            priority: 0 for priority in Priority
+        }
+        self._running: Dict[Priority, int] = {
+            priority: 0 for priority in Priority
+        }
+        self._waiters: Dict[Priority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in Priority
+        }
+
+    def _can_start(self, priority: Priority) -> bool:
+        return (
+            self.running < self.max_requests and
+            self._running[priority] < self.limits[priority]
+        )
+
+    def _start(self, priority: Priority) -> None:
+        self.running += 1
+        self._running[priority] += 1
+        self.sent[priority] += 1
+
+    def _wake(self) -> None:
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters and self._can_start(priority):
+                self._start(priority)
+                waiters.popleft().set_result(None)
+            if self.running >= self.max_requests:
+                return
+
+    async def acquire(self, priority: Priority) -> None:
+        if not self._waiters[priority] and self._can_start(priority):
+            self._start(priority)
+            return
+
+        self.waited[priority] += 1
+        log.debug(
+            "Waiting for a slot for %s request, %d of %d are running",
+            priority.name, self.running, self.max_requests,
+        )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted right before the cancellation
+                self.release(priority)
+            else:
+                self._waiters[priority].remove(waiter)
+            raise
+
+    def release(self, priority: Priority) -> None:
+        self.running -= 1
+        self._running[priority] -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def waiting(self, priority: Priority) -> int:
+        return len(self._waiters[priority])
+
+    def __repr__(self) -> str:
+        running = ", ".join(
+            f"{priority.name.lower()}={count}"
+            for priority, count in self._running.items()
+        )
+        return f"{self.__class__.__name__}({self.max_requests}, {running})"
+
+
+@asynccontextmanager
+async def scheduled(
+    scheduler: Optional[Scheduler], priority: Priority,
+) -> AsyncIterator[None]:
+    """ Waits for a slot of `scheduler` if it's passed """
+    if scheduler is None:
+        yield
+        return
+    async with scheduler.slot(priority):
+        yield
+
+
+__all__ = (
+    "Priority",
+    "Scheduler",
+    "scheduled",
+)
@@ -0,0 +1,257 @@
+import datetime
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit
+
+from aws_request_signer import AwsRequestSigner
+from httpx import URL
+
+
+METHODS_WITHOUT_BODY = frozenset({"DELETE", "HEAD", "GET"})
+EMPTY_STR_HASH = hashlib.sha256(b"").hexdigest()
+STREAMING_PAYLOAD = "STREAMING-AWS4-HMAC-SHA256-PAYLOAD"
+
+# len(";chunk-signature=") + len(signature) + 2 * len("\r\n")
+CHUNK_OVERHEAD = 17 + 64 + 4
+
+CredentialScope = Tuple[str, str, str, str]
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@lru_cache(maxsize=64)
+def derive_signing_key(
+    secret_access_key: str, date: str, region: str, service: str,
+) -> bytes:
+    """
+    Derives the SigV4 signing key. The key only depends on the secret,
+    the date, the region and the service so it can be reused by every
+    request signed during the day.
+    """
+    key = ("AWS4" + secret_access_key).encode("utf-8")
+    for element in (date, region, service, "aws4_request"):
+        key = hmac.new(key, element.encode("utf-8"), hashlib.sha256).digest()
+    return key
+
+
+@lru_cache(maxsize=256)
+def canonical_query(query: str) -> str:
+    if not query:
+        return ""
+    return urlencode(
+        sorted(parse_qsl(query, keep_blank_values=True)), quote_via=quote,
+    )
+
+
+def aws_chunked_length(content_length: int, chunk_size: int) -> int:
+    """
+    Returns the length of `aws-chunked` encoded body of `content_length`
+    bytes split into chunks of `chunk_size` bytes.
+    """
+    def encoded(size: int) -> int:
+        return len(f"{size:x}") + CHUNK_OVERHEAD + size
+
+    full_chunks, rest = divmod(content_length, chunk_size)
+    length = full_chunks * encoded(chunk_size) + encoded(0)
+    if rest:
+        length += encoded(rest)
+    return length
+
+
+class ChunkSigner:
+    """
+    Signs the chunks of `STREAMING-AWS4-HMAC-SHA256-PAYLOAD` request body.
+    Each signature is chained with the previous one, the first one is
+    the signature of the request headers.
+    """
+
+    algorithm = "AWS4-HMAC-SHA256-PAYLOAD"
+
+    __slots__ = ("_signing_key", "_prefix", "_signature")
+
+    def __init__(
+        self, signing_key: bytes, timestamp: str,
+        credential_scope: CredentialScope, seed_signature: str,
+    ):
+        self._signing_key = signing_key
+        self._prefix = "\n".join(
+            (self.algorithm, timestamp, "/".join(credential_scope)),
+        )
+        self._signature = seed_signature
+
+    def sign(self, chunk: BytesLike) -> str:
+        string_to_sign = "\n".join((
+            self._prefix,
+            self._signature,
+            EMPTY_STR_HASH,
+            hashlib.sha256(chunk).hexdigest(),
+        ))
+        self._signature = hmac.new(
+            self._signing_key, string_to_sign.encode(), hashlib.sha256,
+        ).hexdigest()
+        return self._signature
+
+    def encode(self, chunk: BytesLike) -> bytes:
+        signature = self.sign(chunk)
+        return b"".join((
+            f"{len(chunk):x};chunk-signature={signature}\r\n".encode(),
+            chunk,
+            b"\r\n",
+        ))
+
+
+class RequestSigner(AwsRequestSigner):
+    """
+    Drop-in replacement for `aws_request_signer.AwsRequestSigner` which
+    reuses the derived signing key and accepts already parsed `httpx.URL`
+    instances instead of re-parsing the URL string for every request.
+    """
+
+    def _signing_key(self, credential_scope: CredentialScope) -> bytes:
+        date, region, service, _ = credential_scope
+        return derive_signing_key(
+            self.secret_access_key, date, region, service,
+        )
+
+    def _sign(
+        self, credential_scope: CredentialScope, string_to_sign: str,
+    ) -> str:
+        return hmac.new(
+            self._signing_key(credential_scope),
+            string_to_sign.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+
+    @staticmethod
+    def _timestamp() -> str:
+        return datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+
+    def chunk_signer(self, signed_headers: Mapping[str, str]) -> ChunkSigner:
+        """
+        Returns `ChunkSigner` seeded with the signature from headers
+        returned by `sign_url` or `sign_with_headers`.
+        """
+        timestamp = signed_headers["x-amz-date"]
+        seed_signature = signed_headers["Authorization"].rpartition(
+            "Signature=",
+        )[2]
+        credential_scope: CredentialScope = (
+            timestamp[:8], self.region, self.service, "aws4_request",
+        )
+        return ChunkSigner(
+            self._signing_key(credential_scope),
+            timestamp,
+            credential_scope,
+            seed_signature,
+        )
+
+    def sign_with_headers(
+        self,
+        method: str,
+        url: Union[str, URL],
+        headers: Optional[Mapping[str, str]] = None,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, str]:
+        if isinstance(url, URL):
+            return self.sign_url(
+                method, url, headers=headers, content_hash=content_hash,
+            )
+        parsed_url = urlsplit(url)
+        return self._sign_parts(
+            method,
+            host=parsed_url.netloc.rpartition("@")[2],
+            path=parsed_url.path,
+            query=parsed_url.query,
+            headers=headers,
+            content_hash=content_hash,
+        )
+
+    def sign_url(
+        self,
+        method: str,
+        url: URL,
+        headers: Optional[Mapping[str, str]] = None,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Returns the headers required to sign the request to `url`.
+        The canonical request is built from the `httpx.URL` parts directly.
+        """
+        path, _, query = url.raw_path.decode("ascii").partition("?")
+        return self._sign_parts(
+            method,
+            host=url.netloc.decode("ascii"),
+            path=path,
+            query=query,
+            headers=headers,
+            content_hash=content_hash,
+        )
+
+    def _sign_parts(
+        self,
+        method: str,
+        *,
+        host: str,
+        path: str,
+        query: str,
+        headers: Optional[Mapping[str, str]],
+        content_hash: Optional[str],
+    ) -> Dict[str, str]:
+        if content_hash is None:
+            if method not in METHODS_WITHOUT_BODY:
+                raise ValueError(
+                    f"content_hash must be specified for {method} request",
+                )
+            content_hash = EMPTY_STR_HASH
+
+        timestamp = self._timestamp()
+        extra_headers = {
+            "x-amz-content-sha256": content_hash,
+            "x-amz-date": timestamp,
+        }
+        if self.session_token:
+            extra_headers["x-amz-security-token"] = self.session_token
+
+        canonical_headers: List[Tuple[str, str]] = sorted({
+            "host": host,
+            **{key.lower(): value for key, value in (headers or {}).items()},
+            **extra_headers,
+        }.items())
+        signed_headers = ";".join(key for key, _ in canonical_headers)
+
+        credential_scope: CredentialScope = (
+            timestamp[:8], self.region, self.service, "aws4_request",
+        )
+        canonical_request = "\n".join((
+            method,
+            path,
+            canonical_query(query),
+            "\n".join(f"{key}:{value}" for key, value in canonical_headers),
+            "",
+            signed_headers,
+            content_hash,
+        ))
+        string_to_sign = "\n".join((
+            self.algorithm,
+            timestamp,
+            "/".join(credential_scope),
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ))
+
+        authorization = (
+            f"{self.algorithm} "
+            f"Credential={self._get_credential(credential_scope)}, "
+            f"SignedHeaders={signed_headers}, "
+            f"Signature={self._sign(credential_scope, string_to_sign)}"
+        )
+        return {**extra_headers, "Authorization": authorization}
+
+
+__all__ = (
+    "ChunkSigner",
+    "RequestSigner",
+    "STREAMING_PAYLOAD",
+    "aws_chunked_length",
+    "derive_signing_key",
+)
@@ -0,0 +1,253 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from time import monotonic
+from typing import (
+    AsyncIterator, Deque, Iterator, NamedTuple, Optional, Tuple, Union,
+)
+
+
+log = logging.getLogger(__name__)
+
+MAX_WORKERS_COUNT = 16
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class TuningReport(NamedTuple):
+    workers_count: int
+    chunk_size: Optional[int]
+    requests: int
+    transferred: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """ Average throughput of the transfer in bytes per second """
+        return self.transferred / self.elapsed if self.elapsed else 0.0
+
+
+class AutoTuner:
+    """
+    Tunes the concurrency and the chunk (range or part) size of a transfer
+    with AIMD. After each round of `workers_count` requests the throughput
+    of the round is compared with the previous one: the concurrency grows
+    by one while the throughput grows and is cut by `decrease_factor` when
+    it drops. The chunk size grows by its initial value while requests
+    are faster than `target_latency` and is halved when they're more than
+    twice slower.
+
+    The same instance may be passed to several transfers, each transfer
+    starts from its own `workers_count` and chunk size. Values chosen by
+    the last transfer are available with `report()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers_count: int = MAX_WORKERS_COUNT,
+        max_chunk_size: int = MAX_CHUNK_SIZE,
+        target_latency: float = 1.0,
+        tolerance: float = 0.1,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        max_workers_count: upper bound of the concurrency
+        max_chunk_size: upper bound of the chunk size
+        target_latency: desired duration of a single request in seconds
+        tolerance: relative change of the throughput which is ignored
+        decrease_factor: multiplier of the concurrency when the throughput
+            drops
+        """
+        if max_workers_count < 1:
+            raise ValueError(
+                f"Workers count should be > 0. Got {max_workers_count}",
+            )
+        self.max_workers_count = max_workers_count
+        self.max_chunk_size = max_chunk_size
+        self.target_latency = target_latency
+        self.tolerance = tolerance
+        self.decrease_factor = decrease_factor
+
+        self.workers_count = 1
+        self.chunk_size: Optional[int] = None
+        self._min_chunk_size = 0
+        self._max_chunk_size = 0
+        self._chunk_step = 0
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._started = monotonic()
+        self._requests = 0
+        self._transferred = 0
+        self._throughput: Optional[float] = None
+        self._window: Tuple[float, int, int, float] = (self._started, 0, 0, 0)
+
+    def start(
+        self,
+        workers_count: int,
+        chunk_size: Optional[int] = None,
+        *,
+        min_chunk_size: Optional[int] = None,
+        max_chunk_size: Optional[int] = None,
+    ) -> None:
+        """
+        Resets the state before a transfer
+
+        workers_count: initial concurrency
+        chunk_size: initial chunk size, the chunk size isn't tuned if None
+        min_chunk_size: lower bound of the chunk size (`chunk_size`
+            by default)
+        max_chunk_size: upper bound of the chunk size (`max_chunk_size`
+            of the tuner by default)
+        """
+        self.workers_count = max(min(workers_count, self.max_workers_count), 1)
+        self.chunk_size = chunk_size
+        if chunk_size is not None:
+            self._min_chunk_size = min(min_chunk_size or chunk_size, chunk_size)
+            self._max_chunk_size = max(
+                max_chunk_size or self.max_chunk_size, chunk_size,
+            )
+            self._chunk_step = chunk_size
+
+        self._started = monotonic()
+        self._requests = 0
+        self._transferred = 0
+        self._throughput = None
+        self._window = (self._started, 0, 0, 0)
+
+    async def acquire(self) -> None:
+        """ Waits until less than `workers_count` requests are running """
+        while self._active >= self.workers_count:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # Pass the wake up to the next waiter
+                    self._wake_up()
+                raise
+        self._active += 1
+
+    def release(self) -> None:
+        self._active -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free = self.workers_count - self._active
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record(self, size: int, elapsed: float) -> None:
+        """
+        Records a request which transferred `size` bytes in `elapsed`
+        seconds and adjusts the values after each round of requests.
+        """
+        self._requests += 1
+        self._transferred += size
+        started, count, transferred, latency = self._window
+        self._window = (
+            started, count + 1, transferred + size, latency + elapsed,
+        )
+        if count + 1 >= self.workers_count:
+            self._adjust()
+
+    def _adjust(self) -> None:
+        now = monotonic()
+        started, count, transferred, latency = self._window
+        throughput = transferred / max(now - started, 1e-6)
+        latency /= count
+
+        previous = self._throughput
+        if previous is None or throughput > previous * (1 + self.tolerance):
+            self.workers_count = min(
+                self.workers_count + 1, self.max_workers_count,
+            )
+            self._wake_up()
+        elif throughput < previous * (1 - self.tolerance):
+            self.workers_count = max(
+                int(self.workers_count * self.decrease_factor), 1,
+            )
+
+        if self.chunk_size is not None:
+            if latency < self.target_latency:
+                self.chunk_size = min(
+                    self.chunk_size + self._chunk_step, self._max_chunk_size,
+                )
+            elif latency > self.target_latency * 2:
+                self.chunk_size = max(
+                    self.chunk_size // 2, self._min_chunk_size,
+                )
+
+        log.debug(
+            "Throughput %.0f B/s, latency %.3f s: "
+            "using %d workers and chunks of %s bytes",
+            throughput, latency, self.workers_count, self.chunk_size,
+        )
+        self._throughput = throughput
+        self._window = (now, 0, 0, 0)
+
+    def report(self) -> TuningReport:
+        return TuningReport(
+            workers_count=self.workers_count,
+            chunk_size=self.chunk_size,
+            requests=self._requests,
+            transferred=self._transferred,
+            elapsed=monotonic() - self._started,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(workers_count={self.workers_count}, "
+            f"chunk_size={self.chunk_size})"
+        )
+
+
+@asynccontextmanager
+async def slot(
+    tuner: Optional[Union[AutoTuner, asyncio.Semaphore]],
+) -> AsyncIterator[None]:
+    """ Limits the concurrency with `tuner` (or a semaphore) if it's passed """
+    if tuner is None:
+        yield
+        return
+    await tuner.acquire()
+    try:
+        yield
+    finally:
+        tuner.release()
+
+
+@contextmanager
+def sample(tuner: Optional[AutoTuner], size: int) -> Iterator[None]:
+    """ Records the duration of a successful request to `tuner` """
+    started = monotonic()
+    yield
+    if tuner is not None:
+        tuner.record(size, monotonic() - started)
+
+
+def iter_ranges(
+    size: int, tuner: AutoTuner,
+) -> Iterator[Tuple[int, int]]:
+    """ Yields ranges of `[start, end)` of the tuner's chunk size """
+    start = 0
+    while start < size:
+        end = min(start + (tuner.chunk_size or size), size)
+        yield start, end
+        start = end
+
+
+__all__ = (
+    "AutoTuner",
+    "TuningReport",
+    "iter_ranges",
+    "sample",
+    "slot",
+)
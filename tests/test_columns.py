@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from httpx_s3_client import AwsObjectMeta, ObjectColumns
+
+
+def make_meta(i: int, storage_class: str = "STANDARD") -> AwsObjectMeta:
+    return AwsObjectMeta(
+        etag=f'"{i:032x}"',
+        key=f"dir{i % 3}/ключ{i}",
+        last_modified=datetime(
+            2023, 7, 1, 12, 30, 15, 123000, tzinfo=timezone.utc,
+        ) + timedelta(days=i),
+        size=i * 100,
+        storage_class=storage_class,
+    )
+
+
+@pytest.fixture
+def objects():
+    return [
+        make_meta(i, "GLACIER" if i % 4 == 0 else "STANDARD")
+        for i in range(10)
+    ]
+
+
+def test_object_columns(objects):
+    columns = ObjectColumns(objects)
+    assert len(columns) == len(objects)
+    assert list(columns) == objects
+    assert columns[-1] == objects[-1]
+    assert list(columns.keys()) == [meta.key for meta in objects]
+    assert columns.key(3) == objects[3].key
+    assert columns.etag(3) == objects[3].etag
+    assert columns.storage_class(4) == "GLACIER"
+    assert objects[5] in columns
+
+    with pytest.raises(IndexError):
+        columns[len(objects)]
+
+
+def test_object_columns_slice(objects):
+    columns = ObjectColumns(objects)
+    assert isinstance(columns[2:8:2], ObjectColumns)
+    assert list(columns[2:8:2]) == objects[2:8:2]
+    assert list(columns[::-1]) == objects[::-1]
+    assert len(columns[20:]) == 0
+
+
+def test_object_columns_extend(objects):
+    head = ObjectColumns(objects[:5])
+    tail = ObjectColumns(objects[5:])
+    head.extend(tail)
+    assert list(head) == objects
+    assert head.count_by_storage_class() == {"GLACIER": 3, "STANDARD": 7}
+
+
+def test_object_columns_aggregates(objects):
+    columns = ObjectColumns(objects)
+    assert columns.total_size() == sum(meta.size for meta in objects)
+    assert columns.size_by_storage_class() == {
+        "GLACIER": sum(meta.size for meta in objects[::4]),
+        "STANDARD": sum(
+            meta.size for i, meta in enumerate(objects) if i % 4
+        ),
+    }
+
+    filtered = columns.filter_prefix("dir1/")
+    assert list(filtered) == [
+        meta for meta in objects if meta.key.startswith("dir1/")
+    ]
+    assert len(columns.filter_prefix("ключ")) == 0
+    assert len(columns.filter_prefix("")) == len(objects)
+
@@ -0,0 +1,184 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from httpx import Headers, Request, Response
+
+from httpx_s3_client import S3Client
+from httpx_s3_client.cache import ContentCache
+
+
+@pytest.fixture
+def content_cache(tmp_path) -> ContentCache:
+    return ContentCache(
+        tmp_path / "cache",
+        memory_size=1024,
+        max_memory_item_size=100,
+        disk_size=10 * 1024,
+    )
+
+
+@pytest.fixture
+def cached_client(make_s3_client, content_cache) -> S3Client:
+    return make_s3_client(content_cache=content_cache)
+
+
+def make_response(etag: str, content: bytes) -> Response:
+    return Response(
+        200,
+        headers={"ETag": etag, "Content-Type": "text/plain"},
+        content=content,
+        request=Request("GET", "http://s3/bucket/key"),
+    )
+
+
+async def test_content_cache_tiers(content_cache: ContentCache, tmp_path):
+    await content_cache.store("small", make_response('"1"', b"x" * 100))
+    await content_cache.store("large", make_response('"2"', b"y" * 1000))
+    stats = content_cache.stats()
+    assert stats.memory_count == 1 and stats.memory_size == 100
+    assert stats.disk_count == 1 and stats.disk_size == 1000
+
+    cached = await content_cache.get("small", '"1"')
+    assert cached is not None and cached.content == b"x" * 100
+    assert ("Content-Type", "text/plain") in cached.headers
+    assert await content_cache.get("small", '"other"') is None
+    cached = await content_cache.get("large", '"2"')
+    assert cached is not None and cached.content == b"y" * 1000
+    assert content_cache.hits == 2
+
+    # The disk tier is loaded on start
+    reloaded = ContentCache(tmp_path / "cache", disk_size=10 * 1024)
+    assert reloaded.etag("large") == '"2"'
+    assert await reloaded.copy_to("large", '"2"', tmp_path / "copy")
+    assert (tmp_path / "copy").read_bytes() == b"y" * 1000
+
+    content_cache.invalidate("large")
+    assert content_cache.etag("large") is None
+    assert not list((tmp_path / "cache").iterdir())
+
+
+async def test_content_cache_eviction(content_cache: ContentCache):
+    for i in range(12):
+        await content_cache.store(f"memory{i}", make_response('"m"', b"m" * 100))
+    for i in range(12):
+        await content_cache.store(f"disk{i}", make_response('"d"', b"d" * 1000))
+
+    stats = content_cache.stats()
+    assert stats.memory_count == 10
+    assert stats.disk_count == 10
+    assert stats.evictions == 4
+    assert content_cache.etag("memory0") is None
+    assert content_cache.etag("memory11") == '"m"'
+    assert content_cache.etag("disk1") is None
+    assert content_cache.etag("disk2") == '"d"'
+
+
+async def test_content_cache_concurrent_store(
+    content_cache: ContentCache, tmp_path,
+):
+    await asyncio.gather(
+        content_cache.store("large", make_response('"1"', b"x" * 1000)),
+        content_cache.store("large", make_response('"2"', b"y" * 1000)),
+    )
+    stats = content_cache.stats()
+    assert stats.disk_count == 1 and stats.disk_size == 1000
+
+    content_cache.invalidate("large")
+    stats = content_cache.stats()
+    assert stats.disk_count == 0 and stats.disk_size == 0
+    assert not list((tmp_path / "cache").iterdir())
+
+
+async def test_content_cache_file(content_cache: ContentCache, tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"z" * 2000)
+    await content_cache.store_file(
+        "file", '"3"', source, Headers({"ETag": '"3"'}),
+    )
+    assert await content_cache.copy_to("file", '"3"', tmp_path / "target")
+    assert (tmp_path / "target").read_bytes() == b"z" * 2000
+    assert not await content_cache.copy_to("file", '"4"', tmp_path / "other")
+
+
+async def test_get_cached(
+    cached_client: S3Client, s3_bucket_name, requests, content_cache,
+):
+    object_name = f"/{s3_bucket_name}/content/cached"
+    for content in (b"small", b"large" * 100):
+        await cached_client.put(object_name, content)
+        first = await cached_client.get(object_name)
+        second = await cached_client.get(object_name)
+        assert first.content == second.content == content
+        assert second.status_code == HTTPStatus.OK
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert requests[-1].headers["If-None-Match"] == first.headers["ETag"]
+
+    assert content_cache.hits == 2
+    assert content_cache.misses == 2
+    assert content_cache.stats().disk_count == 1
+
+    # Requests with headers aren't cached
+    resp = await cached_client.get(object_name, headers={"Range": "bytes=0-4"})
+    assert resp.content == b"large"
+    assert content_cache.hits == 2
+
+    await cached_client.delete(object_name)
+    assert content_cache.etag(cached_client._cache_key(object_name)) is None
+
+
+async def test_get_cached_changed(
+    cached_client: S3Client, s3_client: S3Client, s3_bucket_name,
+    content_cache,
+):
+    object_name = f"/{s3_bucket_name}/content/changed"
+    await cached_client.put(object_name, b"content")
+    await cached_client.get(object_name)
+    # The object is replaced by another client
+    await s3_client.put(object_name, b"replaced")
+
+    resp = await cached_client.get(object_name)
+    assert resp.content == b"replaced"
+    assert content_cache.hits == 0
+    assert (await cached_client.get(object_name)).content == b"replaced"
+    assert content_cache.hits == 1
+
+
+async def test_get_file_parallel_cached(
+    cached_client: S3Client, s3_bucket_name, requests, content_cache,
+    tmp_path,
+):
+    object_name = f"/{s3_bucket_name}/content/parallel"
+    content = b"content" * 300
+    await cached_client.put(object_name, content)
+    for i in range(3):
+        await cached_client.get_file_parallel(
+            object_name, tmp_path / f"file{i}", workers_count=2,
+        )
+        assert (tmp_path / f"file{i}").read_bytes() == content
+
+    assert len([
+        request for request in requests if request.method == "GET"
+    ]) == 1
+    assert content_cache.hits == 2
+    assert content_cache.stats().disk_count == 1
+
+
+async def test_get_file_parallel_cached_headers(
+    cached_client: S3Client, s3_bucket_name, requests, content_cache,
+    tmp_path,
+):
+    object_name = f"/{s3_bucket_name}/content/parallel-headers"
+    content = b"content" * 300
+    await cached_client.put(
+        object_name, content,
+        headers={"Content-Type": "text/plain", "x-amz-meta-kind": "test"},
+    )
+    await cached_client.get_file_parallel(object_name, tmp_path / "file")
+
+    resp = await cached_client.get(object_name)
+    assert content_cache.hits == 1
+    assert resp.content == content
+    assert resp.headers["Content-Type"] == "text/plain"
+    assert resp.headers["x-amz-meta-kind"] == "test"
+    assert resp.headers["Content-Length"] == str(len(content))
@@ -0,0 +1,98 @@
+import os
+from typing import List
+from uuid import uuid4
+
+import pytest
+from httpx import Request
+
+from httpx_s3_client import S3Client
+from httpx_s3_client.client import PART_SIZE, AwsUploadError
+
+
+async def test_copy_object(s3_client: S3Client, s3_bucket_name):
+    prefix = f"{s3_bucket_name}/copy/{uuid4().hex}"
+    await s3_client.put(
+        f"{prefix}/source.txt", b"copied content",
+        headers={"Content-Type": "text/plain", "x-amz-meta-owner": "me"},
+    )
+
+    await s3_client.copy_object(f"{prefix}/source.txt", f"{prefix}/dst.txt")
+
+    resp = await s3_client.get(f"{prefix}/dst.txt")
+    assert resp.content == b"copied content"
+    assert resp.headers["Content-Type"] == "text/plain"
+    assert resp.headers["x-amz-meta-owner"] == "me"
+
+
+@pytest.mark.parametrize("multipart_threshold", [None, 1])
+async def test_copy_object_replace_metadata(
+    multipart_threshold, s3_client: S3Client, s3_bucket_name,
+):
+    prefix = f"{s3_bucket_name}/copy/{uuid4().hex}"
+    content = os.urandom(PART_SIZE + 100) if multipart_threshold else b"x"
+    await s3_client.put(
+        f"{prefix}/source", content,
+        headers={"Content-Type": "text/plain", "x-amz-meta-owner": "me"},
+    )
+
+    await s3_client.copy_object(
+        f"{prefix}/source", f"{prefix}/dst",
+        headers={"Content-Type": "text/csv", "x-amz-meta-owner": "you"},
+        multipart_threshold=multipart_threshold or PART_SIZE,
+        part_size=PART_SIZE,
+    )
+
+    resp = await s3_client.head(f"{prefix}/dst")
+    assert resp.headers["Content-Type"] == "text/csv"
+    assert resp.headers["x-amz-meta-owner"] == "you"
+
+
+async def test_copy_object_missing(s3_client: S3Client, s3_bucket_name):
+    prefix = f"{s3_bucket_name}/copy/{uuid4().hex}"
+    with pytest.raises(AwsUploadError):
+        await s3_client.copy_object(f"{prefix}/missing", f"{prefix}/dst")
+
+
+async def test_copy_object_multipart(s3_client: S3Client, s3_bucket_name):
+    requests: List[Request] = []
+
+    async def on_request(request: Request) -> None:
+        requests.append(request)
+
+    prefix = f"{s3_bucket_name}/copy/{uuid4().hex}"
+    content = os.urandom(2 * PART_SIZE + 100)
+    await s3_client.put(
+        f"{prefix}/large.bin", content,
+        headers={"Content-Type": "application/x-test"},
+    )
+    s3_client._client.event_hooks["request"].append(on_request)
+
+    await s3_client.copy_object(
+        f"{prefix}/large.bin", f"{prefix}/large-copy.bin",
+        multipart_threshold=PART_SIZE,
+        part_size=PART_SIZE,
+        workers_count=3,
+    )
+
+    part_copies = [
+        request for request in requests
+        if "partNumber" in request.url.params
+    ]
+    ranges = sorted(
+        tuple(
+            int(byte)
+            for byte in request.headers["x-amz-copy-source-range"]
+            .split("=")[1].split("-")
+        )
+        for request in part_copies
+    )
+    assert ranges == [
+        (0, PART_SIZE - 1),
+        (PART_SIZE, 2 * PART_SIZE - 1),
+        (2 * PART_SIZE, 2 * PART_SIZE + 99),
+    ]
+    assert all(not request.content for request in part_copies)
+
+    resp = await s3_client.get(f"{prefix}/large-copy.bin")
+    assert resp.content == content
+    assert resp.headers["Content-Type"] == "application/x-test"
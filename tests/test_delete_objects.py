@@ -0,0 +1,90 @@
+import base64
+import hashlib
+from typing import List
+
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from httpx_s3_client import AwsDeleteError, S3Client
+
+
+async def list_keys(s3_client: S3Client, bucket: str, prefix: str):
+    keys: List[str] = []
+    async for page in s3_client.list_objects_v2(bucket=bucket, prefix=prefix):
+        keys.extend(meta.key for meta in page)
+    return keys
+
+
+async def test_delete_objects(s3_client: S3Client, s3_bucket_name):
+    keys = [f"delete/key{i}" for i in range(7)]
+    for key in keys:
+        await s3_client.put(f"{s3_bucket_name}/{key}", b"data")
+    await s3_client.put(f"{s3_bucket_name}/keep/key", b"data")
+
+    errors = await s3_client.delete_objects(
+        keys[:3], bucket=s3_bucket_name, batch_size=2,
+    )
+    assert errors == []
+    assert await list_keys(s3_client, s3_bucket_name, "delete/") == keys[3:]
+
+
+async def test_delete_objects_listed(s3_client: S3Client, s3_bucket_name):
+    for i in range(7):
+        await s3_client.put(f"{s3_bucket_name}/wipe/key{i}", b"data")
+    await s3_client.put(f"{s3_bucket_name}/keep/key", b"data")
+
+    errors = await s3_client.delete_objects(
+        s3_client.list_objects_v2(
+            bucket=s3_bucket_name, prefix="wipe/", max_keys=3,
+        ),
+        bucket=s3_bucket_name,
+        batch_size=2,
+        workers_count=2,
+    )
+    assert errors == []
+    assert await list_keys(s3_client, s3_bucket_name, "wipe/") == []
+    assert await list_keys(s3_client, s3_bucket_name, "keep/") == ["keep/key"]
+
+
+async def test_delete_objects_errors(
+    s3_client: S3Client, httpx_mock: HTTPXMock,
+):
+    requested = []
+
+    def callback(request: Request) -> Response:
+        assert request.method == "POST"
+        assert "delete" in request.url.params
+        content = request.read()
+        assert request.headers["Content-MD5"] == base64.b64encode(
+            hashlib.md5(content).digest(),
+        ).decode()
+        requested.append(content.count(b"<Key>"))
+        return Response(
+            200,
+            content=(
+                b'<?xml version="1.0" encoding="UTF-8"?>'
+                b'<DeleteResult '
+                b'xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                b"<Error><Key>locked</Key><Code>AccessDenied</Code>"
+                b"<Message>Access Denied</Message></Error>"
+                b"</DeleteResult>"
+            ),
+        )
+
+    httpx_mock.add_callback(callback)
+
+    async def keys():
+        for i in range(2500):
+            yield f"key{i}"
+
+    errors = await s3_client.delete_objects(keys(), bucket="test")
+    assert sorted(requested) == [500, 1000, 1000]
+    assert errors == [
+        AwsDeleteError("locked", "AccessDenied", "Access Denied"),
+    ] * 3
+
+
+async def test_delete_objects_batch_size(s3_client: S3Client):
+    with pytest.raises(ValueError):
+        await s3_client.delete_objects(["key"], bucket="test", batch_size=1001)
@@ -0,0 +1,112 @@
+import os
+from datetime import datetime, timezone
+from typing import List
+from uuid import uuid4
+
+import pytest
+from httpx import Request
+
+from httpx_s3_client import AwsObjectMeta, S3Client
+from httpx_s3_client.client import PART_SIZE
+
+
+OBJECTS = {
+    "a.txt": b"a" * 10,
+    "empty": b"",
+    "sub/b.txt": b"b" * 100,
+    "sub/nested/large.bin": os.urandom(PART_SIZE + 100),
+}
+
+
+@pytest.fixture
+async def download_prefix(s3_client: S3Client, s3_bucket_name) -> str:
+    prefix = f"download/{uuid4().hex}/"
+    for name, content in OBJECTS.items():
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{name}", content)
+    # Directory placeholder
+    await s3_client.put(f"{s3_bucket_name}/{prefix}sub/", b"")
+    return prefix
+
+
+async def test_download_prefix(
+    s3_client: S3Client, s3_bucket_name, download_prefix, tmp_path,
+):
+    requests: List[Request] = []
+
+    async def on_request(request: Request) -> None:
+        requests.append(request)
+
+    s3_client._client.event_hooks["request"].append(on_request)
+    local_dir = tmp_path / "local"
+    result = await s3_client.download_prefix(
+        download_prefix, local_dir,
+        bucket=s3_bucket_name, range_step=PART_SIZE // 2, workers_count=4,
+    )
+    expected = sorted(f"{download_prefix}{name}" for name in OBJECTS)
+    assert result.downloaded == expected
+    assert result.unchanged == []
+    for name, content in OBJECTS.items():
+        assert (local_dir / name).read_bytes() == content
+    assert sorted(
+        path.relative_to(local_dir).as_posix()
+        for path in local_dir.rglob("*") if path.is_file()
+    ) == sorted(OBJECTS)
+
+    methods = [request.method for request in requests]
+    assert "HEAD" not in methods
+    # The large object is downloaded with 3 ranges, the empty one without
+    assert methods.count("GET") == 1 + 2 + 3
+
+    (local_dir / "a.txt").write_bytes(b"changed")
+    result = await s3_client.download_prefix(
+        download_prefix.rstrip("/"), local_dir, bucket=s3_bucket_name,
+    )
+    assert result.downloaded == [f"{download_prefix}a.txt"]
+    assert len(result.unchanged) == len(OBJECTS) - 1
+    assert (local_dir / "a.txt").read_bytes() == OBJECTS["a.txt"]
+
+
+async def test_download_prefix_outside(
+    s3_client: S3Client, s3_bucket_name, tmp_path, monkeypatch,
+):
+    async def list_objects_v2(**kwargs):
+        yield [
+            AwsObjectMeta(
+                etag='"etag"',
+                key="download/../escaped",
+                last_modified=datetime.now(timezone.utc),
+                size=4,
+                storage_class="STANDARD",
+            ),
+        ]
+
+    monkeypatch.setattr(s3_client, "list_objects_v2", list_objects_v2)
+    result = await s3_client.download_prefix(
+        "download/", tmp_path / "local", bucket=s3_bucket_name,
+    )
+    assert result.downloaded == result.unchanged == []
+    assert not (tmp_path / "escaped").exists()
+
+
+async def test_download_prefix_boundary(
+    s3_client: S3Client, s3_bucket_name, tmp_path,
+):
+    base = f"download/{uuid4().hex}"
+    objects = {
+        "data/foo": b"foo",
+        "data/foo.part": b"foo.part",
+        "database/bar": b"bar",
+    }
+    for key, content in objects.items():
+        await s3_client.put(f"{s3_bucket_name}/{base}/{key}", content)
+
+    local_dir = tmp_path / "local"
+    result = await s3_client.download_prefix(
+        f"{base}/data", local_dir, bucket=s3_bucket_name, workers_count=2,
+    )
+    assert result.downloaded == [f"{base}/data/foo", f"{base}/data/foo.part"]
+    assert sorted(path.name for path in local_dir.iterdir()) == [
+        "foo", "foo.part",
+    ]
+    assert (local_dir / "foo").read_bytes() == b"foo"
+    assert (local_dir / "foo.part").read_bytes() == b"foo.part"
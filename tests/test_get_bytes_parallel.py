@@ -0,0 +1,43 @@
+import secrets
+
+import pytest
+
+from httpx_s3_client import S3Client
+
+
+async def test_get_bytes_parallel(s3_client: S3Client, s3_bucket_name):
+    data = secrets.token_bytes(1024 * 1024 + 7)
+    object_name = f"{s3_bucket_name}/bytes.bin"
+    await s3_client.put(object_name, data)
+
+    result = await s3_client.get_bytes_parallel(
+        object_name, workers_count=4, range_step=64 * 1024,
+    )
+    assert isinstance(result, bytearray)
+    assert result == data
+
+
+async def test_get_bytes_parallel_empty(s3_client: S3Client, s3_bucket_name):
+    object_name = f"{s3_bucket_name}/empty.bin"
+    await s3_client.put(object_name, b"")
+
+    assert await s3_client.get_bytes_parallel(
+        object_name, workers_count=4,
+    ) == b""
+
+
+async def test_get_into(s3_client: S3Client, s3_bucket_name):
+    data = secrets.token_bytes(1000)
+    object_name = f"{s3_bucket_name}/bytes.bin"
+    await s3_client.put(object_name, data)
+
+    buffer = bytearray(b"\0" * 1100)
+    size = await s3_client.get_into(
+        object_name, memoryview(buffer)[50:], workers_count=3, range_step=128,
+    )
+    assert size == len(data)
+    assert buffer[50:1050] == data
+    assert buffer[:50] == buffer[1050:] == b"\0" * 50
+
+    with pytest.raises(ValueError):
+        await s3_client.get_into(object_name, bytearray(999))
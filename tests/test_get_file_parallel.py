@@ -3,9 +3,30 @@ import os
 import secrets
 
 import pytest
+from httpx import Headers
 
 from httpx_s3_client import S3Client
 from httpx_s3_client.client import AwsDownloadError
+from httpx_s3_client.hedging import Hedging
+from httpx_s3_client.tuning import AutoTuner
+
+
+@pytest.mark.parametrize("use_pwrite", [True, False])
+async def test_get_file_parallel_many_ranges(
+    s3_client: S3Client, tmpdir, monkeypatch, s3_bucket_name, use_pwrite,
+):
+    if not use_pwrite:
+        monkeypatch.delattr("os.pwrite")
+    data = b"Hello world! " * 100
+    object_name = f"{s3_bucket_name}/bar.txt"
+    await s3_client.put(object_name, data)
+    await s3_client.get_file_parallel(
+        object_name,
+        tmpdir / "bar.txt",
+        workers_count=4,
+        range_step=100,
+    )
+    assert (tmpdir / "bar.txt").read_binary() == data
 
 
 async def test_get_file_parallel(s3_client: S3Client, tmpdir, s3_bucket_name):
@@ -74,3 +95,166 @@ async def test_get_file_that_changed_in_process_error(
         f"Got wrong status code 412 on range download of {s3_bucket_name}/test",
     )
     assert not os.path.exists(tmpdir / "temp.dat")
+
+
+async def test_get_file_parallel_resume(
+    s3_client: S3Client, tmp_path, monkeypatch, s3_bucket_name,
+):
+    data = secrets.token_bytes(1024 * 1024)
+    object_name = f"{s3_bucket_name}/resume.bin"
+    file_path = tmp_path / "resume.bin"
+    sidecar_path = tmp_path / "resume.bin.download"
+    range_step = 64 * 1024
+    await s3_client.put(object_name, data)
+
+    download_range = s3_client._download_range
+    requested = []
+
+    async def failing_download_range(*args, req_range_start, **kwargs):
+        if req_range_start >= 10 * range_step:
+            raise AwsDownloadError("Connection lost")
+        requested.append(req_range_start)
+        return await download_range(
+            *args, req_range_start=req_range_start, **kwargs
+        )
+
+    monkeypatch.setattr(s3_client, "_download_range", failing_download_range)
+    with pytest.raises(AwsDownloadError):
+        await s3_client.get_file_parallel(
+            object_name, file_path, range_step=range_step, resume=True,
+        )
+
+    assert file_path.exists()
+    assert sidecar_path.exists()
+    assert sorted(requested) == [i * range_step for i in range(10)]
+
+    async def spy_download_range(*args, **kwargs):
+        requested.append(kwargs["req_range_start"])
+        return await download_range(*args, **kwargs)
+
+    requested.clear()
+    monkeypatch.setattr(s3_client, "_download_range", spy_download_range)
+    await s3_client.get_file_parallel(
+        object_name, file_path, range_step=range_step,
+        workers_count=3, resume=True,
+    )
+
+    assert sorted(requested) == [i * range_step for i in range(10, 16)]
+    assert file_path.read_bytes() == data
+    assert not sidecar_path.exists()
+
+
+async def test_get_file_parallel_slow_range(
+    s3_client: S3Client, tmp_path, monkeypatch, s3_bucket_name,
+):
+    data = secrets.token_bytes(4096)
+    object_name = f"{s3_bucket_name}/slow.bin"
+    await s3_client.put(object_name, data)
+
+    download_range = s3_client._download_range
+    completed = []
+
+    async def slow_download_range(*args, req_range_start, **kwargs):
+        if req_range_start == 0:
+            await asyncio.sleep(0.5)
+        await download_range(*args, req_range_start=req_range_start, **kwargs)
+        completed.append(req_range_start)
+
+    monkeypatch.setattr(s3_client, "_download_range", slow_download_range)
+    await s3_client.get_file_parallel(
+        object_name, tmp_path / "slow.bin", workers_count=2, range_step=512,
+    )
+
+    # The second worker takes all other ranges while the first one is busy
+    assert completed == [i * 512 for i in range(1, 8)] + [0]
+    assert (tmp_path / "slow.bin").read_bytes() == data
+
+
+@pytest.mark.parametrize(
+    "size,workers_count,min_range_size,expected", [
+        # Big objects use the given range step
+        (100 * 1024 * 1024, 4, 256 * 1024, 5 * 1024 * 1024),
+        # Objects smaller than workers_count * range_step are split
+        (8 * 1024 * 1024, 4, 256 * 1024, 2 * 1024 * 1024),
+        # but ranges aren't smaller than min_range_size
+        (512 * 1024, 4, 256 * 1024, 256 * 1024),
+        (0, 4, 256 * 1024, 256 * 1024),
+    ],
+)
+async def test_get_file_parallel_plan_range_step(
+    s3_client: S3Client, tmp_path, monkeypatch,
+    size, workers_count, min_range_size, expected,
+):
+    async def head_object(*args, **kwargs):
+        return "etag", size, Headers()
+
+    requested = []
+
+    async def download_ranges(object_name, writer, *, ranges, **kwargs):
+        requested.extend(ranges)
+
+    monkeypatch.setattr(s3_client, "_head_object", head_object)
+    monkeypatch.setattr(s3_client, "_download_ranges", download_ranges)
+    await s3_client.get_file_parallel(
+        "test/planned", tmp_path / "planned", workers_count=workers_count,
+        min_range_size=min_range_size,
+    )
+    assert requested == [
+        (start, min(start + expected, size))
+        for start in range(0, size, expected)
+    ]
+
+
+async def test_get_file_parallel_auto_tuner(
+    s3_client: S3Client, tmp_path, s3_bucket_name,
+):
+    data = secrets.token_bytes(1024 * 1024)
+    object_name = f"{s3_bucket_name}/tuned.bin"
+    await s3_client.put(object_name, data)
+
+    auto_tuner = AutoTuner(max_workers_count=4, max_chunk_size=256 * 1024)
+    await s3_client.get_file_parallel(
+        object_name, tmp_path / "tuned.bin",
+        range_step=64 * 1024, auto_tuner=auto_tuner,
+    )
+    assert (tmp_path / "tuned.bin").read_bytes() == data
+
+    report = auto_tuner.report()
+    assert report.transferred == len(data)
+    assert 1 <= report.workers_count <= 4
+    assert report.chunk_size is not None
+    assert 64 * 1024 <= report.chunk_size <= 256 * 1024
+
+
+async def test_get_file_parallel_hedging(
+    s3_client: S3Client, tmp_path, monkeypatch, s3_bucket_name,
+):
+    data = secrets.token_bytes(16 * 512)
+    object_name = f"{s3_bucket_name}/hedged.bin"
+    await s3_client.put(object_name, data)
+
+    hedging = Hedging(min_samples=4, min_delay=0.5, max_ratio=1)
+    monkeypatch.setattr(s3_client, "_hedging", hedging)
+
+    download_range = s3_client._download_range
+    stalled = False
+
+    async def stalling_download_range(*args, req_range_start, **kwargs):
+        nonlocal stalled
+        if req_range_start == 15 * 512 and not stalled:
+            stalled = True
+            await asyncio.sleep(30)
+        await download_range(*args, req_range_start=req_range_start, **kwargs)
+
+    monkeypatch.setattr(s3_client, "_download_range", stalling_download_range)
+    await asyncio.wait_for(
+        s3_client.get_file_parallel(
+            object_name, tmp_path / "hedged.bin",
+            workers_count=2, range_step=512,
+        ),
+        timeout=10,
+    )
+
+    assert (tmp_path / "hedged.bin").read_bytes() == data
+    assert hedging.fired == 1
+    assert hedging.won == 1
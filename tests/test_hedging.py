@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from httpx_s3_client.hedging import Hedging
+
+
+async def warm_up(hedging: Hedging, size: int, count: int = 5):
+    async def fast():
+        return None
+
+    for _ in range(count):
+        await hedging.run(fast, size)
+
+
+async def test_hedging_not_fired_without_samples():
+    hedging = Hedging(min_samples=5)
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    assert await hedging.run(slow, 1024) == "done"
+    assert hedging.fired == 0
+
+
+async def test_hedging_won():
+    hedging = Hedging(min_samples=5, min_delay=0.01, max_ratio=1)
+    await warm_up(hedging, 1024)
+    calls = 0
+    cancelled = False
+
+    async def request():
+        nonlocal calls, cancelled
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+        return calls
+
+    assert await asyncio.wait_for(hedging.run(request, 1024), timeout=1) == 2
+    assert cancelled
+    assert hedging.fired == 1
+    assert hedging.won == 1
+
+    # Requests of other sizes have own latencies
+    assert hedging.delay(1024 * 1024) is None
+
+
+async def test_hedging_original_won():
+    hedging = Hedging(min_samples=5, min_delay=0.05, max_ratio=1)
+    await warm_up(hedging, 1024)
+    calls = 0
+
+    async def request():
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.1 if call == 1 else 10)
+        return call
+
+    assert await hedging.run(request, 1024) == 1
+    assert hedging.fired == 1
+    assert hedging.won == 0
+
+
+async def test_hedging_one_failed():
+    hedging = Hedging(min_samples=5, min_delay=0.01, max_ratio=1)
+    await warm_up(hedging, 1024)
+    calls = 0
+
+    async def request():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("Connection lost")
+        await asyncio.sleep(0.1)
+        return "done"
+
+    assert await hedging.run(request, 1024) == "done"
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("Connection lost")
+
+    with pytest.raises(RuntimeError):
+        await hedging.run(failing, 1024)
+
+
+async def test_hedging_max_ratio():
+    hedging = Hedging(min_samples=5, max_ratio=0.1)
+    await warm_up(hedging, 1024, count=10)
+    assert hedging.delay(1024) is not None
+
+    # No more than one duplicate per 10 requests
+    hedging.fired = 1
+    assert hedging.delay(1024) is None
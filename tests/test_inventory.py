@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pytest
+
+from httpx_s3_client import AwsObjectMeta, Inventory, ObjectColumns, S3Client
+from httpx_s3_client.inventory import prefix_end
+
+
+KEYS = ["logs/1", "logs/2", "logs/3", "data/a", "data/b", "database"]
+
+
+@pytest.fixture
+async def inventory_prefix(s3_client: S3Client, s3_bucket_name):
+    prefix = f"inventory/{uuid4().hex}/"
+    for i, key in enumerate(KEYS):
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{key}", b"x" * i)
+    return prefix
+
+
+@pytest.fixture
+def inventory(tmp_path, s3_bucket_name):
+    with Inventory(tmp_path / "inventory.db", s3_bucket_name) as inventory:
+        yield inventory
+
+
+@pytest.fixture
+def list_calls(s3_client: S3Client, monkeypatch):
+    calls: List[Dict[str, Any]] = []
+    list_objects_columns = s3_client.list_objects_columns
+
+    def wrapper(*args, **kwargs):
+        calls.append(kwargs)
+        return list_objects_columns(*args, **kwargs)
+
+    monkeypatch.setattr(s3_client, "list_objects_columns", wrapper)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "prefix,expected", [
+        ("", None),
+        ("a", "b"),
+        ("logs/", "logs0"),
+        ("a\U0010ffff", "b"),
+        ("a퟿", "a"),
+    ],
+)
+def test_prefix_end(prefix, expected):
+    assert prefix_end(prefix) == expected
+
+
+async def test_inventory_refresh(
+    s3_client: S3Client, inventory: Inventory, inventory_prefix,
+):
+    assert await inventory.refresh(s3_client, inventory_prefix) == len(KEYS)
+    assert inventory.refreshed_at(inventory_prefix) is not None
+
+    objects = [
+        meta
+        async for meta in s3_client.iter_objects_v2(
+            bucket=inventory.bucket, prefix=inventory_prefix,
+        )
+    ]
+    assert list(inventory.iter_objects(inventory_prefix)) == objects
+    assert inventory.get(objects[0].key) == objects[0]
+    assert inventory.get(f"{inventory_prefix}missing") is None
+
+    assert inventory.count(f"{inventory_prefix}data") == 3
+    assert inventory.count(f"{inventory_prefix}data/") == 2
+    assert inventory.total_size(f"{inventory_prefix}logs/") == 0 + 1 + 2
+    assert inventory.total_size(f"{inventory_prefix}nothing/") == 0
+    assert [
+        meta.key for meta in inventory.iter_objects(
+            inventory_prefix, start_after=f"{inventory_prefix}data/a", limit=2,
+        )
+    ] == [f"{inventory_prefix}data/b", f"{inventory_prefix}database"]
+
+
+async def test_inventory_incremental_refresh(
+    s3_client: S3Client, inventory: Inventory, inventory_prefix, list_calls,
+):
+    prefix = f"{inventory_prefix}logs/"
+    await inventory.refresh(s3_client, prefix)
+    await s3_client.put(f"{inventory.bucket}/{prefix}4", b"new")
+
+    assert await inventory.refresh(s3_client, prefix) == 1
+    assert list_calls[-1]["start_after"] == f"{prefix}3"
+    assert inventory.count(prefix) == 4
+    meta = inventory.get(f"{prefix}4")
+    assert meta is not None and meta.size == 3
+
+
+async def test_inventory_refresh_stale(
+    s3_client: S3Client, inventory: Inventory, inventory_prefix, list_calls,
+    tmp_path,
+):
+    await inventory.refresh(s3_client, inventory_prefix)
+    await s3_client.delete(f"{inventory.bucket}/{inventory_prefix}data/a")
+    await s3_client.put(
+        f"{inventory.bucket}/{inventory_prefix}data/b", b"replaced",
+    )
+
+    inventory.mark_stale(f"{inventory_prefix}data/")
+    inventory.mark_stale(f"{inventory_prefix}data/nested/")
+    assert inventory.stale_prefixes() == [f"{inventory_prefix}data/"]
+
+    # The index survives reopening
+    inventory.close()
+    inventory = Inventory(tmp_path / "inventory.db", inventory.bucket)
+    assert await inventory.refresh_stale(s3_client) == 1
+    assert list_calls[-1]["prefix"] == f"{inventory_prefix}data/"
+    assert list_calls[-1]["start_after"] is None
+    assert inventory.stale_prefixes() == []
+
+    assert inventory.get(f"{inventory_prefix}data/a") is None
+    meta = inventory.get(f"{inventory_prefix}data/b")
+    assert meta is not None and meta.size == len(b"replaced")
+    assert inventory.count(inventory_prefix) == len(KEYS) - 1
+    inventory.close()
+
+
+def test_inventory_add_remove(inventory: Inventory):
+    objects = [
+        AwsObjectMeta(
+            etag=f'"{i:032x}"',
+            key=f"key{i}",
+            last_modified=datetime(2023, 7, 1, 0, 0, i, 1000, timezone.utc),
+            size=i,
+            storage_class="STANDARD",
+        )
+        for i in range(10)
+    ]
+    inventory.add(objects[:5])
+    inventory.add(ObjectColumns(objects[5:]))
+    assert list(inventory.iter_objects()) == objects
+
+    inventory.remove(meta.key for meta in objects[::2])
+    assert list(inventory.iter_objects()) == objects[1::2]
+    assert inventory.last_key() == "key9"
+
+    with Inventory(inventory.path, "other") as other:
+        assert other.count() == 0
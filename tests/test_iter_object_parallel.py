@@ -0,0 +1,45 @@
+import secrets
+
+import pytest
+
+from httpx_s3_client import S3Client
+
+
+@pytest.mark.parametrize("window", [1, 3])
+async def test_iter_object_parallel(s3_client: S3Client, s3_bucket_name, window):
+    data = secrets.token_bytes(1024 * 1024 + 7)
+    object_name = f"{s3_bucket_name}/iter.bin"
+    await s3_client.put(object_name, data)
+
+    chunks = [
+        chunk async for chunk in s3_client.iter_object_parallel(
+            object_name, range_step=64 * 1024, window=window,
+        )
+    ]
+    assert len(chunks) == 17
+    assert all(len(chunk) == 64 * 1024 for chunk in chunks[:-1])
+    assert b"".join(chunks) == data
+
+
+async def test_iter_object_parallel_break(s3_client: S3Client, s3_bucket_name):
+    data = secrets.token_bytes(1024 * 1024)
+    object_name = f"{s3_bucket_name}/iter.bin"
+    await s3_client.put(object_name, data)
+
+    iterator = s3_client.iter_object_parallel(
+        object_name, range_step=64 * 1024, window=4,
+    )
+    async for chunk in iterator:
+        assert chunk == data[:64 * 1024]
+        break
+    await iterator.aclose()
+
+
+async def test_iter_object_parallel_wrong_window(
+    s3_client: S3Client, s3_bucket_name,
+):
+    with pytest.raises(ValueError):
+        async for _ in s3_client.iter_object_parallel(
+            f"{s3_bucket_name}/iter.bin", window=0,
+        ):
+            pass
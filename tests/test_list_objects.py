@@ -0,0 +1,123 @@
+from typing import List
+
+import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
+
+from httpx_s3_client import S3Client
+
+
+KEYS = [
+    "a/1", "a/2", "a/b/1", "a/b/2", "a/c/1",
+    "b/1", "b/2", "c", "d/e/f/1",
+]
+
+
+@pytest.fixture
+async def listing_prefix(s3_client: S3Client, s3_bucket_name):
+    prefix = "sharded/"
+    for key in KEYS:
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{key}", b"data")
+    return prefix
+
+
+async def test_list_objects_v2_pages(
+    s3_client: S3Client, s3_bucket_name, listing_prefix,
+):
+    objects: List[str] = []
+    common_prefixes: List[str] = []
+    async for page in s3_client.list_objects_v2_pages(
+        bucket=s3_bucket_name,
+        prefix=listing_prefix,
+        delimiter="/",
+        max_keys=2,
+    ):
+        objects.extend(meta.key for meta in page.objects)
+        common_prefixes.extend(page.common_prefixes)
+
+    assert objects == [f"{listing_prefix}c"]
+    assert common_prefixes == [
+        f"{listing_prefix}{name}/" for name in ("a", "b", "d")
+    ]
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+async def test_list_objects_parallel(
+    s3_client: S3Client, s3_bucket_name, listing_prefix, depth,
+):
+    keys: List[str] = []
+    async for page in s3_client.list_objects_parallel(
+        bucket=s3_bucket_name,
+        prefix=listing_prefix,
+        depth=depth,
+        workers_count=3,
+        max_keys=2,
+    ):
+        keys.extend(meta.key for meta in page)
+
+    assert sorted(keys) == [f"{listing_prefix}{key}" for key in KEYS]
+
+
+async def test_list_objects_parallel_split_points(
+    s3_client: S3Client, s3_bucket_name, listing_prefix,
+):
+    keys: List[str] = []
+    async for page in s3_client.list_objects_parallel(
+        bucket=s3_bucket_name,
+        prefix=listing_prefix,
+        split_points=[f"{listing_prefix}b/1", f"{listing_prefix}a/b"],
+        max_keys=2,
+    ):
+        keys.extend(meta.key for meta in page)
+
+    assert sorted(keys) == [f"{listing_prefix}{key}" for key in KEYS]
+    assert len(keys) == len(KEYS)
+
+
+async def test_list_objects_parallel_error(
+    s3_client: S3Client, httpx_mock: HTTPXMock,
+):
+    def callback(request: Request) -> Response:
+        return Response(500)
+
+    httpx_mock.add_callback(callback)
+
+    with pytest.raises(Exception, match="wrong status"):
+        async for _ in s3_client.list_objects_parallel(bucket="test"):
+            pass
+
+
+@pytest.mark.parametrize("parse_in_thread", [False, True])
+async def test_iter_objects_v2(
+    s3_client: S3Client, s3_bucket_name, listing_prefix, parse_in_thread,
+):
+    keys = [
+        meta.key
+        async for meta in s3_client.iter_objects_v2(
+            bucket=s3_bucket_name,
+            prefix=listing_prefix,
+            max_keys=4,
+            parse_in_thread=parse_in_thread,
+        )
+    ]
+    assert keys == [f"{listing_prefix}{key}" for key in KEYS]
+
+
+async def test_list_objects_columns(
+    s3_client: S3Client, s3_bucket_name, listing_prefix,
+):
+    objects = [
+        meta
+        async for meta in s3_client.iter_objects_v2(
+            bucket=s3_bucket_name, prefix=listing_prefix,
+        )
+    ]
+    pages = [
+        columns
+        async for columns in s3_client.list_objects_columns(
+            bucket=s3_bucket_name, prefix=listing_prefix, max_keys=4,
+        )
+    ]
+    assert [len(columns) for columns in pages] == [4, 4, 1]
+    assert [meta for columns in pages for meta in columns] == objects
+    assert sum(columns.total_size() for columns in pages) == 4 * len(KEYS)
@@ -0,0 +1,182 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+from httpx import Response
+from pytest_httpx import HTTPXMock
+
+from httpx_s3_client import S3Client
+from httpx_s3_client.budget import MemoryBudget, reserve
+from httpx_s3_client.client import PART_SIZE, AwsUploadError
+from httpx_s3_client.hedging import Hedging
+
+
+async def test_memory_budget_order():
+    budget = MemoryBudget(10)
+    await budget.acquire(6)
+
+    granted = []
+
+    async def acquire(name: str, size: int) -> None:
+        await budget.acquire(size)
+        granted.append(name)
+
+    large = asyncio.ensure_future(acquire("large", 8))
+    await asyncio.sleep(0)
+    small = asyncio.ensure_future(acquire("small", 2))
+    await asyncio.sleep(0)
+    # The small reservation fits, but waits for the earlier one
+    assert granted == []
+
+    budget.release(6)
+    await asyncio.sleep(0)
+    assert granted == ["large", "small"]
+    assert budget.used == 10
+    assert budget.peak == 10
+    assert budget.waits == 2
+    await asyncio.gather(large, small)
+
+
+async def test_memory_budget_clamp():
+    budget = MemoryBudget(10)
+    async with reserve(budget, 100):
+        assert budget.used == 10
+        assert budget.available == 0
+    assert budget.used == 0
+
+    async with reserve(None, 100):
+        pass
+
+
+async def test_memory_budget_cancel():
+    budget = MemoryBudget(10)
+    await budget.acquire(10)
+
+    waiter = asyncio.ensure_future(budget.acquire(5))
+    await asyncio.sleep(0)
+    next_waiter = asyncio.ensure_future(budget.acquire(5))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    budget.release(10)
+    await next_waiter
+    assert budget.used == 5
+
+
+@pytest.fixture
+def budget_client(make_s3_client) -> S3Client:
+    return make_s3_client(memory_budget=MemoryBudget(2 * PART_SIZE))
+
+
+async def test_memory_budget_transfers(
+    budget_client: S3Client, s3_bucket_name, tmp_path,
+):
+    budget = budget_client.memory_budget
+    assert budget is not None
+    prefix = f"{s3_bucket_name}/budget/{uuid4().hex}"
+    parts = [os.urandom(PART_SIZE) for _ in range(3)]
+    (tmp_path / "file.bin").write_bytes(b"".join(parts))
+
+    await asyncio.gather(
+        *(
+            budget_client.put_multipart(
+                f"{prefix}/{i}.bin", iter(parts), workers_count=3,
+            )
+            for i in range(3)
+        ),
+        budget_client.put_file_multipart(
+            f"{prefix}/file.bin", tmp_path / "file.bin",
+            part_size=PART_SIZE, workers_count=3,
+        ),
+    )
+    await asyncio.gather(
+        *(
+            budget_client.get_file_parallel(
+                f"{prefix}/{i}.bin", tmp_path / f"{i}.bin",
+                range_step=PART_SIZE, workers_count=3,
+            )
+            for i in range(3)
+        ),
+    )
+
+    assert budget.peak <= budget.limit
+    assert budget.waits > 0
+    assert budget.used == 0
+    for i in range(3):
+        assert (tmp_path / f"{i}.bin").read_bytes() == b"".join(parts)
+
+    chunks = [
+        chunk async for chunk in budget_client.iter_object_parallel(
+            f"{prefix}/file.bin", range_step=PART_SIZE, window=3,
+        )
+    ]
+    assert b"".join(chunks) == b"".join(parts)
+    assert budget.used == 0
+
+
+async def test_memory_budget_released_on_failure(
+    httpx_mock: HTTPXMock, make_s3_client,
+):
+    httpx_mock.add_response(
+        method="POST",
+        content=b"<Result><UploadId>upload</UploadId></Result>",
+    )
+    httpx_mock.add_callback(
+        lambda request: Response(500), method="PUT",
+    )
+
+    budget = MemoryBudget(1024)
+    s3_client = make_s3_client(memory_budget=budget)
+    with pytest.raises(AwsUploadError):
+        await s3_client.put_multipart(
+            "/test/test",
+            (b"x" * 100 for _ in range(20)),
+            workers_count=2,
+            part_upload_tries=1,
+        )
+
+    assert budget.used == 0
+
+
+async def test_memory_budget_iter_object_parallel(
+    budget_client: S3Client, s3_bucket_name,
+):
+    budget = budget_client.memory_budget
+    assert budget is not None
+    object_name = f"{s3_bucket_name}/budget/{uuid4().hex}"
+    await budget_client.put(object_name, os.urandom(4 * 1024 * 1024))
+
+    chunks = budget_client.iter_object_parallel(
+        object_name, range_step=1024 * 1024, window=2,
+    )
+    async for chunk in chunks:
+        # The range is reserved until the consumer takes the next one
+        assert budget.used >= len(chunk)
+        break
+    await chunks.aclose()
+    assert budget.used == 0
+
+
+async def test_memory_budget_hedge(make_s3_client):
+    budget = MemoryBudget(1024)
+    hedging = Hedging(min_samples=1, min_delay=0.01, max_ratio=1)
+    hedging.record(100, 0)
+    calls = 0
+
+    async def read_part() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return budget.used
+
+    s3_client = make_s3_client(hedging=hedging, memory_budget=budget)
+    # The hedge reads its own copy of the part
+    assert await s3_client._hedged(read_part, 100, buffered=True)() == 100
+    calls = 0
+    assert await s3_client._hedged(read_part, 100)() == 0
+
+    assert budget.used == 0
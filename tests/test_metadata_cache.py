@@ -0,0 +1,156 @@
+from http import HTTPStatus
+from typing import List
+
+import pytest
+from httpx import Request, Response
+
+from httpx_s3_client import S3Client
+from httpx_s3_client.client import AwsDownloadError
+from httpx_s3_client.cache import MetadataCache
+
+
+@pytest.fixture
+def metadata_cache() -> MetadataCache:
+    return MetadataCache(max_size=2, ttl=60)
+
+
+@pytest.fixture
+def cached_client(make_s3_client, metadata_cache) -> S3Client:
+    return make_s3_client(metadata_cache=metadata_cache)
+
+
+def head_requests(requests: List[Request]) -> List[Request]:
+    return [request for request in requests if request.method == "HEAD"]
+
+
+def make_response(etag: str, size: int = 10) -> Response:
+    return Response(
+        200,
+        headers={"ETag": etag, "Content-Length": str(size)},
+        request=Request("HEAD", "http://s3/bucket/key"),
+    )
+
+
+def test_metadata_cache_lru():
+    cache = MetadataCache(max_size=2)
+    cache.store("a", make_response('"a"'))
+    cache.store("b", make_response('"b"'))
+    assert cache.get("a") is not None
+    cache.store("c", make_response('"c"', 20))
+
+    assert "b" not in cache
+    assert "a" in cache
+    entry = cache.get("c")
+    assert entry is not None and entry.size == 20 and entry.etag == '"c"'
+    assert cache.evictions == 1
+    assert cache.hits == 2
+    assert cache.get("b") is None
+    assert cache.misses == 1
+
+
+def test_metadata_cache_ttl():
+    cache = MetadataCache(ttl=0)
+    entry = cache.store("a", make_response('"a"'))
+    assert not entry.is_fresh()
+    assert cache.get("a") is entry
+    assert cache.hits == 0
+
+    cache.ttl = 60
+    entry = cache.revalidate("a", entry)
+    assert entry.is_fresh()
+    assert cache.get("a") == entry
+    assert cache.revalidations == 1
+
+    cache.invalidate("a")
+    assert len(cache) == 0
+
+
+async def test_head_cached(
+    cached_client: S3Client, s3_bucket_name, requests, metadata_cache,
+):
+    object_name = f"/{s3_bucket_name}/cached"
+    await cached_client.put(object_name, b"content")
+
+    first = await cached_client.head(object_name)
+    second = await cached_client.head(object_name)
+    assert len(head_requests(requests)) == 1
+    assert second.status_code == HTTPStatus.OK
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert metadata_cache.hits == 1
+
+    # Requests with headers aren't cached
+    await cached_client.head(object_name, headers={"X-Custom": "1"})
+    assert len(head_requests(requests)) == 2
+
+    # Put invalidates the entry
+    await cached_client.put(object_name, b"new content")
+    resp = await cached_client.head(object_name)
+    assert len(head_requests(requests)) == 3
+    assert int(resp.headers["Content-Length"]) == len(b"new content")
+
+    # Delete invalidates the entry
+    await cached_client.delete(object_name)
+    resp = await cached_client.head(object_name)
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+    assert len(metadata_cache) == 0
+
+
+async def test_head_revalidated(
+    cached_client: S3Client, s3_bucket_name, requests, metadata_cache,
+):
+    object_name = f"/{s3_bucket_name}/revalidated"
+    await cached_client.put(object_name, b"content")
+    metadata_cache.ttl = 0
+
+    first = await cached_client.head(object_name)
+    second = await cached_client.head(object_name)
+    heads = head_requests(requests)
+    assert len(heads) == 2
+    assert "If-None-Match" not in heads[0].headers
+    assert heads[1].headers["If-None-Match"] == first.headers["ETag"]
+    assert second.status_code == HTTPStatus.OK
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert metadata_cache.revalidations == 1
+
+
+async def test_delete_objects_invalidates(
+    cached_client: S3Client, s3_bucket_name, metadata_cache,
+):
+    object_name = f"/{s3_bucket_name}/batch/deleted"
+    await cached_client.put(object_name, b"content")
+    await cached_client.head(object_name)
+    assert len(metadata_cache) == 1
+
+    await cached_client.delete_objects(["batch/deleted"], bucket=s3_bucket_name)
+    assert len(metadata_cache) == 0
+
+
+async def test_get_file_parallel_uses_cache(
+    cached_client: S3Client, s3_bucket_name, requests, tmp_path,
+):
+    object_name = f"/{s3_bucket_name}/parallel"
+    await cached_client.put(object_name, b"content" * 100)
+    for i in range(3):
+        await cached_client.get_file_parallel(
+            object_name, tmp_path / f"file{i}", workers_count=2,
+        )
+        assert (tmp_path / f"file{i}").read_bytes() == b"content" * 100
+    assert len(head_requests(requests)) == 1
+
+
+async def test_outdated_etag_invalidated(
+    cached_client: S3Client, s3_client: S3Client, s3_bucket_name,
+    metadata_cache, tmp_path,
+):
+    object_name = f"/{s3_bucket_name}/outdated"
+    await cached_client.put(object_name, b"content")
+    await cached_client.head(object_name)
+    # The object is replaced by another client
+    await s3_client.put(object_name, b"replaced")
+
+    with pytest.raises(AwsDownloadError):
+        await cached_client.get_file_parallel(object_name, tmp_path / "file")
+    assert len(metadata_cache) == 0
+
+    await cached_client.get_file_parallel(object_name, tmp_path / "file")
+    assert (tmp_path / "file").read_bytes() == b"replaced"
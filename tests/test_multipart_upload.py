@@ -1,6 +1,16 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+
 import pytest
+from httpx import Request, Response
+from pytest_httpx import HTTPXMock
 
 from httpx_s3_client import S3Client
+from httpx_s3_client.client import AwsUploadError
+from httpx_s3_client.checkpoint import UploadCheckpoint
+from httpx_s3_client.parts import MAX_PART_SIZE, MIN_PART_SIZE
+from httpx_s3_client.tuning import AutoTuner
 
 
 async def test_multipart_file_upload(s3_client: S3Client, s3_read, tmp_path, s3_bucket_name):
@@ -19,6 +29,94 @@ async def test_multipart_file_upload(s3_client: S3Client, s3_read, tmp_path, s3_
     assert data == (await s3_read(f"/{s3_bucket_name}/test_multipart")).content
 
 
+@pytest.mark.parametrize("use_pread", [True, False])
+@pytest.mark.parametrize("calculate_content_sha256", [True, False])
+async def test_multipart_file_upload_parallel(
+    use_pread, calculate_content_sha256, monkeypatch,
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name,
+):
+    if not use_pread:
+        monkeypatch.delattr("os.pread")
+
+    data = b"hello, world" * 1024 * 1024
+    (tmp_path / "hello.txt").write_bytes(data)
+
+    await s3_client.put_file_multipart(
+        f"/{s3_bucket_name}/test_multipart",
+        tmp_path / "hello.txt",
+        part_size=5 * (1024 * 1024),
+        workers_count=3,
+        calculate_content_sha256=calculate_content_sha256,
+    )
+
+    assert data == (await s3_read(f"/{s3_bucket_name}/test_multipart")).content
+
+
+@pytest.mark.parametrize("use_pread", [True, False])
+async def test_multipart_file_upload_auto_tuner(
+    use_pread, monkeypatch, s3_client: S3Client, s3_read, tmp_path,
+    s3_bucket_name,
+):
+    if not use_pread:
+        monkeypatch.delattr("os.pread")
+
+    data = b"hello, world" * 1024 * 1024 * 3
+    (tmp_path / "hello.txt").write_bytes(data)
+
+    auto_tuner = AutoTuner(max_workers_count=4)
+    await s3_client.put_file_multipart(
+        f"/{s3_bucket_name}/test_multipart",
+        tmp_path / "hello.txt",
+        part_size=5 * (1024 * 1024),
+        auto_tuner=auto_tuner,
+    )
+
+    assert data == (await s3_read(f"/{s3_bucket_name}/test_multipart")).content
+    report = auto_tuner.report()
+    assert report.transferred == len(data)
+    assert 1 <= report.workers_count <= 4
+    if not use_pread:
+        assert report.chunk_size is None
+
+
+async def test_multipart_file_part_reread_on_retry(
+    s3_client: S3Client, httpx_mock: HTTPXMock, tmp_path,
+):
+    data = bytes(range(256)) * 1024 * 32
+    (tmp_path / "data.bin").write_bytes(data)
+    uploaded = {}
+    failed = set()
+
+    def callback(request: Request) -> Response:
+        if request.method == "POST" and "uploads" in request.url.params:
+            return Response(
+                200, content=b"<Result><UploadId>upload</UploadId></Result>",
+            )
+        if request.method == "PUT":
+            part_no = int(request.url.params["partNumber"])
+            content = request.read()
+            assert request.headers["x-amz-content-sha256"] == (
+                hashlib.sha256(content).hexdigest()
+            )
+            if part_no not in failed:
+                failed.add(part_no)
+                return Response(500)
+            uploaded[part_no] = content
+            return Response(200, headers={"Etag": f'"{part_no}"'})
+        return Response(200)
+
+    httpx_mock.add_callback(callback)
+
+    await s3_client.put_file_multipart(
+        "/test/test",
+        tmp_path / "data.bin",
+        part_size=5 * 1024 * 1024,
+        workers_count=2,
+    )
+
+    assert b"".join(uploaded[i] for i in sorted(uploaded)) == data
+
+
 @pytest.mark.parametrize("calculate_content_sha256", [True, False])
 @pytest.mark.parametrize("workers_count", [1, 2])
 async def test_multipart_stream_upload(
@@ -38,3 +136,320 @@ async def test_multipart_stream_upload(
     )
 
     assert (await s3_read(f"/{s3_bucket_name}/test")).content == b"hello world" * 1024 * 1024 * 8
+
+
+async def test_multipart_streaming_signature(
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name,
+):
+    data = b"hello, world" * 1024 * 1024
+    (tmp_path / "hello.txt").write_bytes(data)
+
+    await s3_client.put_file_multipart(
+        f"/{s3_bucket_name}/test_multipart",
+        tmp_path / "hello.txt",
+        part_size=5 * (1024 * 1024),
+        workers_count=2,
+        streaming_signature=True,
+    )
+
+    assert data == (await s3_read(f"/{s3_bucket_name}/test_multipart")).content
+
+
+@pytest.mark.parametrize(
+    "executor_class", [ThreadPoolExecutor, ProcessPoolExecutor],
+)
+async def test_multipart_hash_executor(
+    executor_class, s3_client: S3Client, httpx_mock: HTTPXMock,
+):
+    parts = [bytes([i]) * 1024 * 1024 for i in range(8)]
+    uploaded = {}
+
+    def callback(request: Request) -> Response:
+        if request.method == "POST" and "uploads" in request.url.params:
+            return Response(
+                200, content=b"<Result><UploadId>upload</UploadId></Result>",
+            )
+        if request.method == "PUT":
+            content = request.read()
+            assert request.headers["x-amz-content-sha256"] == (
+                hashlib.sha256(content).hexdigest()
+            )
+            part_no = int(request.url.params["partNumber"])
+            uploaded[part_no] = content
+            return Response(200, headers={"Etag": f'"{part_no}"'})
+        return Response(200)
+
+    httpx_mock.add_callback(callback)
+
+    with executor_class(4) as executor:
+        await s3_client.put_multipart(
+            "/test/test",
+            iter(parts),
+            workers_count=4,
+            hash_executor=executor,
+        )
+
+    assert [uploaded[i + 1] for i in range(len(parts))] == parts
+
+
+async def test_multipart_resume_from_checkpoint(
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name, monkeypatch,
+):
+    object_name = f"/{s3_bucket_name}/test_resume"
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    parts = [bytes([i]) * 5 * 1024 * 1024 for i in range(6)]
+
+    def failing_iterable():
+        yield from parts[:3]
+        raise RuntimeError("Source failed")
+
+    with pytest.raises(RuntimeError):
+        await s3_client.put_multipart(
+            object_name,
+            failing_iterable(),
+            checkpoint_path=checkpoint_path,
+        )
+
+    state = UploadCheckpoint(checkpoint_path).load()
+    assert state is not None
+    assert state.object_name == object_name
+    assert state.parts
+    assert set(state.parts) <= {1, 2, 3}
+
+    put_part = s3_client._put_part
+    sent_parts = []
+
+    async def spy(*args, part_no, **kwargs):
+        sent_parts.append(part_no)
+        return await put_part(*args, part_no=part_no, **kwargs)  # type: ignore[misc]
+
+    monkeypatch.setattr(s3_client, "_put_part", spy)
+
+    await s3_client.put_multipart(
+        object_name,
+        iter(parts),
+        workers_count=2,
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert sorted(sent_parts) == sorted({1, 2, 3, 4, 5, 6} - set(state.parts))
+    assert not checkpoint_path.exists()
+    assert (await s3_read(object_name)).content == b"".join(parts)
+
+
+async def test_multipart_resume_with_another_part_size(
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name, monkeypatch,
+):
+    object_name = f"/{s3_bucket_name}/test_resume_part_size"
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    data = bytes(range(256)) * 4 * 1024 * 18
+    (tmp_path / "data.bin").write_bytes(data)
+
+    put_part = s3_client._put_part
+    sent_parts: List[int] = []
+
+    async def failing(*args, part_no, **kwargs):
+        if part_no == 3:
+            raise RuntimeError("Upload failed")
+        return await put_part(*args, part_no=part_no, **kwargs)  # type: ignore[misc]
+
+    monkeypatch.setattr(s3_client, "_put_part", failing)
+    with pytest.raises(RuntimeError):
+        await s3_client.put_file_multipart(
+            object_name, tmp_path / "data.bin",
+            part_size=5 * 1024 * 1024,
+            checkpoint_path=checkpoint_path,
+        )
+    state = UploadCheckpoint(checkpoint_path).load()
+    assert state is not None
+    assert state.parts
+    assert state.source is not None
+    assert state.source["part_size"] == 5 * 1024 * 1024
+
+    async def spy(*args, part_no, **kwargs):
+        sent_parts.append(part_no)
+        return await put_part(*args, part_no=part_no, **kwargs)  # type: ignore[misc]
+
+    monkeypatch.setattr(s3_client, "_put_part", spy)
+    await s3_client.put_file_multipart(
+        object_name, tmp_path / "data.bin",
+        part_size=6 * 1024 * 1024,
+        checkpoint_path=checkpoint_path,
+    )
+
+    # Parts of 5MiB can't be reused, the old upload is aborted
+    assert sorted(sent_parts) == [1, 2, 3]
+    assert await s3_client._list_parts(object_name, state.upload_id) is None
+    assert not checkpoint_path.exists()
+    assert (await s3_read(object_name)).content == data
+
+
+async def test_multipart_stale_checkpoint(
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name,
+):
+    object_name = f"/{s3_bucket_name}/test_resume"
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    checkpoint = UploadCheckpoint(checkpoint_path)
+    checkpoint.start("not-existing-upload", object_name, {1: "etag"})
+    checkpoint.close()
+
+    data = b"hello world" * 1024
+    await s3_client.put_multipart(
+        object_name, iter([data]), checkpoint_path=checkpoint_path,
+    )
+
+    assert not checkpoint_path.exists()
+    assert (await s3_read(object_name)).content == data
+
+
+@pytest.mark.parametrize("streaming_signature", [True, False])
+async def test_multipart_async_stream_upload(
+    streaming_signature, s3_client: S3Client, s3_read, s3_bucket_name,
+):
+    closed = False
+
+    async def iterable():
+        nonlocal closed
+        try:
+            for i in range(3):
+                yield bytes([i]) * 5 * 1024 * 1024
+        finally:
+            closed = True
+
+    await s3_client.put_multipart(
+        f"/{s3_bucket_name}/test_async_stream",
+        iterable(),
+        workers_count=2,
+        streaming_signature=streaming_signature,
+    )
+
+    assert closed
+    assert (
+        await s3_read(f"/{s3_bucket_name}/test_async_stream")
+    ).content == b"".join(bytes([i]) * 5 * 1024 * 1024 for i in range(3))
+
+
+async def test_multipart_async_stream_proxy(
+    s3_client: S3Client, s3_read, s3_bucket_name,
+):
+    data = b"proxied" * 1024 * 1024
+    await s3_client.put(f"/{s3_bucket_name}/test_proxy_source", data)
+
+    async with s3_client.stream(
+        "GET", f"/{s3_bucket_name}/test_proxy_source",
+    ) as resp:
+        await s3_client.put_multipart(
+            f"/{s3_bucket_name}/test_proxy_copy",
+            resp.aiter_bytes(5 * 1024 * 1024),
+            workers_count=2,
+        )
+
+    assert (
+        await s3_read(f"/{s3_bucket_name}/test_proxy_copy")
+    ).content == data
+
+
+@pytest.mark.parametrize("streaming_signature", [True, False])
+@pytest.mark.parametrize("async_content", [True, False])
+async def test_multipart_rechunked_upload(
+    streaming_signature, async_content, s3_client: S3Client, s3_read,
+    s3_bucket_name,
+):
+    chunks = [bytes([i % 256]) * 64 * 1024 for i in range(200)]
+    part_sizes = []
+
+    async def on_request(request: Request) -> None:
+        if "partNumber" in request.url.params:
+            part_sizes.append(
+                int(
+                    request.headers.get("x-amz-decoded-content-length")
+                    or request.headers["Content-Length"],
+                ),
+            )
+
+    async def async_iterable():
+        for chunk in chunks:
+            yield chunk
+
+    s3_client._client.event_hooks["request"].append(on_request)
+    await s3_client.put_multipart(
+        f"/{s3_bucket_name}/test_rechunked",
+        async_iterable() if async_content else iter(chunks),
+        workers_count=2,
+        part_size=5 * 1024 * 1024,
+        streaming_signature=streaming_signature,
+    )
+
+    assert sorted(part_sizes) == [
+        2 * 1024 * 1024 + 512 * 1024, 5 * 1024 * 1024, 5 * 1024 * 1024,
+    ]
+    assert (
+        await s3_read(f"/{s3_bucket_name}/test_rechunked")
+    ).content == b"".join(chunks)
+
+
+async def test_multipart_rechunked_hash_executor(
+    s3_client: S3Client, httpx_mock: HTTPXMock, monkeypatch,
+):
+    monkeypatch.setattr("httpx_s3_client.client.MIN_PART_SIZE", 1)
+    uploaded = {}
+
+    async def callback(request: Request) -> Response:
+        if request.method == "POST" and "uploads" in request.url.params:
+            return Response(
+                200, content=b"<Result><UploadId>upload</UploadId></Result>",
+            )
+        if request.method == "PUT":
+            content = await request.aread()
+            assert request.headers["x-amz-content-sha256"] == (
+                hashlib.sha256(content).hexdigest()
+            )
+            part_no = int(request.url.params["partNumber"])
+            uploaded[part_no] = content
+            return Response(200, headers={"Etag": f'"{part_no}"'})
+        return Response(200)
+
+    httpx_mock.add_callback(callback)
+
+    data = bytes(range(256)) * 1024
+    with ProcessPoolExecutor(2) as executor:
+        await s3_client.put_multipart(
+            "/test/test",
+            (data[i:i + 1000] for i in range(0, len(data), 1000)),
+            workers_count=2,
+            hash_executor=executor,
+            part_size=100 * 1024,
+        )
+
+    assert len(uploaded) == 3
+    assert b"".join(uploaded[i] for i in sorted(uploaded)) == data
+
+
+@pytest.mark.parametrize(
+    "part_size", [MIN_PART_SIZE - 1, MAX_PART_SIZE + 1],
+)
+async def test_multipart_part_size_out_of_bounds(
+    s3_client: S3Client, part_size,
+):
+    with pytest.raises(ValueError):
+        await s3_client.put_multipart(
+            "/test/test", (b"x" for _ in range(2)), part_size=part_size,
+        )
+
+
+async def test_multipart_too_many_parts(
+    s3_client: S3Client, httpx_mock: HTTPXMock, monkeypatch,
+):
+    monkeypatch.setattr("httpx_s3_client.client.MAX_PARTS_COUNT", 3)
+    httpx_mock.add_response(
+        method="POST",
+        content=b"<Result><UploadId>upload</UploadId></Result>",
+    )
+    httpx_mock.add_response(method="PUT", headers={"Etag": '"etag"'})
+
+    with pytest.raises(AwsUploadError):
+        await s3_client.put_multipart(
+            "/test/test",
+            (b"x" for _ in range(4)),
+            workers_count=1,
+        )
@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+
+from httpx_s3_client.parts import (
+    MAX_PART_SIZE, MIN_PART_SIZE, BufferPool, RechunkedParts, plan_part_size,
+)
+
+
+MiB = 1024 * 1024
+
+
+@pytest.mark.parametrize(
+    "total_size,buffer_budget,buffers_count,expected", [
+        (None, None, 1, MIN_PART_SIZE),
+        (10 * MiB, None, 1, MIN_PART_SIZE),
+        (100 * 1024 * MiB, None, 1, 11 * MiB),
+        (100 * 1024 * MiB, 1024 * MiB, 8, 11 * MiB),
+        (None, 1024 * MiB, 8, 128 * MiB),
+        (None, 1000 * MiB, 3, 333 * MiB),
+        (None, 1024 * 1024 * MiB, 1, MAX_PART_SIZE),
+    ],
+)
+def test_plan_part_size(total_size, buffer_budget, buffers_count, expected):
+    assert plan_part_size(
+        total_size, buffer_budget=buffer_budget, buffers_count=buffers_count,
+    ) == expected
+
+
+def test_plan_part_size_errors():
+    with pytest.raises(ValueError):
+        plan_part_size(100 * 1024 * MiB, buffer_budget=10 * MiB)
+    with pytest.raises(ValueError):
+        plan_part_size(None, buffer_budget=16 * MiB, buffers_count=4)
+    with pytest.raises(ValueError):
+        plan_part_size(10000 * MAX_PART_SIZE + 1)
+
+
+class Chunks:
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+        self.entered = self.exited = False
+
+    async def __aenter__(self) -> "Chunks":
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.exited = True
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield None, chunk
+
+
+async def test_rechunked_parts():
+    chunks = [bytes([i]) * 3 for i in range(7)]
+    pool = BufferPool(5, 2)
+    gen = Chunks(chunks)
+    parts: List[Tuple[Any, bytes]] = []
+    async with RechunkedParts(gen, pool) as rechunked:
+        assert gen.entered
+        async for part_hash, part in rechunked:
+            parts.append((part_hash, bytes(part.data)))
+            part.release()
+    assert gen.exited
+
+    assert [part for _, part in parts] == [
+        b"\x00\x00\x00\x01\x01",
+        b"\x01\x02\x02\x02\x03",
+        b"\x03\x03\x04\x04\x04",
+        b"\x05\x05\x05\x06\x06",
+        b"\x06",
+    ]
+    assert pool.allocated == 1
+
+
+async def test_rechunked_parts_empty():
+    parts = []
+    async with RechunkedParts(Chunks([]), BufferPool(5, 1)) as rechunked:
+        async for _, part in rechunked:
+            parts.append(bytes(part.data))
+    assert parts == [b""]
+
+
+async def test_buffer_pool_limit():
+    pool = BufferPool(5, 2)
+    first = await pool.acquire()
+    await pool.acquire()
+
+    acquire = asyncio.ensure_future(pool.acquire())
+    await asyncio.sleep(0)
+    assert not acquire.done()
+
+    pool.release(first)
+    assert await acquire is first
+    assert pool.allocated == 2
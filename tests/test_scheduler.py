@@ -0,0 +1,190 @@
+import asyncio
+from typing import List
+from uuid import uuid4
+
+import pytest
+from httpx import Request
+
+from httpx_s3_client import Inventory, S3Client
+from httpx_s3_client.scheduler import Priority, Scheduler, scheduled
+
+
+async def test_scheduler_priority():
+    scheduler = Scheduler(1)
+    started: List[str] = []
+
+    async def run(name: str, priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            started.append(name)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire(Priority.BULK)
+    tasks = [
+        asyncio.ensure_future(run(name, priority))
+        for name, priority in (
+            ("background", Priority.BACKGROUND),
+            ("bulk-1", Priority.BULK),
+            ("interactive", Priority.INTERACTIVE),
+            ("bulk-2", Priority.BULK),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.waiting(Priority.BULK) == 2
+
+    scheduler.release(Priority.BULK)
+    await asyncio.gather(*tasks)
+    assert started == ["interactive", "bulk-1", "bulk-2", "background"]
+    assert scheduler.running == 0
+    assert scheduler.waited[Priority.INTERACTIVE] == 1
+
+
+async def test_scheduler_class_limit():
+    scheduler = Scheduler(3, limits={Priority.BULK: 1})
+    await scheduler.acquire(Priority.BULK)
+
+    bulk = asyncio.ensure_future(scheduler.acquire(Priority.BULK))
+    await asyncio.sleep(0)
+    assert not bulk.done()
+
+    # Free slots are kept for other classes
+    await scheduler.acquire(Priority.BACKGROUND)
+    await scheduler.acquire(Priority.INTERACTIVE)
+    assert scheduler.running == 3
+
+    scheduler.release(Priority.BULK)
+    await bulk
+    assert scheduler.running == 3
+
+
+async def test_scheduler_cancel():
+    scheduler = Scheduler(1)
+    await scheduler.acquire(Priority.INTERACTIVE)
+
+    waiter = asyncio.ensure_future(scheduler.acquire(Priority.BULK))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.waiting(Priority.BULK) == 0
+
+    scheduler.release(Priority.INTERACTIVE)
+    assert scheduler.running == 0
+    async with scheduled(scheduler, Priority.BULK):
+        assert scheduler.running == 1
+    async with scheduled(None, Priority.BULK):
+        pass
+
+
+async def test_scheduler_client(
+    make_s3_client, requests: List[Request], s3_bucket_name,
+):
+    scheduler = Scheduler(1)
+    s3_client = make_s3_client(scheduler=scheduler)
+    prefix = f"{s3_bucket_name}/scheduler/{uuid4().hex}"
+    await s3_client.put(f"{prefix}/small", b"small")
+
+    upload = asyncio.ensure_future(
+        s3_client.put_multipart(
+            f"{prefix}/large",
+            (bytes([i]) * 5 * 1024 * 1024 for i in range(6)),
+            workers_count=4,
+        ),
+    )
+    while scheduler.waiting(Priority.BULK) < 2:
+        await asyncio.sleep(0.01)
+
+    resp = await s3_client.get(f"{prefix}/small")
+    assert resp.content == b"small"
+    parts_sent = sum("partNumber" in r.url.params for r in requests)
+    await upload
+
+    assert parts_sent < 6
+    assert sum("partNumber" in r.url.params for r in requests) == 6
+    assert scheduler.sent[Priority.BULK] == 6
+    assert scheduler.running == 0
+
+
+async def test_scheduler_download_prefix(
+    s3_client: S3Client, make_s3_client, s3_bucket_name, tmp_path,
+):
+    prefix = f"scheduler/{uuid4().hex}/"
+    for name in ("a", "b/c"):
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{name}", b"data")
+
+    scheduler = Scheduler(2)
+    result = await make_s3_client(scheduler=scheduler).download_prefix(
+        prefix, tmp_path,
+        bucket=s3_bucket_name, priority=Priority.BACKGROUND,
+    )
+
+    assert result.downloaded == [f"{prefix}a", f"{prefix}b/c"]
+    # The listing and GET requests of both objects
+    assert scheduler.sent == {
+        Priority.INTERACTIVE: 0,
+        Priority.BULK: 0,
+        Priority.BACKGROUND: 3,
+    }
+    assert scheduler.running == 0
+
+
+async def test_scheduler_iter_objects_v2(
+    s3_client: S3Client, make_s3_client, s3_bucket_name,
+):
+    prefix = f"scheduler/{uuid4().hex}/"
+    for name in ("a", "b", "c"):
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{name}", b"data")
+
+    scheduler = Scheduler(1)
+    scheduled_client = make_s3_client(scheduler=scheduler)
+
+    async def head_listed() -> List[int]:
+        statuses = []
+        async for meta in scheduled_client.iter_objects_v2(
+            bucket=s3_bucket_name, prefix=prefix, max_keys=2,
+            priority=Priority.BACKGROUND,
+        ):
+            # The listing doesn't hold the only slot meanwhile
+            resp = await scheduled_client.head(f"{s3_bucket_name}/{meta.key}")
+            statuses.append(resp.status_code)
+        return statuses
+
+    assert await asyncio.wait_for(head_listed(), timeout=10) == [200] * 3
+    assert scheduler.sent[Priority.BACKGROUND] == 2
+    assert scheduler.sent[Priority.INTERACTIVE] == 3
+    assert scheduler.running == 0
+
+
+async def test_scheduler_bulk_operations(
+    s3_client: S3Client, make_s3_client, s3_bucket_name, tmp_path,
+):
+    prefix = f"scheduler/{uuid4().hex}/"
+    for name in ("a/1", "b/2"):
+        await s3_client.put(f"{s3_bucket_name}/{prefix}{name}", b"data")
+
+    scheduler = Scheduler(2)
+    scheduled_client = make_s3_client(scheduler=scheduler)
+    keys = [
+        meta.key
+        async for objects in scheduled_client.list_objects_parallel(
+            bucket=s3_bucket_name, prefix=prefix, workers_count=2,
+        )
+        for meta in objects
+    ]
+    assert sorted(keys) == [f"{prefix}a/1", f"{prefix}b/2"]
+    # The listing of the prefix and both shards
+    assert scheduler.sent[Priority.BULK] == 3
+
+    await scheduled_client.get_file_parallel(
+        f"{s3_bucket_name}/{prefix}a/1", tmp_path / "file",
+        priority=Priority.BACKGROUND,
+    )
+    # HEAD and the range request
+    assert scheduler.sent[Priority.BACKGROUND] == 2
+
+    with Inventory(tmp_path / "inventory.db", s3_bucket_name) as inventory:
+        await inventory.refresh(
+            scheduled_client, prefix, priority=Priority.BACKGROUND,
+        )
+    assert scheduler.sent[Priority.BACKGROUND] == 3
+    assert scheduler.sent[Priority.INTERACTIVE] == 0
+    assert scheduler.running == 0
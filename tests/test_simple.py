@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from httpx_s3_client import S3Client
+from httpx_s3_client.signer import STREAMING_PAYLOAD
 
 
 @pytest.mark.parametrize("object_name", ("{bucket}/test", "/{bucket}/test"))
@@ -116,3 +117,46 @@ async def test_put_compression(s3_client: S3Client, s3_read, object_name, s3_buc
     # assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
     # FIXME: uncomment after update fakes3 image
     assert data == result.content
+
+
+async def test_put_streaming_signature(s3_client: S3Client, s3_read, s3_bucket_name):
+    data = b"hello, world" * 20000
+    object_name = f"{s3_bucket_name}/test"
+
+    resp = await s3_client.put(
+        object_name, data, content_sha256=STREAMING_PAYLOAD,
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert (await s3_read(object_name)).content == data
+
+    async def async_iterable():
+        for i in range(0, len(data), 1000):
+            yield data[i:i + 1000]
+
+    resp = await s3_client.put(
+        object_name, async_iterable(),
+        headers={"x-amz-decoded-content-length": str(len(data))},
+        content_sha256=STREAMING_PAYLOAD,
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert (await s3_read(object_name)).content == data
+
+    with pytest.raises(ValueError):
+        await s3_client.put(
+            object_name, async_iterable(), content_sha256=STREAMING_PAYLOAD,
+        )
+
+
+async def test_put_file_streaming_signature(
+    s3_client: S3Client, s3_read, tmp_path, s3_bucket_name,
+):
+    data = b"hello, world" * 20000
+    object_name = f"{s3_bucket_name}/test"
+    (tmp_path / "hello.txt").write_bytes(data)
+
+    resp = await s3_client.put_file(
+        object_name, tmp_path / "hello.txt",
+        content_sha256=STREAMING_PAYLOAD, chunk_size=10000,
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert (await s3_read(object_name)).content == data
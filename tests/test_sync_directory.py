@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from httpx_s3_client import S3Client
+from httpx_s3_client.client import PART_SIZE
+from httpx_s3_client.etag import etag_matches, file_etag
+
+
+@pytest.fixture
+def sync_prefix() -> str:
+    return f"sync/{uuid4().hex}"
+
+
+@pytest.fixture
+def local_dir(tmp_path) -> Path:
+    local_dir = tmp_path / "local"
+    (local_dir / "sub" / "nested").mkdir(parents=True)
+    (local_dir / "a.txt").write_bytes(b"a" * 10)
+    (local_dir / "empty").write_bytes(b"")
+    (local_dir / "sub" / "b.txt").write_bytes(b"b" * 100)
+    (local_dir / "sub" / "nested" / "large.bin").write_bytes(
+        os.urandom(PART_SIZE * 2 + 100),
+    )
+    return local_dir
+
+
+async def list_keys(s3_client: S3Client, bucket: str, prefix: str) -> List[str]:
+    return [
+        meta.key
+        async for meta in s3_client.iter_objects_v2(
+            bucket=bucket, prefix=prefix,
+        )
+    ]
+
+
+@pytest.mark.parametrize("size,part_size,parts", [
+    (0, None, None),
+    (100, None, None),
+    (100, 100, 1),
+    (250, 100, 3),
+])
+def test_file_etag(tmp_path, size, part_size, parts):
+    path = tmp_path / "file"
+    path.write_bytes(b"x" * size)
+    etag = file_etag(path, part_size)
+    assert etag.startswith('"') and etag.endswith('"')
+    if parts is None:
+        assert "-" not in etag
+    else:
+        assert etag.endswith(f'-{parts}"')
+    assert etag_matches(path, etag, part_size or 1)
+    assert etag_matches(path, etag.strip('"'), part_size or 1)
+
+
+async def test_sync_directory(
+    s3_client: S3Client, s3_bucket_name, local_dir: Path, sync_prefix,
+):
+    expected = sorted(
+        f"{sync_prefix}/{path}"
+        for path in ("a.txt", "empty", "sub/b.txt", "sub/nested/large.bin")
+    )
+    result = await s3_client.sync_directory(
+        local_dir, sync_prefix, bucket=s3_bucket_name, workers_count=4,
+    )
+    assert result.uploaded == expected
+    assert result.unchanged == []
+    assert await list_keys(s3_client, s3_bucket_name, sync_prefix) == expected
+
+    # ETags of the uploaded objects match local files
+    for meta in await s3_client.list_objects_v2(
+        bucket=s3_bucket_name, prefix=sync_prefix,
+    ).__anext__():
+        path = local_dir / meta.key[len(sync_prefix) + 1:]
+        assert etag_matches(path, meta.etag, PART_SIZE)
+
+    result = await s3_client.sync_directory(
+        local_dir, sync_prefix, bucket=s3_bucket_name,
+    )
+    assert result.uploaded == []
+    assert result.unchanged == expected
+
+    (local_dir / "a.txt").write_bytes(b"A" * 10)
+    (local_dir / "sub" / "c.txt").write_bytes(b"c")
+    result = await s3_client.sync_directory(
+        local_dir, f"{sync_prefix}/", bucket=s3_bucket_name,
+    )
+    assert result.uploaded == [
+        f"{sync_prefix}/a.txt", f"{sync_prefix}/sub/c.txt",
+    ]
+    assert len(result.unchanged) == len(expected) - 1
+    resp = await s3_client.get(f"{s3_bucket_name}/{sync_prefix}/a.txt")
+    assert resp.content == b"A" * 10
+
+
+async def test_sync_empty_directory(
+    s3_client: S3Client, s3_bucket_name, tmp_path, sync_prefix,
+):
+    result = await s3_client.sync_directory(
+        tmp_path, sync_prefix, bucket=s3_bucket_name,
+    )
+    assert result.uploaded == result.unchanged == []
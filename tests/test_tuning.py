@@ -0,0 +1,106 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from httpx_s3_client.tuning import AutoTuner, iter_ranges, slot
+
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def clock():
+    now = [0.0]
+    with mock.patch("httpx_s3_client.tuning.monotonic", lambda: now[0]):
+        yield now
+
+
+def round_of(tuner: AutoTuner, clock, throughput: float, latency: float):
+    """ Records a round of requests with the given throughput """
+    count = tuner.workers_count
+    size = tuner.chunk_size or MB
+    clock[0] += count * size / throughput
+    for _ in range(count):
+        tuner.record(size, latency)
+
+
+def test_tuner_additive_increase(clock):
+    tuner = AutoTuner(max_workers_count=4, target_latency=1.0)
+    tuner.start(1, 5 * MB)
+
+    throughput = 10 * MB
+    for _ in range(5):
+        round_of(tuner, clock, throughput, latency=0.5)
+        throughput *= 2
+
+    assert tuner.workers_count == 4
+    assert tuner.chunk_size == 30 * MB
+
+
+def test_tuner_multiplicative_decrease(clock):
+    tuner = AutoTuner(target_latency=1.0)
+    tuner.start(8, 8 * MB, min_chunk_size=MB)
+
+    round_of(tuner, clock, 100 * MB, latency=1.5)
+    assert tuner.workers_count == 9
+    assert tuner.chunk_size == 8 * MB
+
+    # Throughput dropped, requests are too slow
+    round_of(tuner, clock, 50 * MB, latency=3)
+    assert tuner.workers_count == 4
+    assert tuner.chunk_size == 4 * MB
+
+    # Throughput is the same
+    round_of(tuner, clock, 52 * MB, latency=3)
+    assert tuner.workers_count == 4
+    assert tuner.chunk_size == 2 * MB
+
+    for _ in range(3):
+        round_of(tuner, clock, 52 * MB, latency=3)
+    assert tuner.chunk_size == MB
+
+    report = tuner.report()
+    assert report.workers_count == 4
+    assert report.chunk_size == MB
+    assert report.requests == 8 + 9 + 4 * 4
+
+
+def test_tuner_fixed_chunk_size(clock):
+    tuner = AutoTuner()
+    tuner.start(2)
+    round_of(tuner, clock, 10 * MB, latency=0.1)
+    assert tuner.workers_count == 3
+    assert tuner.chunk_size is None
+
+
+async def test_tuner_slot():
+    tuner = AutoTuner()
+    tuner.start(2)
+    running = 0
+    max_running = 0
+
+    async def request():
+        nonlocal running, max_running
+        async with slot(tuner):
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[request() for _ in range(10)])
+    assert max_running == 2
+
+    # The limit is changed on the fly
+    tuner.workers_count = 5
+    await asyncio.gather(*[request() for _ in range(10)])
+    assert max_running == 5
+
+
+def test_iter_ranges():
+    tuner = AutoTuner()
+    tuner.start(1, 10)
+    ranges = iter_ranges(35, tuner)
+    assert next(ranges) == (0, 10)
+    tuner.chunk_size = 20
+    assert list(ranges) == [(10, 30), (30, 35)]
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from httpx_s3_client._xml import (
+    AwsObjectMeta, ListObjectsParser, parse_delete_objects,
+    parse_list_objects,
+)
+from httpx_s3_client.columns import ListObjectsColumnsParser, ObjectColumns
+
+
+def list_objects_payload(count: int, prefixes: int = 0) -> bytes:
+    started = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    contents = "".join(
+        "<Contents>"
+        f"<Key>prefix/key{i:08d}</Key>"
+        f"<LastModified>{(started + timedelta(seconds=i)).isoformat()[:19]}.000Z</LastModified>"
+        f"<ETag>&quot;{i:032x}&quot;</ETag>"
+        f"<Size>{i * 10}</Size>"
+        "<StorageClass>STANDARD</StorageClass>"
+        "</Contents>"
+        for i in range(count)
+    )
+    common_prefixes = "".join(
+        f"<CommonPrefixes><Prefix>prefix/sub{i}/</Prefix></CommonPrefixes>"
+        for i in range(prefixes)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        "<Name>bucket</Name><Prefix>prefix/</Prefix>"
+        f"<KeyCount>{count}</KeyCount><MaxKeys>1000</MaxKeys>"
+        "<IsTruncated>true</IsTruncated>"
+        f"{contents}{common_prefixes}"
+        "<NextContinuationToken>token</NextContinuationToken>"
+        "</ListBucketResult>"
+    ).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 65536])
+def test_list_objects_parser(chunk_size):
+    payload = list_objects_payload(100, prefixes=3)
+    expected, continuation_token = parse_list_objects(payload)
+    assert len(expected) == 100
+    assert continuation_token == "token"
+
+    parser = ListObjectsParser()
+    objects: List[AwsObjectMeta] = []
+    common_prefixes: List[str] = []
+    fragments = 0
+    for offset in range(0, len(payload), chunk_size):
+        fragment = parser.feed(payload[offset:offset + chunk_size])
+        if fragment.objects:
+            fragments += 1
+        objects.extend(fragment.objects)
+        common_prefixes.extend(fragment.common_prefixes)
+    fragment = parser.close()
+    objects.extend(fragment.objects)
+
+    assert objects == expected
+    assert common_prefixes == [f"prefix/sub{i}/" for i in range(3)]
+    assert parser.continuation_token == "token"
+    if chunk_size < len(payload):
+        # Objects are parsed while the body is fed
+        assert fragments > 1
+
+
+def test_list_objects_columns_parser():
+    payload = list_objects_payload(1000, prefixes=3)
+    expected, _ = parse_list_objects(payload)
+
+    parser = ListObjectsColumnsParser()
+    columns = ObjectColumns()
+    for offset in range(0, len(payload), 4096):
+        page = parser.feed(payload[offset:offset + 4096])
+        assert isinstance(page.objects, ObjectColumns)
+        columns.extend(page.objects)
+    columns.extend(parser.close().objects)
+
+    assert list(columns) == expected
+    assert parser.continuation_token == "token"
+    # Columns are much smaller than the payload
+    assert columns.nbytes < len(payload) // 2
+
+
+def test_parse_delete_objects():
+    deleted, errors = parse_delete_objects(
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<DeleteResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        b"<Deleted><Key>a</Key></Deleted>"
+        b"<Error><Key>b</Key><Code>AccessDenied</Code>"
+        b"<Message>Access Denied</Message></Error>"
+        b"</DeleteResult>",
+    )
+    assert deleted == ["a"]
+    assert [tuple(error) for error in errors] == [
+        ("b", "AccessDenied", "Access Denied"),
+    ]